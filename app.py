@@ -1,13 +1,15 @@
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory, stream_with_context
 from flask_cors import CORS
 import io
 import base64
+import binascii
 import os
 import sqlite3
 import html
 import zipfile
 import smtplib
 import re
+import unicodedata
 import urllib.parse
 import urllib.request
 from email.message import EmailMessage
@@ -18,8 +20,13 @@ from flask import session, redirect, url_for, render_template_string
 from werkzeug.security import generate_password_hash, check_password_hash
 import secrets
 
-from database import Database
-from pdf_generator import PDFGenerator
+from database import Database, get_blob, image_mimetype, photo_sha256, put_blob, release_blob
+import db_pool
+from pdf_generator import PDFGenerator, line_break_cache, render_cache, section_cache
+import render_pool
+import export_jobs
+import warmup
+from render_metrics import RenderTimer, render_timings
 from word_generator import WordGenerator
 from config import AppConfig
 import utils
@@ -110,7 +117,7 @@ def _utc_now_iso() -> str:
     return _utc_now().isoformat()
 
 app = Flask(__name__, template_folder="template", static_folder="template")
-CORS(app)  # Allow front-end requests
+CORS(app, expose_headers=["ETag", "X-PDF-Size", "X-Batch-Count", "X-Next-Cursor", "Link"])  # Allow front-end requests
 app.secret_key = os.getenv("SECRET_KEY", "change-this-secret-in-production")
 app.permanent_session_lifetime = timedelta(minutes=int(os.getenv("SESSION_TIMEOUT_MINUTES", "45")))
 
@@ -123,9 +130,8 @@ GOOGLE_TEMPLATES_DEFAULT_QUERY = (os.getenv("GOOGLE_TEMPLATES_DEFAULT_QUERY") or
 
 
 def _auth_conn():
-    conn = sqlite3.connect(AppConfig.DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    # Pooled: leaving the ``with`` block commits and hands the connection back to this thread.
+    return db_pool.connection(AppConfig.DB_PATH)
 
 
 def _init_auth_db():
@@ -226,6 +232,30 @@ def _init_auth_db():
             conn.execute("ALTER TABLE job_tracker ADD COLUMN follow_up_date TEXT")
         if "reminder_enabled" not in cols:
             conn.execute("ALTER TABLE job_tracker ADD COLUMN reminder_enabled INTEGER NOT NULL DEFAULT 0")
+        cols = {r["name"] for r in conn.execute("PRAGMA table_info(user_profiles)").fetchall()}
+        if "profile_pic_hash" not in cols:
+            conn.execute("ALTER TABLE user_profiles ADD COLUMN profile_pic_hash TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_user_profiles_profile_pic_hash ON user_profiles (profile_pic_hash)")
+        # Profile photos used to be stored inline as base64 text; move them to the shared blob table.
+        for row in conn.execute("SELECT id, profile_pic FROM user_profiles WHERE profile_pic <> ''").fetchall():
+            image = _decode_image_text(row["profile_pic"])
+            if image:
+                conn.execute(
+                    "UPDATE user_profiles SET profile_pic='', profile_pic_hash=? WHERE id=?",
+                    (put_blob(conn, image), row["id"]),
+                )
+
+
+def _decode_image_text(value: str) -> bytes | None:
+    """Bytes of a base64 image (plain or data URL), or None when the text is not one."""
+    text = "".join(str(value or "").split(",", 1)[-1].split())
+    if not text:
+        return None
+    try:
+        data = base64.b64decode(text + "=" * (-len(text) % 4), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return data if image_mimetype(data) else None
 
 
 def _current_user_id() -> int:
@@ -558,9 +588,21 @@ def _extract_pdf_options(data: dict) -> dict:
     if margin_preset not in {"narrow", "compact", "normal", "wide", "relaxed"}:
         margin_preset = "normal"
 
+    raw_fit_to_pages = pick("fit_to_pages", "fitToPages")
+    try:
+        fit_to_pages = int(raw_fit_to_pages) if raw_fit_to_pages is not None else None
+    except Exception:
+        fit_to_pages = None
+    if fit_to_pages is not None and fit_to_pages < 1:
+        fit_to_pages = None
+
     raw_section_visibility = pick("section_visibility", "sectionVisibility", default={})
     section_visibility = raw_section_visibility if isinstance(raw_section_visibility, dict) else {}
 
+    output_profile = str(pick("output_profile", "outputProfile", default="standard") or "standard").strip().lower()
+    if output_profile not in {"standard", "compact"}:
+        output_profile = "standard"
+
     return {
         "template_name": template_name,
         "page_size": page_size,
@@ -586,6 +628,9 @@ def _extract_pdf_options(data: dict) -> dict:
         "margin_preset": margin_preset,
         "section_visibility": section_visibility,
         "header_layout": pick("header_layout", "headerLayout"),
+        "draft": _to_bool(pick("draft", "draft_mode", "draftMode", default=False), False),
+        "fit_to_pages": fit_to_pages,
+        "output_profile": output_profile,
     }
 
 
@@ -670,6 +715,7 @@ def _login_required(fn):
 
 
 _init_auth_db()
+export_jobs.init_db()
 
 # ---------- Serve Front-End ----------
 @app.route('/')
@@ -1681,7 +1727,8 @@ def get_user_profile():
     with _auth_conn() as conn:
         row = conn.execute(
             """
-            SELECT display_name, email, phone, city, address, headline, linkedin, github, website, bio, profile_pic, updated
+            SELECT display_name, email, phone, city, address, headline, linkedin, github, website, bio, profile_pic,
+                   profile_pic_hash, updated
             FROM user_profiles
             WHERE user_id=?
             """,
@@ -1700,9 +1747,22 @@ def get_user_profile():
             "website": "",
             "bio": "",
             "profile_pic": "",
+            "profile_pic_url": "",
             "updated": "",
         })
-    return jsonify({k: row[k] or "" for k in row.keys()})
+    profile = {k: row[k] or "" for k in row.keys() if k != "profile_pic_hash"}
+    profile["profile_pic_url"] = ""
+    if row["profile_pic_hash"]:
+        profile["profile_pic_url"] = url_for("get_photo", sha256=row["profile_pic_hash"])
+        profile.pop("profile_pic")
+        # Served from profile_pic_url; ?inline_photo=1 also embeds it as a data URL.
+        if _to_bool(request.args.get("inline_photo"), False):
+            with _auth_conn() as conn:
+                image = get_blob(conn, row["profile_pic_hash"])
+            if image:
+                encoded = base64.b64encode(image["data"]).decode("ascii")
+                profile["profile_pic"] = f"data:{image['mimetype']};base64,{encoded}"
+    return jsonify(profile)
 
 
 @app.route('/api/user-profile', methods=['PUT'])
@@ -1723,33 +1783,46 @@ def save_user_profile():
         "profile_pic": data.get("profile_pic") or "",
     }
     now = datetime.now().isoformat()
+    image = _decode_image_text(payload["profile_pic"])
     with _auth_conn() as conn:
-        exists = conn.execute("SELECT id FROM user_profiles WHERE user_id=?", (user_id,)).fetchone()
+        # Decodable photos go to the blob table; anything else is kept inline as before.
+        pic_hash = put_blob(conn, image) if image else None
+        if image:
+            payload["profile_pic"] = ""
+        exists = conn.execute(
+            "SELECT id, profile_pic, profile_pic_hash FROM user_profiles WHERE user_id=?", (user_id,)
+        ).fetchone()
+        if exists and "profile_pic" not in data:
+            # GET returns profile_pic_url instead of the photo; a client that sends none keeps it.
+            payload["profile_pic"], pic_hash = exists["profile_pic"] or "", exists["profile_pic_hash"]
         if exists:
             conn.execute(
                 """
                 UPDATE user_profiles
                 SET display_name=?, email=?, phone=?, city=?, address=?, headline=?,
-                    linkedin=?, github=?, website=?, bio=?, profile_pic=?, updated=?
+                    linkedin=?, github=?, website=?, bio=?, profile_pic=?, profile_pic_hash=?, updated=?
                 WHERE user_id=?
                 """,
                 (
                     payload["display_name"], payload["email"], payload["phone"], payload["city"],
                     payload["address"], payload["headline"], payload["linkedin"], payload["github"],
-                    payload["website"], payload["bio"], payload["profile_pic"], now, user_id
+                    payload["website"], payload["bio"], payload["profile_pic"], pic_hash, now, user_id
                 ),
             )
+            if exists["profile_pic_hash"] != pic_hash:
+                release_blob(conn, exists["profile_pic_hash"])
         else:
             conn.execute(
                 """
                 INSERT INTO user_profiles
-                (user_id, display_name, email, phone, city, address, headline, linkedin, github, website, bio, profile_pic, created, updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                (user_id, display_name, email, phone, city, address, headline, linkedin, github, website, bio,
+                 profile_pic, profile_pic_hash, created, updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     user_id, payload["display_name"], payload["email"], payload["phone"], payload["city"],
                     payload["address"], payload["headline"], payload["linkedin"], payload["github"],
-                    payload["website"], payload["bio"], payload["profile_pic"], now, now
+                    payload["website"], payload["bio"], payload["profile_pic"], pic_hash, now, now
                 ),
             )
     return jsonify({"message": "User profile saved", "updated": now})
@@ -1779,29 +1852,91 @@ def import_resume_file():
         return jsonify({"error": str(e)}), 500
 
 # ---------- API Endpoints ----------
+def _encode_list_cursor(key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_list_cursor(token: str) -> tuple | None:
+    """(updated, id) keyset position from an opaque cursor, or None if it is malformed."""
+    try:
+        updated, resume_id = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (ValueError, TypeError, binascii.Error):
+        return None
+    if not isinstance(updated, str) or not isinstance(resume_id, int):
+        return None
+    return updated, resume_id
+
+
 @app.route('/api/resumes', methods=['GET'])
 def get_all_resumes():
-    """Return list of saved resumes."""
-    resumes = db.get_all_resumes()
-    return jsonify(resumes)
+    """
+    Return the current user's saved resumes, newest first (``?q=`` filters by title
+    prefix). Without ``?limit``/``?cursor`` the whole list comes back, as before;
+    with ``?limit=N`` it is one keyset page, continued via ``?cursor=`` from the
+    previous page's X-Next-Cursor header (or its Link rel="next"). The body stays
+    a plain list.
+    """
+    limit = None
+    if request.args.get("limit") or request.args.get("cursor"):
+        try:
+            limit = int(request.args.get("limit") or AppConfig.RESUME_LIST_PAGE_SIZE)
+        except ValueError:
+            limit = AppConfig.RESUME_LIST_PAGE_SIZE
+        limit = max(1, min(AppConfig.RESUME_LIST_MAX_PAGE_SIZE, limit))
+    after = None
+    if request.args.get("cursor"):
+        after = _decode_list_cursor(request.args["cursor"])
+        if after is None:
+            return jsonify({"error": "Invalid cursor"}), 400
+    resumes, next_key = db.list_resumes(
+        _current_user_id(), limit, after=after, title_prefix=(request.args.get("q") or "").strip()
+    )
+    response = jsonify(resumes)
+    if next_key is not None:
+        cursor = _encode_list_cursor(next_key)
+        response.headers["X-Next-Cursor"] = cursor
+        next_url = url_for("get_all_resumes", **{**request.args.to_dict(), "cursor": cursor})
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return response
 
 @app.route('/api/resumes/<int:resume_id>', methods=['GET'])
 def get_resume(resume_id):
     """Return a specific resume."""
     resume = db.get_resume(resume_id)
     if resume:
-        return jsonify(utils.resume_to_dict(resume))
+        pic_hash = photo_sha256(resume)
+        # The photo is served (and cached) from profile_pic_url; ?inline_photo=1 also embeds it as base64.
+        inline_photo = _to_bool(request.args.get("inline_photo"), False) or not pic_hash
+        data = utils.resume_to_dict(resume, include_photo=inline_photo)
+        data["profile_pic_url"] = url_for("get_photo", sha256=pic_hash) if pic_hash else None
+        return jsonify(data)
     return jsonify({"error": "Not found"}), 404
 
+@app.route('/api/photos/<sha256>', methods=['GET'])
+def get_photo(sha256):
+    """Serve a stored image by content hash; a new image gets a new URL, so responses never go stale."""
+    if not re.fullmatch(r"[0-9a-f]{64}", sha256):
+        return jsonify({"error": "Not found"}), 404
+    if request.if_none_match.contains(sha256):
+        response = Response(status=304)
+    else:
+        photo = db.get_photo(sha256)
+        if photo is None:
+            return jsonify({"error": "Not found"}), 404
+        response = Response(photo[0], mimetype=photo[1])
+    response.set_etag(sha256)
+    response.headers["Cache-Control"] = "private, max-age=31536000, immutable"
+    return response
+
 @app.route('/api/resumes', methods=['POST'])
 def save_resume():
-    """Save a new resume or update existing."""
+    """Save a new resume or update existing. Omitting ``profile_pic`` keeps the stored photo."""
     data = request.json or {}
     resume = utils.dict_to_resume(data)
     resume.updated = datetime.now()
     if not resume.title:
         resume.title = (resume.full_name or "Untitled").strip()
-    resume_id = db.save_resume(resume)
+    resume_id = db.save_resume(resume, owner_id=_current_user_id(), keep_photo="profile_pic" not in data)
     _record_score_history(resume, "save")
     return jsonify({"id": resume_id, "message": "Saved successfully", "title": resume.title})
 
@@ -1811,61 +1946,83 @@ def delete_resume(resume_id):
     db.delete_resume(resume_id)
     return jsonify({"message": "Deleted"})
 
+def _zip_stream_response(entries, download_name: str) -> Response:
+    """Stream a ZIP attachment entry by entry instead of building it in memory."""
+    response = Response(stream_with_context(utils.iter_zip_stream(entries)), mimetype="application/zip")
+    try:
+        download_name.encode("ascii")
+        names = {"filename": download_name}
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize("NFKD", download_name).encode("ascii", "ignore").decode("ascii")
+        names = {"filename": simple, "filename*": f"UTF-8''{urllib.parse.quote(download_name, safe='!#$&+^`|~')}"}
+    response.headers.set("Content-Disposition", "attachment", **names)
+    return response
+
+
+def _finish_render_timing(response: Response, timer: RenderTimer, histogram_label: str) -> Response:
+    """Expose the request's stage timings as Server-Timing and fold them into the histograms."""
+    response.headers["Server-Timing"] = timer.server_timing()
+    render_timings.observe(histogram_label, timer.stages, total_ms=timer.total_ms())
+    return response
+
+
+def _pdf_not_modified(etag: str) -> Response | None:
+    """304 response when the client's If-None-Match already names this PDF."""
+    strong = AppConfig.DETERMINISTIC_PDF
+    matched = request.if_none_match.contains(etag) if strong else request.if_none_match.contains_weak(etag)
+    if not matched:
+        return None
+    response = Response(status=304)
+    return _tag_pdf_response(response, etag)
+
+
+def _tag_pdf_response(response: Response, etag: str, size: int | None = None) -> Response:
+    # The ETag is the render-input hash; it is only strong when output is byte-deterministic.
+    response.set_etag(etag, weak=not AppConfig.DETERMINISTIC_PDF)
+    response.headers["Cache-Control"] = "private, no-cache"
+    if size is not None:
+        # Lets clients check portal upload limits without buffering the body first.
+        response.headers["X-PDF-Size"] = str(size)
+    return response
+
+
 @app.route('/api/export-pdf', methods=['POST'])
 def export_pdf():
     """Generate PDF and return as downloadable file."""
     try:
-        data = request.json or {}
-        resume = utils.dict_to_resume(data)
-        pdf_opts = _extract_pdf_options(data)
+        timer = RenderTimer()
+        with timer.stage("decode"):
+            data = request.json or {}
+            resume = utils.dict_to_resume(data)
+        with timer.stage("options"):
+            pdf_opts = _extract_pdf_options(data)
+        # Downloads always render at full fidelity.
+        pdf_opts["draft"] = False
         template_name = pdf_opts["template_name"]
         page_size = pdf_opts["page_size"]
-        layout_override = pdf_opts["layout_override"]
-        heading_align_override = pdf_opts["heading_align_override"]
-        body_align_override = pdf_opts["body_align_override"]
-        accent_color_override = pdf_opts["accent_color_override"]
-        font_override = pdf_opts["font_override"]
-        compact_mode = pdf_opts["compact_mode"]
-        ats_safe_mode = pdf_opts["ats_safe_mode"]
-        section_order = pdf_opts["section_order"]
-        font_scale = pdf_opts["font_scale"]
-        margin_preset = pdf_opts["margin_preset"]
-        section_visibility = pdf_opts["section_visibility"]
-        header_layout = pdf_opts["header_layout"]
-
-        # Generate PDF in memory
-        pdf_buffer = io.BytesIO()
-        PDFGenerator.generate(
-            resume,
-            pdf_buffer,
-            template_name=template_name,
-            page_size=page_size,
-            layout_override=layout_override,
-            heading_align_override=heading_align_override,
-            body_align_override=body_align_override,
-            accent_color_override=accent_color_override,
-            font_override=font_override,
-            compact_mode=compact_mode,
-            ats_safe_mode=ats_safe_mode,
-            section_order=section_order,
-            font_scale=font_scale,
-            margin_preset=margin_preset,
-            section_visibility=section_visibility,
-            header_layout=header_layout,
-        )
-        pdf_buffer.seek(0)
-        _log_audit(
-            action="export_pdf",
-            details=f"name={resume.full_name or 'resume'}; template={template_name}; page={page_size}"
-        )
+        etag = PDFGenerator.render_key(resume, **pdf_opts)
+        audit_details = f"name={resume.full_name or 'resume'}; template={template_name}; page={page_size}"
+        not_modified = _pdf_not_modified(etag)
+        if not_modified is not None:
+            # Still an export for the audit trail; the score is not recorded again since the
+            # content is identical to the copy the client already downloaded.
+            _log_audit(action="export_pdf", details=f"{audit_details}; not_modified=1")
+            return not_modified
+
+        # Generate PDF in memory (repeat renders are served from the render cache)
+        with timer.stage("render"):
+            pdf_bytes = PDFGenerator.render_cached(resume, timer=timer, **pdf_opts)
+        _log_audit(action="export_pdf", details=audit_details)
         _record_score_history(resume, "export_pdf")
 
-        return send_file(
-            pdf_buffer,
+        response = send_file(
+            io.BytesIO(pdf_bytes),
             mimetype='application/pdf',
             as_attachment=True,
             download_name=f"{resume.full_name or 'resume'}_resume.pdf"
         )
+        _tag_pdf_response(response, etag, size=len(pdf_bytes))
+        return _finish_render_timing(response, timer, PDFGenerator._resolve_template_name(template_name))
     except Exception as e:
         app.logger.error(f"PDF generation failed: {e}")
         return f"PDF generation failed: {str(e)}", 500
@@ -1875,142 +2032,286 @@ def export_pdf():
 def preview_pdf():
     """Generate PDF and return inline for live browser preview."""
     try:
-        data = request.json or {}
-        resume = utils.dict_to_resume(data)
-        pdf_opts = _extract_pdf_options(data)
-        template_name = pdf_opts["template_name"]
-        page_size = pdf_opts["page_size"]
-        layout_override = pdf_opts["layout_override"]
-        heading_align_override = pdf_opts["heading_align_override"]
-        body_align_override = pdf_opts["body_align_override"]
-        accent_color_override = pdf_opts["accent_color_override"]
-        font_override = pdf_opts["font_override"]
-        compact_mode = pdf_opts["compact_mode"]
-        ats_safe_mode = pdf_opts["ats_safe_mode"]
-        section_order = pdf_opts["section_order"]
-        font_scale = pdf_opts["font_scale"]
-        margin_preset = pdf_opts["margin_preset"]
-        section_visibility = pdf_opts["section_visibility"]
-        header_layout = pdf_opts["header_layout"]
-
-        pdf_buffer = io.BytesIO()
-        PDFGenerator.generate(
-            resume,
-            pdf_buffer,
-            template_name=template_name,
-            page_size=page_size,
-            layout_override=layout_override,
-            heading_align_override=heading_align_override,
-            body_align_override=body_align_override,
-            accent_color_override=accent_color_override,
-            font_override=font_override,
-            compact_mode=compact_mode,
-            ats_safe_mode=ats_safe_mode,
-            section_order=section_order,
-            font_scale=font_scale,
-            margin_preset=margin_preset,
-            section_visibility=section_visibility,
-            header_layout=header_layout,
-        )
-        pdf_buffer.seek(0)
-        return send_file(
-            pdf_buffer,
+        timer = RenderTimer()
+        with timer.stage("decode"):
+            data = request.json or {}
+            resume = utils.dict_to_resume(data)
+        with timer.stage("options"):
+            pdf_opts = _extract_pdf_options(data)
+        # Incremental mode (default): unchanged sections reuse this user's previously built flowables.
+        incremental = _to_bool(data.get("incremental_preview", data.get("incrementalPreview")), True)
+        preview_sections = section_cache.scope(_current_user_id()) if incremental else None
+        etag = PDFGenerator.render_key(resume, **pdf_opts)
+        not_modified = _pdf_not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+
+        with timer.stage("render"):
+            pdf_bytes = PDFGenerator.render_cached(resume, section_cache=preview_sections, timer=timer, **pdf_opts)
+        response = send_file(
+            io.BytesIO(pdf_bytes),
             mimetype='application/pdf',
             as_attachment=False,
             download_name=f"{resume.full_name or 'resume'}_preview.pdf"
         )
+        _tag_pdf_response(response, etag, size=len(pdf_bytes))
+        # Draft previews get their own series so they do not skew full-fidelity numbers.
+        label = PDFGenerator._resolve_template_name(pdf_opts["template_name"])
+        if pdf_opts.get("draft"):
+            label += ":draft"
+        return _finish_render_timing(response, timer, label)
     except Exception as e:
         app.logger.error(f"PDF preview generation failed: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/layout-dry-run', methods=['POST'])
+def layout_dry_run():
+    """Lay the resume out without producing a PDF: page count, free space and page-break sections."""
+    try:
+        timer = RenderTimer()
+        with timer.stage("decode"):
+            data = request.json or {}
+            resume = utils.dict_to_resume(data)
+        with timer.stage("options"):
+            pdf_opts = _extract_pdf_options(data)
+        # Measure what the download would look like (draft drops the photo and changes layout).
+        pdf_opts["draft"] = False
+        with timer.stage("render"):
+            layout = PDFGenerator.measure_layout(resume, timer=timer, **pdf_opts)
+        layout["template_name"] = PDFGenerator._resolve_template_name(pdf_opts["template_name"])
+        return _finish_render_timing(jsonify(layout), timer, f"{layout['template_name']}:layout")
+    except Exception as e:
+        app.logger.error(f"Layout dry run failed: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+def _select_bulk_templates(data: dict, pdf_opts: dict) -> list:
+    templates = (
+        data.get("template_names")
+        or data.get("templateNames")
+        or data.get("templates")
+        or []
+    )
+    if isinstance(templates, str):
+        templates = [x.strip() for x in templates.split(",") if x.strip()]
+    if not isinstance(templates, list):
+        templates = []
+    templates = [str(t).strip() for t in templates if str(t).strip()]
+    if not templates:
+        templates = [pdf_opts["template_name"] or AppConfig.DEFAULT_TEMPLATE]
+    # Keep only known templates and avoid huge ZIP requests.
+    known = set(AppConfig.TEMPLATES.keys())
+    selected = []
+    for t in templates:
+        resolved = PDFGenerator._resolve_template_name(t)
+        if resolved in known and resolved not in selected:
+            selected.append(resolved)
+    return selected[:12]
+
+
+def _bulk_pdf_entries(resume, pdf_opts: dict, selected: list, base: str):
+    """ZIP entries for one resume rendered in each selected template."""
+    option_sets = [{**pdf_opts, "template_name": tpl, "draft": False} for tpl in selected]
+    # Templates render in parallel across the render pool; entries stream in template order.
+    failed = []
+    for tpl, (pdf_bytes, error) in zip(selected, render_pool.iter_render(resume, option_sets)):
+        if error is not None:
+            # The response is already streaming: record the failure in the archive instead of raising.
+            message = "timed out" if isinstance(error, TimeoutError) else f"failed: {error}"
+            app.logger.warning("Bulk render of template %s %s", tpl, message)
+            failed.append(f"{tpl}: {message}")
+            continue
+        # PDFs are already compressed; store them as-is.
+        yield f"{base}_{tpl}.pdf", pdf_bytes, zipfile.ZIP_STORED
+    if failed:
+        note = "These templates could not be rendered and were not included:\n" + "\n".join(failed)
+        yield f"{base}_errors.txt", note, zipfile.ZIP_DEFLATED
+
+
 @app.route('/api/export-bulk-pdf', methods=['POST'])
 def export_bulk_pdf():
     """Export the same resume in multiple templates as a ZIP package."""
     try:
-        data = request.json or {}
-        resume = utils.dict_to_resume(data)
-        pdf_opts = _extract_pdf_options(data)
-        templates = (
-            data.get("template_names")
-            or data.get("templateNames")
-            or data.get("templates")
-            or []
-        )
-        if isinstance(templates, str):
-            templates = [x.strip() for x in templates.split(",") if x.strip()]
-        if not isinstance(templates, list):
-            templates = []
-        templates = [str(t).strip() for t in templates if str(t).strip()]
-        if not templates:
-            templates = [pdf_opts["template_name"] or AppConfig.DEFAULT_TEMPLATE]
-        # Keep only known templates and avoid huge ZIP requests.
-        known = set(AppConfig.TEMPLATES.keys())
-        selected = []
-        for t in templates:
-            resolved = PDFGenerator._resolve_template_name(t)
-            if resolved in known and resolved not in selected:
-                selected.append(resolved)
-        selected = selected[:12]
+        timer = RenderTimer()
+        with timer.stage("decode"):
+            data = request.json or {}
+            resume = utils.dict_to_resume(data)
+        with timer.stage("options"):
+            pdf_opts = _extract_pdf_options(data)
+        selected = _select_bulk_templates(data, pdf_opts)
         if not selected:
             return jsonify({"error": "No valid templates selected"}), 400
 
-        page_size = pdf_opts["page_size"]
-        layout_override = pdf_opts["layout_override"]
-        heading_align_override = pdf_opts["heading_align_override"]
-        body_align_override = pdf_opts["body_align_override"]
-        accent_color_override = pdf_opts["accent_color_override"]
-        font_override = pdf_opts["font_override"]
-        compact_mode = pdf_opts["compact_mode"]
-        ats_safe_mode = pdf_opts["ats_safe_mode"]
-        section_order = pdf_opts["section_order"]
-        font_scale = pdf_opts["font_scale"]
-        margin_preset = pdf_opts["margin_preset"]
-        section_visibility = pdf_opts["section_visibility"]
-        header_layout = pdf_opts["header_layout"]
-
-        zip_buffer = io.BytesIO()
         base = (resume.full_name or "resume").strip().replace(" ", "_")
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            for tpl in selected:
-                pdf_buffer = io.BytesIO()
-                PDFGenerator.generate(
-                    resume,
-                    pdf_buffer,
-                    template_name=tpl,
-                    page_size=page_size,
-                    layout_override=layout_override,
-                    heading_align_override=heading_align_override,
-                    body_align_override=body_align_override,
-                    accent_color_override=accent_color_override,
-                    font_override=font_override,
-                    compact_mode=compact_mode,
-                    ats_safe_mode=ats_safe_mode,
-                    section_order=section_order,
-                    font_scale=font_scale,
-                    margin_preset=margin_preset,
-                    section_visibility=section_visibility,
-                    header_layout=header_layout,
-                )
-                pdf_buffer.seek(0)
-                zf.writestr(f"{base}_{tpl}.pdf", pdf_buffer.read())
-
-        zip_buffer.seek(0)
         _log_audit(
             action="export_bulk_pdf",
             details=f"name={resume.full_name or 'resume'}; templates={','.join(selected)}"
         )
-        return send_file(
-            zip_buffer,
-            mimetype='application/zip',
+        response = _zip_stream_response(_bulk_pdf_entries(resume, pdf_opts, selected, base), f"{base}_bulk_templates.zip")
+        # Headers go out before the templates render; per-template timings land in the histograms.
+        response.headers["Server-Timing"] = timer.server_timing()
+        return response
+    except Exception as e:
+        app.logger.error(f"Bulk PDF export failed: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+def _batch_resume_ids(data: dict) -> list:
+    raw = data.get("resume_ids") or data.get("resumeIds") or []
+    if isinstance(raw, str):
+        raw = raw.split(",")
+    if not isinstance(raw, list):
+        raise ValueError("resume_ids must be a list of resume IDs")
+    ids = []
+    for value in raw:
+        try:
+            ids.append(int(str(value).strip()))
+        except ValueError:
+            raise ValueError(f"Invalid resume ID: {value!r}")
+    ids = list(dict.fromkeys(ids))
+    if not ids:
+        raise ValueError("No resume IDs given")
+    if len(ids) > AppConfig.BATCH_RENDER_MAX_RESUMES:
+        raise ValueError(f"At most {AppConfig.BATCH_RENDER_MAX_RESUMES} resumes per batch")
+    return ids
+
+
+def _batch_pdf_entries(resume_ids: list, pdf_opts: dict, owner_id: int, progress=None):
+    """
+    ZIP entries for ``owner_id``'s stored resumes rendered in one template,
+    followed by a manifest with the outcome of every requested ID. Resumes are
+    loaded from the database in chunks and rendered a few at a time, so memory
+    stays bounded however long the batch is. Missing resumes (including other
+    users' resumes) and failed renders are recorded in the manifest and skipped.
+    """
+    template_name = PDFGenerator._resolve_template_name(pdf_opts["template_name"])
+    opts = {**pdf_opts, "template_name": template_name, "draft": False, "fit_to_pages": None}
+    outcomes = {}
+    rendering = []
+
+    def jobs():
+        chunk_size = max(1, AppConfig.BATCH_RENDER_LOAD_CHUNK)
+        for start in range(0, len(resume_ids), chunk_size):
+            chunk = resume_ids[start:start + chunk_size]
+            loaded = db.get_resumes(chunk, owner_id=owner_id)
+            for resume_id in chunk:
+                resume = loaded.pop(resume_id, None)
+                if resume is None:
+                    outcomes[resume_id] = {"id": resume_id, "status": "error", "error": "Resume not found"}
+                    continue
+                rendering.append((resume_id, (resume.full_name or "resume").strip().replace(" ", "_")))
+                yield resume, opts
+
+    window = max(2, AppConfig.RENDER_POOL_WORKERS * 2)
+    results = render_pool.iter_render_jobs(jobs(), window=window)
+    for pdf_bytes, error in results:
+        resume_id, base = rendering.pop(0)
+        if error is not None:
+            message = "Render timed out" if isinstance(error, TimeoutError) else str(error)
+            app.logger.warning("Batch render of resume %s failed: %s", resume_id, message)
+            outcomes[resume_id] = {"id": resume_id, "status": "error", "error": message}
+        else:
+            name = f"{base}_{resume_id}.pdf"
+            outcomes[resume_id] = {"id": resume_id, "status": "ok", "file": name, "size": len(pdf_bytes)}
+            # PDFs are already compressed; store them as-is.
+            yield name, pdf_bytes, zipfile.ZIP_STORED
+        if progress is not None:
+            progress(len(outcomes), len(resume_ids))
+    if progress is not None:
+        progress(len(resume_ids), len(resume_ids))
+
+    items = [outcomes[resume_id] for resume_id in resume_ids]
+    manifest = {
+        "template_name": template_name,
+        "requested": len(resume_ids),
+        "rendered": sum(1 for item in items if item["status"] == "ok"),
+        "failed": sum(1 for item in items if item["status"] != "ok"),
+        "items": items,
+    }
+    yield "manifest.json", json.dumps(manifest, indent=2), zipfile.ZIP_DEFLATED
+
+
+@app.route('/api/export-batch', methods=['POST'])
+def export_batch():
+    """
+    Render stored resumes (by ID) in one template and stream them back as a ZIP.
+    manifest.json at the end of the archive lists per-resume results; for
+    progress reporting queue the same payload as a "batch_pdf" export job.
+    """
+    try:
+        data = request.json or {}
+        try:
+            resume_ids = _batch_resume_ids(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        pdf_opts = _extract_pdf_options(data)
+        template_name = PDFGenerator._resolve_template_name(pdf_opts["template_name"])
+        _log_audit(action="export_batch_pdf", details=f"count={len(resume_ids)}; template={template_name}")
+        entries = _batch_pdf_entries(resume_ids, pdf_opts, _current_user_id())
+        response = _zip_stream_response(entries, f"resumes_{template_name}.zip")
+        response.headers["X-Batch-Count"] = str(len(resume_ids))
+        return response
+    except Exception as e:
+        app.logger.error(f"Batch PDF export failed: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route('/api/export-book', methods=['POST'])
+def export_book():
+    """Render the caller's stored resumes (by ID) into one bookmarked PDF, one candidate after another."""
+    try:
+        data = request.json or {}
+        try:
+            resume_ids = _batch_resume_ids(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if len(resume_ids) > AppConfig.RESUME_BOOK_MAX_RESUMES:
+            return jsonify({"error": f"At most {AppConfig.RESUME_BOOK_MAX_RESUMES} resumes per book"}), 400
+        # Other users' resumes are reported as missing, never rendered.
+        loaded = db.get_resumes(resume_ids, owner_id=_current_user_id())
+        missing = [resume_id for resume_id in resume_ids if resume_id not in loaded]
+        if missing:
+            return jsonify({"error": "Resumes not found", "missing": missing}), 404
+        pdf_opts = _extract_pdf_options(data)
+        pdf_opts["draft"] = False
+        title = str(data.get("title") or "Candidate shortlist").strip()[:200]
+
+        timer = RenderTimer()
+        pdf_buffer = io.BytesIO()
+        with timer.stage("render"):
+            PDFGenerator.generate_book([loaded[i] for i in resume_ids], pdf_buffer, title=title, timer=timer, **pdf_opts)
+        _log_audit(
+            action="export_book_pdf",
+            details=f"count={len(resume_ids)}; template={PDFGenerator._resolve_template_name(pdf_opts['template_name'])}",
+        )
+        pdf_buffer.seek(0)
+        response = send_file(
+            pdf_buffer,
+            mimetype='application/pdf',
             as_attachment=True,
-            download_name=f"{base}_bulk_templates.zip"
+            download_name=f"{title.replace(' ', '_') or 'resumes'}.pdf"
         )
+        response.headers["X-PDF-Size"] = str(pdf_buffer.getbuffer().nbytes)
+        return _finish_render_timing(response, timer, "book")
     except Exception as e:
-        app.logger.error(f"Bulk PDF export failed: {e}")
+        app.logger.error(f"Resume book export failed: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/render-stats', methods=['GET'])
+def render_stats():
+    """Report render/text cache counters, per-template stage timing histograms, SQLite pool and warmup stats."""
+    return jsonify({
+        "render_cache": render_cache.stats(),
+        "section_cache": section_cache.stats(),
+        "line_break_cache": line_break_cache.stats(),
+        "timings": render_timings.stats(),
+        "sqlite_pools": db_pool.pool_stats(),
+        "warmup": warmup.last_report(),
+    })
+
+
 @app.route('/api/export-word', methods=['POST'])
 def export_word():
     """Generate Word (RTF) and return as downloadable file."""
@@ -2687,46 +2988,39 @@ def export_branding_pack():
     try:
         data = request.json or {}
         resume = utils.dict_to_resume(data)
-        job_description = data.get("job_description", "")
         language = (data.get("language") or "english").strip().lower()
-
-        cover = generate_cover_letter(
-            resume=resume,
-            job_description=job_description,
-            company=data.get("company", ""),
-            role=data.get("role", ""),
-        )
-        interview = generate_interview_questions(
-            resume=resume,
-            job_description=job_description,
-            count=20,
-        )
-        localized = create_multilingual_variant(resume=resume, language=language)
-        portfolio_html = _build_portfolio_html(resume)
-        resume_json = json.dumps(utils.resume_to_dict(resume), ensure_ascii=False, indent=2)
-
-        zip_buffer = io.BytesIO()
         base = (resume.full_name or "resume").strip().replace(" ", "_")
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr(f"{base}.json", resume_json)
-            zf.writestr(f"{base}_cover_letter.txt", cover.get("cover_letter", ""))
-            zf.writestr(f"{base}_interview_questions.txt", "\n".join(interview.get("questions", [])))
-            zf.writestr(f"{base}_portfolio.html", portfolio_html)
-            zf.writestr(f"{base}_language_variant.txt", localized.get("preview_text", ""))
-        zip_buffer.seek(0)
+        entries = _branding_pack_entries(resume, data, language, base)
         _log_audit(action="export_branding_pack", details=f"name={resume.full_name or 'resume'}; lang={language}")
         _record_score_history(resume, "export_branding_pack")
-        return send_file(
-            zip_buffer,
-            mimetype='application/zip',
-            as_attachment=True,
-            download_name=f"{base}_branding_pack.zip"
-        )
+        return _zip_stream_response(entries, f"{base}_branding_pack.zip")
     except Exception as e:
         app.logger.error(f"Branding pack export failed: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+def _branding_pack_entries(resume, data: dict, language: str, base: str):
+    """ZIP entries of the branding pack, each yielded as soon as it is built so the archive streams."""
+    yield f"{base}.json", json.dumps(utils.resume_to_dict(resume), ensure_ascii=False, indent=2), zipfile.ZIP_DEFLATED
+    job_description = data.get("job_description", "")
+    cover = generate_cover_letter(
+        resume=resume,
+        job_description=job_description,
+        company=data.get("company", ""),
+        role=data.get("role", ""),
+    )
+    yield f"{base}_cover_letter.txt", cover.get("cover_letter", ""), zipfile.ZIP_DEFLATED
+    interview = generate_interview_questions(
+        resume=resume,
+        job_description=job_description,
+        count=20,
+    )
+    yield f"{base}_interview_questions.txt", "\n".join(interview.get("questions", [])), zipfile.ZIP_DEFLATED
+    yield f"{base}_portfolio.html", _build_portfolio_html(resume), zipfile.ZIP_DEFLATED
+    localized = create_multilingual_variant(resume=resume, language=language)
+    yield f"{base}_language_variant.txt", localized.get("preview_text", ""), zipfile.ZIP_DEFLATED
+
+
 @app.route('/api/export-portfolio', methods=['POST'])
 def export_portfolio():
     """Export a simple single-file HTML portfolio from resume data."""
@@ -2748,12 +3042,111 @@ def export_portfolio():
         app.logger.error(f"Portfolio export failed: {e}")
         return jsonify({"error": str(e)}), 500
 
+def _pdf_export_job(payload: dict):
+    resume = utils.dict_to_resume(payload)
+    pdf_opts = _extract_pdf_options(payload)
+    pdf_opts["draft"] = False
+    return [PDFGenerator.render_cached(resume, **pdf_opts)], f"{resume.full_name or 'resume'}_resume.pdf", "application/pdf"
+
+
+def _bulk_pdf_export_job(payload: dict):
+    resume = utils.dict_to_resume(payload)
+    pdf_opts = _extract_pdf_options(payload)
+    selected = _select_bulk_templates(payload, pdf_opts)
+    if not selected:
+        raise ValueError("No valid templates selected")
+    base = (resume.full_name or "resume").strip().replace(" ", "_")
+    entries = _bulk_pdf_entries(resume, pdf_opts, selected, base)
+    return utils.iter_zip_stream(entries), f"{base}_bulk_templates.zip", "application/zip"
+
+
+def _batch_pdf_export_job(payload: dict):
+    resume_ids = _batch_resume_ids(payload)
+    pdf_opts = _extract_pdf_options(payload)
+    template_name = PDFGenerator._resolve_template_name(pdf_opts["template_name"])
+    owner_id = export_jobs.current_user_id()
+    if owner_id is None:
+        raise ValueError("Batch exports must run as a queued job of their owner")
+    entries = _batch_pdf_entries(resume_ids, pdf_opts, owner_id, progress=export_jobs.report_progress)
+    return utils.iter_zip_stream(entries), f"resumes_{template_name}.zip", "application/zip"
+
+
+def _branding_pack_export_job(payload: dict):
+    resume = utils.dict_to_resume(payload)
+    language = (payload.get("language") or "english").strip().lower()
+    base = (resume.full_name or "resume").strip().replace(" ", "_")
+    entries = _branding_pack_entries(resume, payload, language, base)
+    return utils.iter_zip_stream(entries), f"{base}_branding_pack.zip", "application/zip"
+
+
+export_jobs.register_handler("pdf", _pdf_export_job)
+export_jobs.register_handler("bulk_pdf", _bulk_pdf_export_job)
+export_jobs.register_handler("batch_pdf", _batch_pdf_export_job)
+export_jobs.register_handler("branding_pack", _branding_pack_export_job)
+
+
+def _export_job_response(job: dict) -> dict:
+    job["status_url"] = f"/api/export-jobs/{job['id']}"
+    if job["status"] == "done":
+        job["download_url"] = f"/api/export-jobs/{job['id']}/download"
+    return job
+
+
+@app.route('/api/export-jobs', methods=['POST'])
+def create_export_job():
+    """Queue a PDF, bulk-PDF, batch-PDF or branding-pack export; the client polls the returned status URL."""
+    data = request.json or {}
+    kind = str(data.get("kind") or "pdf").strip().lower()
+    try:
+        job = export_jobs.enqueue(_current_user_id(), kind, data)
+    except export_jobs.JobLimitError as e:
+        return jsonify({"error": str(e)}), 429
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    _log_audit(action="export_job_queued", details=f"kind={kind}; job={job['id']}")
+    job = _export_job_response(job)
+    response = jsonify(job)
+    response.status_code = 202
+    response.headers["Location"] = job["status_url"]
+    return response
+
+
+@app.route('/api/export-jobs/<job_id>', methods=['GET'])
+def get_export_job(job_id):
+    """Job status; ``?wait=N`` long-polls up to N seconds for the job to finish."""
+    try:
+        wait = float(request.args.get("wait", 0) or 0)
+    except ValueError:
+        wait = 0.0
+    if wait > 0:
+        job = export_jobs.wait_for_job(job_id, _current_user_id(), wait)
+    else:
+        job = export_jobs.get_job(job_id, _current_user_id())
+    if job is None:
+        return jsonify({"error": "Not found"}), 404
+    return jsonify(_export_job_response(job))
+
+
+@app.route('/api/export-jobs/<job_id>/download', methods=['GET'])
+def download_export_job(job_id):
+    """Download the artifact of a finished export job."""
+    job, path, mimetype = export_jobs.get_artifact(job_id, _current_user_id())
+    if job is None:
+        return jsonify({"error": "Not found"}), 404
+    if job["status"] == "expired":
+        return jsonify({"error": "Export has expired; queue it again", "status": job["status"]}), 410
+    if path is None:
+        return jsonify({"error": "Export is not ready", "status": job["status"]}), 409
+    return send_file(path, mimetype=mimetype, as_attachment=True, download_name=job["download_name"])
+
+
 @app.route('/api/upload-profile-pic', methods=['POST'])
 def upload_profile_pic():
-    """Handle profile picture upload (base64)."""
+    """Handle profile picture upload (base64) and return its print-ready derivative."""
     data = request.json
     image_data = base64.b64decode(data['image'].split(',')[1])  # Remove data:image/...
-    # Return as bytes to be stored later
+    # Downscale/recompress once here; the client stores and re-sends the derivative.
+    image_data = utils.prepare_profile_photo(image_data)
     return jsonify({"image": base64.b64encode(image_data).decode('ascii')})
 
 if __name__ == '__main__':
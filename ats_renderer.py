@@ -0,0 +1,742 @@
+"""
+Direct-canvas renderer for ATS-safe single-column resumes.
+
+ATS mode only uses built-in fonts, plain paragraphs and left/right meta rows, so
+the Platypus Paragraph/Table machinery is mostly overhead there. This renderer
+emits the same content as the single-column path of ``PDFGenerator.generate``
+(same text, order, styles, spacing and page decoration), measures words with
+cached font metrics and draws lines straight onto the canvas. Frame placement
+follows Platypus rules (6pt frame padding, overlapping attached space, line-level
+paragraph splits without orphans, row-level table splits), so pagination matches.
+"""
+import logging
+import os
+from functools import lru_cache
+from itertools import groupby
+from typing import Callable, List, Optional, Tuple
+
+from reportlab.graphics.barcode import qr as rl_qr
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_RIGHT
+from reportlab.lib.fonts import ps2tt, tt2ps
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import HRFlowable, Image, Spacer
+
+from config import AppConfig
+from models import Resume
+from pdf_generator import PDFGenerator, _format_date_range, _format_location, _normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Platypus Frame defaults used by SimpleDocTemplate.
+_FRAME_PADDING = 6
+_FUZZ = 1e-6
+
+# A word is a list of (text, font_name, href) pieces drawn without spaces between them.
+_Piece = Tuple[str, str, Optional[str]]
+
+
+@lru_cache(maxsize=65536)
+def _unit_width(text: str, font_name: str) -> float:
+    """Width of ``text`` at 1pt; scaled by font size at the call site."""
+    return stringWidth(text, font_name, 1.0)
+
+
+@lru_cache(maxsize=64)
+def _variant(font_name: str, bold: bool = False, italic: bool = False) -> str:
+    family, is_bold, is_italic = ps2tt(font_name)
+    try:
+        return tt2ps(family, bold or is_bold, italic or is_italic)
+    except Exception:
+        return font_name
+
+
+def _words(segments: List[Tuple[str, str, Optional[str]]]) -> List[Optional[List[_Piece]]]:
+    """Split styled segments into words; ``None`` marks a forced line break."""
+    words: List[Optional[List[_Piece]]] = []
+    joined = False  # whether the next text continues the previous word
+    for text, font_name, href in segments:
+        if text == "\n":
+            words.append(None)
+            joined = False
+            continue
+        if not text:
+            continue
+        parts = text.split()
+        if not parts:
+            joined = False
+            continue
+        if joined and not text[0].isspace() and words and words[-1] is not None:
+            words[-1].append((parts[0], font_name, href))
+            parts = parts[1:]
+        words.extend([[(part, font_name, href)] for part in parts])
+        joined = not text[-1].isspace()
+    return words
+
+
+class _TextBlock:
+    """A wrapped paragraph: lines of words plus its ParagraphStyle."""
+
+    def __init__(self, style, lines: list, width: float, left: float = 0.0):
+        self.style = style
+        self.lines = lines
+        self.width = width
+        self.left = left
+        self.height = len(lines) * style.leading
+        self.space_before = style.spaceBefore
+        self.space_after = style.spaceAfter
+
+    @classmethod
+    def build(cls, segments, style, width: float, left: float = 0.0) -> "_TextBlock":
+        size = style.fontSize
+        max_width = width - style.leftIndent - style.rightIndent
+        lines, line, line_width = [], [], 0.0
+        for word in _words(segments):
+            if word is None:
+                lines.append((line, line_width, True))
+                line, line_width = [], 0.0
+                continue
+            word_width = sum(_unit_width(text, font_name) for text, font_name, _ in word) * size
+            space = _unit_width(" ", word[0][1]) * size if line else 0.0
+            if word_width > max_width and len(word) == 1:
+                # Platypus splits words wider than a line (splitLongWords), filling the
+                # rest of the current line first; the tail then flows like a normal word.
+                text, font_name, href = word[0]
+                used = line_width + space
+                chunk = ""
+                for ch in text:
+                    ch_width = _unit_width(ch, font_name) * size
+                    if used + ch_width > max_width and (chunk or ch_width <= max_width):
+                        line.append([(chunk, font_name, href)])
+                        lines.append((line, used, False))
+                        line, used, chunk = [], 0.0, ""
+                    chunk += ch
+                    used += ch_width
+                if line:
+                    # Nothing was split off after all.
+                    line.append([(chunk, font_name, href)])
+                    line_width = used
+                    continue
+                line_width, space = 0.0, 0.0
+                word = [(chunk, font_name, href)]
+                word_width = used
+            # Like Platypus, let inter-word spaces shrink by spaceShrinkage to fit a word.
+            shrink = style.spaceShrinkage * _unit_width(" ", word[0][1]) * size * len(line)
+            if line and line_width + space + word_width > max_width + shrink:
+                lines.append((line, line_width, False))
+                line, line_width, space = [], 0.0, 0.0
+            line.append(word)
+            line_width += space + word_width
+        if line:
+            lines.append((line, line_width, True))
+        while lines and not lines[-1][0]:
+            lines.pop()
+        return cls(style, lines, width, left)
+
+    def split(self, avail: float):
+        fit = int(avail / self.style.leading) if self.style.leading else 0
+        # Platypus never leaves a single orphan line at the bottom of a page.
+        if fit <= 1 or fit >= len(self.lines):
+            return None
+        head = _TextBlock(self.style, self.lines[:fit], self.width, self.left)
+        tail = _TextBlock(self.style, self.lines[fit:], self.width, self.left)
+        return head, tail
+
+    def draw(self, canv: Canvas, x: float, y: float) -> None:
+        style = self.style
+        size = style.fontSize
+        x += self.left + style.leftIndent
+        avail = self.width - style.leftIndent - style.rightIndent
+        baseline = y + self.height - size
+        tx = canv.beginText()
+        tx.setFillColor(style.textColor)
+        current_font, word_space = None, 0.0
+        links = []
+        for words, line_width, last in self.lines:
+            if style.alignment == TA_CENTER:
+                line_x = x + (avail - line_width) / 2.0
+            elif style.alignment == TA_RIGHT:
+                line_x = x + avail - line_width
+            else:
+                line_x = x
+            extra = 0.0
+            if style.alignment == TA_JUSTIFY and not last and len(words) > 1:
+                extra = (avail - line_width) / (len(words) - 1)
+            if extra != word_space:
+                # Justification stretches spaces with Tw, as Platypus does (base fonts only).
+                tx.setWordSpace(extra)
+                word_space = extra
+            tx.setTextOrigin(line_x, baseline)
+            # Merge consecutive pieces sharing font and link into single show operations.
+            runs = []
+            for index, word in enumerate(words):
+                if index:
+                    runs[-1][2].append(" ")
+                for text, font_name, href in word:
+                    if runs and runs[-1][0] == font_name and runs[-1][1] == href:
+                        runs[-1][2].append(text)
+                    else:
+                        runs.append((font_name, href, [text]))
+            cursor = line_x
+            for font_name, href, parts in runs:
+                text = "".join(parts)
+                if font_name != current_font:
+                    tx.setFont(font_name, size, style.leading)
+                    current_font = font_name
+                tx.textOut(text)
+                run_width = _unit_width(text, font_name) * size + extra * text.count(" ")
+                if href:
+                    links.append((href, (cursor, baseline - 0.2 * size, cursor + run_width, baseline + size)))
+                cursor += run_width
+            baseline -= style.leading
+        canv.drawText(tx)
+        for href, rect in links:
+            canv.linkURL(href, rect, relative=1)
+
+
+class _TableBlock:
+    """Rows of cells (each a stack of text blocks), split only between rows like a Platypus Table."""
+
+    def __init__(self, rows: list, width: float, valign: str = "TOP"):
+        self.rows = rows  # [(height, [(col_x, top_pad, bottom_pad, [_TextBlock])])]
+        self.width = width
+        self.valign = valign
+        self.height = sum(row[0] for row in rows)
+        self.space_before = 0
+        self.space_after = 0
+
+    @staticmethod
+    def _content_height(blocks: list) -> float:
+        # Like Table._listCellGeom: the outer space before/after of a cell's stack is dropped.
+        if not blocks:
+            return 0.0
+        total = sum(b.space_before + b.height + b.space_after for b in blocks)
+        return total - blocks[0].space_before - blocks[-1].space_after
+
+    @classmethod
+    def row(cls, cells: list) -> tuple:
+        """``cells`` are (x, top_pad, bottom_pad, blocks); returns (row_height, cells)."""
+        height = max(cls._content_height(blocks) + top_pad + bottom_pad for _, top_pad, bottom_pad, blocks in cells)
+        return height, cells
+
+    def split(self, avail: float):
+        used, count = 0.0, 0
+        for height, _ in self.rows:
+            if used + height > avail + _FUZZ:
+                break
+            used += height
+            count += 1
+        if count == 0 or count >= len(self.rows):
+            return None
+        return _TableBlock(self.rows[:count], self.width, self.valign), _TableBlock(self.rows[count:], self.width, self.valign)
+
+    def draw(self, canv: Canvas, x: float, y: float) -> None:
+        top = y + self.height
+        for height, cells in self.rows:
+            for col_x, top_pad, bottom_pad, blocks in cells:
+                if not blocks:
+                    continue
+                content = self._content_height(blocks)
+                if self.valign == "MIDDLE":
+                    cursor = top - height + (height + bottom_pad - top_pad + content) / 2.0
+                else:
+                    cursor = top - top_pad
+                cursor += blocks[0].space_before
+                for block in blocks:
+                    cursor -= block.space_before + block.height
+                    block.draw(canv, x + col_x, cursor)
+                    cursor -= block.space_after
+            top -= height
+
+
+class _FlowableBlock:
+    """Adapter for the few non-text flowables (photo, logo, QR code, rules, spacers)."""
+
+    def __init__(self, flowable, avail_width: float):
+        self.flowable = flowable
+        self.avail_width = avail_width
+        self.width, self.height = flowable.wrap(avail_width, 1e6)
+        self.space_before = flowable.getSpaceBefore()
+        self.space_after = flowable.getSpaceAfter()
+
+    def split(self, avail: float):
+        return None
+
+    def draw(self, canv: Canvas, x: float, y: float) -> None:
+        if not isinstance(self.flowable, Spacer):
+            self.flowable.drawOn(canv, x, y, _sW=self.avail_width - self.width)
+
+
+class _QrBlock:
+    """QR code drawn as one filled path; Platypus renders the same modules as a Drawing of Rect nodes."""
+
+    def __init__(self, text: str, size: float = 62):
+        widget = rl_qr.QrCodeWidget(text)
+        widget.qr.make()
+        self.modules = widget.qr.modules
+        self.border = widget.barBorder
+        self.color = widget.barFillColor
+        self.width = self.height = size
+        self.space_before = self.space_after = 0
+
+    def split(self, avail: float):
+        return None
+
+    def draw(self, canv: Canvas, x: float, y: float) -> None:
+        box = self.width / (len(self.modules) + self.border * 2.0)
+        path = canv.beginPath()
+        for r, row in enumerate(self.modules):
+            top = y + self.height - (r + self.border + 1) * box
+            c = 0
+            for dark, run in groupby(map(bool, row)):
+                count = len(list(run))
+                if dark:
+                    path.rect(x + (c + self.border) * box, top, count * box, box)
+                c += count
+        canv.saveState()
+        canv.setFillColor(self.color)
+        canv.drawPath(path, stroke=0, fill=1)
+        canv.restoreState()
+
+
+class _CanvasFrame:
+    """Places blocks top-down on successive pages, following Platypus Frame.add semantics."""
+
+    def __init__(self, canv: Canvas, doc, on_page: Callable):
+        self.canv = canv
+        self.doc = doc
+        self.on_page = on_page
+        self.x = doc.leftMargin + _FRAME_PADDING
+        self.width = doc.width - 2 * _FRAME_PADDING
+        self.top = doc.bottomMargin + doc.height - _FRAME_PADDING
+        self.bottom = doc.bottomMargin + _FRAME_PADDING
+        self.pages = 0
+        self._new_page()
+
+    def _new_page(self) -> None:
+        if self.pages:
+            self.canv.showPage()
+        self.pages += 1
+        self.on_page(self.canv, self.doc)
+        self.y = self.top
+        self.at_top = True
+        self.prev_space_after = 0.0
+
+    def add(self, block) -> None:
+        while block is not None:
+            space = 0.0 if self.at_top else max(block.space_before - self.prev_space_after, 0.0)
+            if self.y - space - block.height >= self.bottom - _FUZZ:
+                self._place(block, space)
+                return
+            parts = block.split(self.y - space - self.bottom)
+            if parts is not None:
+                self._place(parts[0], space)
+                block = parts[1]
+                self._new_page()
+            elif self.at_top:
+                # Too tall for an empty page: draw it anyway rather than loop forever.
+                self._place(block, space)
+                return
+            else:
+                self._new_page()
+
+    def _place(self, block, space: float) -> None:
+        self.y -= space + block.height
+        # Tables wider than the frame are centred on it, as Platypus does.
+        offset = (self.width - block.width) / 2.0 if isinstance(block, _TableBlock) else 0.0
+        block.draw(self.canv, self.x + offset, self.y)
+        self.y -= block.space_after
+        self.prev_space_after = block.space_after
+        if block.height or space or block.space_after:
+            self.at_top = False
+
+
+def render_ats_resume(
+    resume: Resume,
+    doc,
+    compiled: dict,
+    template_name: str,
+    on_page: Callable,
+    header_layout: Optional[str] = None,
+    section_order: Optional[List[str]] = None,
+    section_visibility: Optional[dict] = None,
+    draft: bool = False,
+    compact_output: bool = False,
+) -> int:
+    """
+    Render ``resume`` into ``doc``'s output with ``compiled`` ATS settings and
+    return the page count. ``on_page`` draws the page decoration, as the
+    onFirstPage/onLaterPages callback would.
+    """
+    template_cfg = compiled["template_cfg"]
+    styles = compiled["styles"]
+    accent_color = compiled["accent_color"]
+    section_spacing = compiled["section_spacing"]
+    item_spacing = compiled["item_spacing"]
+    section_tail_spacing = compiled["section_tail_spacing"]
+    bullet = template_cfg.get("bullet", "-")
+
+    canv = doc._makeCanvas(canvasmaker=Canvas)
+    frame = _CanvasFrame(canv, doc, on_page)
+    width = frame.width
+
+    def plain(text: str, style) -> list:
+        return [(str(text), style.fontName, None)]
+
+    def para(segments, style, block_width: float = width, left: float = 0.0) -> _TextBlock:
+        return _TextBlock.build(segments, style, block_width, left)
+
+    def add_para(segments, style) -> None:
+        frame.add(para(segments, style))
+
+    def add_spacer(height: float) -> None:
+        frame.add(_FlowableBlock(Spacer(1, height), width))
+
+    def labelled(label: str, value: str, style) -> list:
+        return [(label, _variant(style.fontName, italic=True), None), (f" {value}", style.fontName, None)]
+
+    def link(label: str, url: str, style) -> list:
+        return [(label, style.fontName, _normalize_url(url) or None)]
+
+    def meta_row(left, right, left_ratio: float = 0.72) -> None:
+        left_text = left if isinstance(left, list) else plain(left, styles["Body"])
+        right_text = str(right or "").strip()
+        if not "".join(t for t, _, _ in left_text).strip():
+            left_text = []
+        if left_text and right_text:
+            left_w, right_w = doc.width * left_ratio, doc.width * (1 - left_ratio)
+            cells = [
+                (0.0, 0, 0, [para(left_text, styles["Body"], left_w)]),
+                (left_w, 0, 0, [para(plain(right_text, styles["BodySmall"]), styles["BodySmall"], right_w)]),
+            ]
+            frame.add(_TableBlock([_TableBlock.row(cells)], doc.width))
+        elif left_text:
+            add_para(left_text, styles["Body"])
+        elif right_text:
+            add_para(plain(right_text, styles["BodySmall"]), styles["BodySmall"])
+
+    heading_align = {"left": "LEFT", "center": "CENTER", "right": "RIGHT"}.get(template_cfg.get("heading_align", "left"), "LEFT")
+
+    # ----- Profile photo and logo -----
+    if resume.profile_pic and not draft:
+        try:
+            profile_img = PDFGenerator._build_profile_image_flowable(resume.profile_pic, align=heading_align, compact=compact_output)
+            if profile_img:
+                frame.add(_FlowableBlock(profile_img, width))
+                add_spacer(0.1 * inch)
+        except Exception as e:
+            logger.warning("Could not render profile photo in PDF: %s", e)
+    if os.path.exists(AppConfig.LOGO_PATH):
+        try:
+            logo = Image(AppConfig.LOGO_PATH, width=1.2 * inch, height=0.4 * inch)
+            logo.hAlign = heading_align
+            frame.add(_FlowableBlock(logo, width))
+            add_spacer(0.1 * inch)
+        except Exception:
+            pass
+
+    # ----- Header -----
+    contact_style = styles["Contact"]
+    contact_lines = []
+    if resume.email:
+        contact_lines.append(link(f"Email: {resume.email}", f"mailto:{resume.email}", contact_style))
+    if resume.phone:
+        contact_lines.append(plain(f"Phone: {resume.phone}", contact_style))
+    location_text = _format_location(resume)
+    if location_text:
+        contact_lines.append(plain(f"Location: {location_text}", contact_style))
+    for label, url in (("LinkedIn", resume.linkedin), ("GitHub", resume.github), ("Twitter", resume.twitter), ("Web", resume.website)):
+        if url:
+            contact_lines.append(plain(f"{label}: ", contact_style) + link(url, url, contact_style))
+
+    def contact_segments(style) -> list:
+        segments = []
+        for line in contact_lines:
+            if segments:
+                segments.append(("\n", style.fontName, None))
+            segments.extend((text, style.fontName, href) for text, _, href in line)
+        return segments
+
+    layout = str(header_layout or template_cfg.get("header_layout_default", "default")).strip().lower()
+    if layout == "split":
+        left_w, right_w = doc.width * 0.62, doc.width * 0.38
+        left_bits = []
+        if resume.full_name:
+            left_bits.append(para(plain(resume.full_name, styles["Title"]), styles["Title"], left_w))
+        if resume.profile_title:
+            left_bits.append(para(plain(resume.profile_title, styles["ProfileTitle"]), styles["ProfileTitle"], left_w))
+        right = para(contact_segments(contact_style), contact_style, right_w)
+        cells = [(0.0, 0, 0, left_bits), (left_w, 0, 0, [right])]
+        frame.add(_TableBlock([_TableBlock.row(cells)], doc.width))
+        add_spacer(section_tail_spacing)
+    else:
+        title_style, profile_style = styles["Title"], styles["ProfileTitle"]
+        if layout == "center":
+            title_style, profile_style = styles["HeaderTitleCenter"], styles["HeaderProfileCenter"]
+            contact_style = styles["HeaderContactCenter"]
+        if resume.full_name:
+            add_para(plain(resume.full_name, title_style), title_style)
+        if resume.profile_title:
+            add_para(plain(resume.profile_title, profile_style), profile_style)
+        if contact_lines:
+            add_para(contact_segments(contact_style), contact_style)
+            add_spacer(max(1, item_spacing - 1))
+
+    # ----- QR link -----
+    qr_text = str(getattr(resume, "qr_link", None) or "").strip()
+    if getattr(resume, "qr_link", None):
+        if qr_text:
+            if not draft:
+                try:
+                    frame.add(_QrBlock(qr_text))
+                except Exception as e:
+                    logger.warning("Could not render QR code: %s", e)
+            add_para(labelled("QR:", qr_text, styles["Body"]), styles["Body"])
+            add_spacer(section_tail_spacing)
+        frame.add(_FlowableBlock(
+            HRFlowable(width="100%", thickness=0.8, color=accent_color, spaceBefore=1, spaceAfter=max(2, section_spacing - 1)),
+            width,
+        ))
+
+    # ----- Sections -----
+    visibility = section_visibility or {}
+
+    def visible(key: str) -> bool:
+        return bool(visibility.get(key, True))
+
+    def date_range(start, end, default_present: bool) -> str:
+        return _format_date_range(template_cfg["date_format"], start, end, default_present)
+
+    def heading(text: str) -> None:
+        add_para(plain(text, styles["Heading"]), styles["Heading"])
+
+    def bullets(text: str) -> None:
+        for line in text.strip().split("\n"):
+            if line.strip():
+                add_para(plain(f"{bullet} {line}", styles["Body"]), styles["Body"])
+
+    def render_summary():
+        if visible("summary") and resume.summary and resume.summary.strip():
+            heading("ABOUT ME" if template_name in ["corporate", "elegant_light"] else "SUMMARY")
+            segments = []
+            for index, line in enumerate(resume.summary.split("\n")):
+                if index:
+                    segments.append(("\n", styles["Body"].fontName, None))
+                segments.append((line, styles["Body"].fontName, None))
+            add_para(segments, styles["Body"])
+            add_spacer(section_tail_spacing)
+
+    def render_experience():
+        if not visible("experience") or not resume.experiences:
+            return
+        heading("WORK EXPERIENCE")
+        for exp in resume.experiences:
+            title_company = f"{exp.job_title}"
+            if exp.company:
+                title_company += f" at {exp.company}"
+            if (exp.start_date and exp.start_date.strip()) or (exp.end_date and exp.end_date.strip()):
+                meta_row(title_company, date_range(exp.start_date, exp.end_date, True))
+            else:
+                add_para(plain(title_company, styles["Body"]), styles["Body"])
+            if exp.description:
+                bullets(exp.description)
+            add_spacer(section_tail_spacing)
+
+    def render_education(skip_date_already_in_text: bool = False):
+        if not visible("education") or not resume.educations:
+            return
+        heading("EDUCATION")
+        if template_cfg.get("education_table", False):
+            rows = []
+            for edu in resume.educations:
+                segments = plain(f"{edu.degree}", styles["Body"])
+                if edu.institution:
+                    segments += [("\n", styles["Body"].fontName, None), (f"{edu.institution}", styles["Body"].fontName, None)]
+                cell = para(segments, styles["Body"], doc.width - 4, left=0)
+                rows.append(_TableBlock.row([(2.0, 2, 2, [cell])]))
+            frame.add(_TableBlock(rows, doc.width, valign="MIDDLE"))
+            return
+        for edu in resume.educations:
+            degree_inst = f"{edu.degree}"
+            if edu.institution:
+                degree_inst += f" at {edu.institution}"
+            date_str = date_range(edu.start_date, edu.end_date, False)
+            date_text_l = str(date_str or "").strip().lower()
+            date_already_in_text = bool(date_text_l and date_text_l in degree_inst.strip().lower())
+            if date_str and not (skip_date_already_in_text and date_already_in_text):
+                meta_row(degree_inst, date_str)
+            else:
+                add_para(plain(degree_inst, styles["Body"]), styles["Body"])
+            if edu.description:
+                add_para(plain(edu.description, styles["Body"]), styles["Body"])
+            add_spacer(section_tail_spacing)
+
+    def render_projects(role_separator: str = " - "):
+        if not visible("projects") or not resume.projects:
+            return
+        heading("PROJECTS")
+        for proj in resume.projects:
+            proj_name = f"{proj.name}"
+            if proj.role:
+                proj_name += f"{role_separator}{proj.role}"
+            if proj.start_date or proj.end_date:
+                meta_row(proj_name, date_range(proj.start_date, proj.end_date, False))
+            else:
+                add_para(plain(proj_name, styles["Body"]), styles["Body"])
+            if proj.technologies:
+                add_para(labelled("Technologies:", proj.technologies, styles["Body"]), styles["Body"])
+            if proj.description:
+                bullets(proj.description)
+            if proj.link:
+                add_para(labelled("Link:", proj.link, styles["Body"]), styles["Body"])
+            add_spacer(section_tail_spacing)
+
+    def render_certifications():
+        if not visible("certifications") or not resume.certifications:
+            return
+        heading("CERTIFICATIONS")
+        for cert in resume.certifications:
+            cert_name = f"{cert.name}"
+            if cert.issuer:
+                cert_name += f" — {cert.issuer}"
+            if cert.date:
+                meta_row(cert_name, cert.date)
+            else:
+                add_para(plain(cert_name, styles["Body"]), styles["Body"])
+            if cert.link:
+                add_para(labelled("Credential:", cert.link, styles["Body"]), styles["Body"])
+            add_spacer(section_tail_spacing)
+
+    def render_languages():
+        if not visible("languages") or not resume.languages:
+            return
+        heading("LANGUAGES")
+        for lang in resume.languages:
+            meta_row(f"{lang.name}", lang.proficiency)
+        add_spacer(section_tail_spacing)
+
+    def render_skills():
+        if not visible("skills") or not resume.skills:
+            return
+        heading("SKILLS")
+        for skill in sorted(resume.skills):
+            add_para(plain(f"{bullet} {skill}", styles["Body"]), styles["Body"])
+        add_spacer(section_tail_spacing)
+
+    def render_achievements():
+        if not visible("achievements") or not resume.achievements:
+            return
+        heading("ACHIEVEMENTS")
+        for ach in resume.achievements:
+            add_para(plain(f"{ach.title}", styles["Body"]), styles["Body"])
+            if ach.subtitle:
+                add_para(plain(ach.subtitle, styles["BodySmall"]), styles["BodySmall"])
+            if ach.description:
+                add_para(plain(ach.description, styles["Body"]), styles["Body"])
+            add_spacer(section_tail_spacing)
+
+    def reference_segments(ref) -> list:
+        font_name = styles["Body"].fontName
+        lines = [f"{ref.name}"]
+        if ref.title:
+            lines.append(f"{ref.title}")
+        if ref.company:
+            lines.append(f"{ref.company}")
+        if ref.phone:
+            lines.append(f"📞 {ref.phone}")
+        if ref.email:
+            lines.append(f"📧 {ref.email}")
+        if ref.website:
+            lines.append(f"🌐 {ref.website}")
+        segments = []
+        for line in lines:
+            if segments:
+                segments.append(("\n", font_name, None))
+            segments.append((line, font_name, None))
+        return segments
+
+    def render_references():
+        if not visible("references") or not resume.references:
+            return
+        heading("REFERENCES")
+        if template_cfg.get("references_two_column", False):
+            col_w = doc.width / 2.0 - 12
+            body = styles["Body"]
+            rows = []
+            refs = resume.references
+            for i in range(0, len(refs), 2):
+                cells = [(0.0, 2, 2, [para(reference_segments(refs[i]), body, col_w - 4, left=2)])]
+                if i + 1 < len(refs):
+                    cells.append((col_w, 2, 2, [para(reference_segments(refs[i + 1]), body, col_w - 4, left=2)]))
+                rows.append(_TableBlock.row(cells))
+            frame.add(_TableBlock(rows, doc.width - 24))
+            return
+        for ref in resume.references:
+            ref_text = f"{ref.name}"
+            if ref.title:
+                ref_text += f" — {ref.title}"
+            if ref.company:
+                ref_text += f", {ref.company}"
+            add_para(plain(ref_text, styles["Body"]), styles["Body"])
+            if ref.phone:
+                add_para(plain(f"📞 {ref.phone}", styles["Body"]), styles["Body"])
+            if ref.email:
+                add_para(plain(f"📧 {ref.email}", styles["Body"]), styles["Body"])
+            if ref.website:
+                add_para(plain(f"🌐 {ref.website}", styles["Body"]), styles["Body"])
+            add_spacer(section_tail_spacing)
+
+    def render_custom_sections():
+        if not visible("custom") or not getattr(resume, "custom_sections", None):
+            return
+        for section in resume.custom_sections:
+            title = str(section.get("title", "")).strip()
+            items = section.get("items") or []
+            if not title or not items:
+                continue
+            heading(title.upper())
+            for item in items:
+                line = str(item).strip()
+                if line:
+                    add_para(plain(f"{bullet} {line}", styles["Body"]), styles["Body"])
+            add_spacer(section_tail_spacing)
+
+    renderers = {
+        "summary": render_summary,
+        "experience": render_experience,
+        "education": render_education,
+        "projects": render_projects,
+        "certifications": render_certifications,
+        "languages": render_languages,
+        "skills": render_skills,
+        "achievements": render_achievements,
+        "references": render_references,
+        "custom": render_custom_sections,
+    }
+    ordered = []
+    allowed = {"summary", "experience", "education", "projects", "skills", "achievements", "custom"}
+    for key in section_order or []:
+        k = str(key).strip().lower()
+        if k in allowed and k not in ordered:
+            ordered.append(k)
+    if ordered:
+        for key in ordered:
+            renderers[key]()
+    else:
+        render_summary()
+        render_experience()
+        render_education(skip_date_already_in_text=True)
+        render_projects(role_separator=" — ")
+    render_certifications()
+    render_languages()
+    if not ordered:
+        render_skills()
+        render_achievements()
+    render_references()
+    if not ordered:
+        render_custom_sections()
+
+    canv.showPage()
+    canv.save()
+    return frame.pages
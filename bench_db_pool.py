@@ -0,0 +1,82 @@
+"""
+Benchmark the pooled SQLite connections against one fresh connection per
+operation, on concurrent request threads (as with ``gunicorn --threads N``).
+
+    python bench_db_pool.py [--threads 8] [--requests 400]
+
+Each simulated request does the database work of an export: load a stored
+resume, write the audit log and score history, then read recent history. Both
+runs use a throwaway copy of resume.db; "before" keeps the rollback journal.
+"""
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import AppConfig
+
+
+def _fresh_db(workdir: str, name: str) -> str:
+    path = os.path.join(workdir, name)
+    if os.path.exists(AppConfig.DB_PATH):
+        shutil.copyfile(AppConfig.DB_PATH, path)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=DELETE")
+    conn.close()
+    return path
+
+
+def _requests_per_second(db_path: str, pooled: bool, threads: int, requests: int) -> float:
+    # app.py binds its Database and auth helpers to AppConfig.DB_PATH at import time.
+    AppConfig.DB_PATH = db_path
+    AppConfig.SQLITE_POOL = pooled
+    import app as app_module  # noqa: E402
+    from bench_text_cache import SAMPLE_RESUME
+    from database import Database
+    from utils import dict_to_resume
+
+    db = Database(db_path)
+    app_module.db = db
+    resume_id = db.save_resume(dict_to_resume(SAMPLE_RESUME))
+
+    def one_request(_):
+        with app_module.app.test_request_context("/api/export-pdf", method="POST"):
+            resume = db.get_resume(resume_id)
+            app_module._log_audit("export_pdf", resume.title)
+            app_module._record_score_history(resume, "export")
+            with app_module._auth_conn() as conn:
+                conn.execute("SELECT score, created FROM score_history ORDER BY id DESC LIMIT 20").fetchall()
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(one_request, range(threads * 2)))  # warm imports and threads
+        start = time.perf_counter()
+        list(pool.map(one_request, range(requests)))
+        elapsed = time.perf_counter() - start
+    return requests / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=400)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        before = _requests_per_second(_fresh_db(workdir, "before.db"), False, args.threads, args.requests)
+        after = _requests_per_second(_fresh_db(workdir, "after.db"), True, args.threads, args.requests)
+        import db_pool
+
+        db_pool.close_idle_connections()
+        stats = db_pool.pool_stats()
+    print(f"{'mode':<34}{'req/s':>10}")
+    print(f"{'connection per operation':<34}{before:>10.1f}")
+    print(f"{'pooled, WAL':<34}{after:>10.1f}")
+    print(f"speedup: {after / before:.2f}x  ({args.threads} threads, {args.requests} requests)")
+    print("pool:", stats)
+
+
+if __name__ == "__main__":
+    main()
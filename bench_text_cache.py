@@ -0,0 +1,109 @@
+"""
+Benchmark the paragraph line-break cache for every custom font.
+
+    python bench_text_cache.py [--renders 20] [--template modern]
+
+Each font is rendered with the cache bypassed and then with a warm cache (the
+steady state of a long-running server); the report shows the best ms per render
+of three batches. A final check renders the same resume twice as an
+incremental live preview: the second render must hit the cache (sections
+restored from the section cache carry their own style copies) without adding
+entries, otherwise the script exits with status 1.
+"""
+import argparse
+import io
+import sys
+import time
+from contextlib import contextmanager
+
+import pdf_generator
+from pdf_generator import PDFGenerator, _CUSTOM_FONT_FILES, line_break_cache, section_cache
+from utils import dict_to_resume
+
+SAMPLE_RESUME = {
+    "full_name": "Ada Lovelace",
+    "profile_title": "Senior Software Engineer",
+    "email": "ada@example.com",
+    "phone": "+44 20 7946 0000",
+    "city": "London",
+    "country": "UK",
+    "linkedin": "linkedin.com/in/ada",
+    "github": "github.com/ada",
+    "summary": "Engineer with a decade of experience building data platforms and developer tooling. " * 3,
+    "experiences": [
+        {
+            "job_title": f"Software Engineer {i}",
+            "company": "Analytical Engines Ltd",
+            "start_date": f"{2012 + i}-01",
+            "end_date": f"{2013 + i}-06",
+            "description": "Designed services\nLed a team of five engineers\nCut batch latency by 40% with streaming",
+        }
+        for i in range(6)
+    ],
+    "educations": [{"degree": "BSc Mathematics", "institution": "University of London", "start_date": "2008", "end_date": "2011"}],
+    "projects": [{"name": "Difference Engine", "role": "Lead", "technologies": "Python, Rust", "description": "Open source\nPlugin API"}],
+    "certifications": [{"name": "Cloud Architect", "issuer": "Example Org", "date": "2020"}],
+    "languages": [{"name": "English", "proficiency": "Native"}, {"name": "French", "proficiency": "Fluent"}],
+    "skills": ["Python", "SQL", "Kubernetes", "Flask", "ReportLab", "PostgreSQL", "Terraform", "Go"],
+    "achievements": [{"title": "Engineering Award", "subtitle": "2021", "description": "Company-wide recognition"}],
+}
+
+
+@contextmanager
+def _cache_bypassed():
+    """Render as if the cache did not exist: every paragraph is broken afresh."""
+    max_entries = line_break_cache.max_entries
+    line_break_cache.max_entries = 0
+    try:
+        yield
+    finally:
+        line_break_cache.max_entries = max_entries
+
+
+def _ms_per_render(resume, renders: int, **options) -> float:
+    """Best of three batches of CPU time, to keep scheduler noise out of the comparison."""
+    PDFGenerator.generate(resume, io.BytesIO(), **options)  # warm fonts, styles and the cache
+    best = float("inf")
+    for _ in range(3):
+        start = time.process_time()
+        for _ in range(renders):
+            PDFGenerator.generate(resume, io.BytesIO(), **options)
+        best = min(best, (time.process_time() - start) * 1000.0 / renders)
+    return best
+
+
+def _check_incremental_preview(resume, template_name: str) -> bool:
+    """Second incremental preview of an unchanged resume reuses every cached line break."""
+    scope = section_cache.scope("bench_text_cache")
+    PDFGenerator.generate(resume, io.BytesIO(), section_cache=scope, template_name=template_name)
+    before = line_break_cache.stats()
+    PDFGenerator.generate(resume, io.BytesIO(), section_cache=scope, template_name=template_name)
+    after = line_break_cache.stats()
+    hits = after["hits"] - before["hits"]
+    added = after["entries"] - before["entries"]
+    print(f"incremental preview: {hits} line-break hits, {added} new entries on the second render")
+    return hits > 0 and added == 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--renders", type=int, default=20)
+    parser.add_argument("--template", default="modern")
+    args = parser.parse_args()
+
+    resume = dict_to_resume(SAMPLE_RESUME)
+    pdf_generator._register_custom_fonts()
+    print(f"{'font':<18}{'uncached ms':>12}{'cached ms':>12}{'speedup':>10}")
+    for font in _CUSTOM_FONT_FILES:
+        options = {"template_name": args.template, "font_override": font}
+        with _cache_bypassed():
+            uncached = _ms_per_render(resume, args.renders, **options)
+        cached = _ms_per_render(resume, args.renders, **options)
+        print(f"{font:<18}{uncached:>12.1f}{cached:>12.1f}{uncached / cached:>9.2f}x")
+    print("line breaks:", line_break_cache.stats())
+    if not _check_incremental_preview(resume, args.template):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
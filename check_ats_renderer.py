@@ -0,0 +1,127 @@
+"""
+Check that the ATS fast renderer is text-equivalent to the Platypus renderer.
+
+    python check_ats_renderer.py [--template modern] [--verbose]
+
+Every single-column template is rendered in ATS-safe mode with
+ATS_FAST_RENDER on and off, for a few sample resumes and option sets. Text
+is extracted page by page with pypdf (what an applicant tracking system sees)
+and the page count and words on each page are compared. Exits with status 1
+if any case differs.
+"""
+import argparse
+import difflib
+import io
+import sys
+
+from bench_text_cache import SAMPLE_RESUME
+from config import AppConfig
+from pdf_generator import PDFGenerator
+from utils import dict_to_resume
+
+EDGE_CASE_RESUME = {
+    **SAMPLE_RESUME,
+    "summary": "",
+    "skills": [],
+    "educations": [
+        {"degree": "MSc 2015 - 2016", "institution": "Example University", "start_date": "2015", "end_date": "2016"},
+        {"degree": "PhD", "description": "Thesis on analytical engines"},
+    ],
+    "references": [
+        {"name": f"Referee {i}", "title": "Director", "company": "Example Co", "phone": "1", "email": "r@example.com"}
+        for i in range(3)
+    ],
+    "custom_sections": [{"title": "Volunteering", "items": ["Code club mentor", ""]}, {"title": "", "items": ["x"]}],
+}
+
+LONG_RESUME = {
+    **SAMPLE_RESUME,
+    "summary": "\n".join(["A long summary sentence that keeps going so every line has to wrap on the page. " * 6] * 4),
+    "website": "https://example.org/" + "x" * 120,
+    "experiences": [
+        {
+            "job_title": f"Senior Staff Principal Engineer {i} with a title long enough to wrap",
+            "company": "Babbage & Co",
+            "start_date": "2019-01",
+            "end_date": "2020-02",
+            "description": "\n".join(f"Delivered item {k} that is long enough to wrap across the full page width" for k in range(8)),
+        }
+        for i in range(12)
+    ],
+    "skills": [f"Skill {i}" for i in range(40)],
+}
+
+OPTION_SETS = [
+    {},
+    {"header_layout": "center", "page_size": "a4", "margin_preset": "wide"},
+    {"header_layout": "split"},
+    {"compact_mode": True, "font_scale": 1.2},
+    {"body_align_override": "justify", "heading_align_override": "center"},
+    {"section_order": ["skills", "summary", "experience"], "section_visibility": {"projects": False}},
+    {"draft": True},
+    {"output_profile": "compact", "spacing_scale": 0.6},
+    {"fit_to_pages": 1},
+]
+
+
+def _extract_words(pdf_bytes: bytes) -> list:
+    from pypdf import PdfReader  # optional dependency
+
+    return [page.extract_text().split() for page in PdfReader(io.BytesIO(pdf_bytes)).pages]
+
+
+def _render_words(resume, fast: bool, **options) -> list:
+    previous = AppConfig.ATS_FAST_RENDER
+    AppConfig.ATS_FAST_RENDER = fast
+    try:
+        buffer = io.BytesIO()
+        PDFGenerator.generate(resume, buffer, ats_safe_mode=True, **options)
+    finally:
+        AppConfig.ATS_FAST_RENDER = previous
+    return _extract_words(buffer.getvalue())
+
+
+def _single_column_templates(only: str = "") -> list:
+    names = [PDFGenerator._resolve_template_name(only)] if only else list(AppConfig.TEMPLATES)
+    return [
+        name
+        for name in names
+        if PDFGenerator._compile_render_settings(
+            name, None, None, None, None, None, None, False, True, 1.0, 1.0, False
+        )["template_cfg"].get("layout") != "two_column"
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--template", default="", help="check one template (default: all single-column ones)")
+    parser.add_argument("--verbose", action="store_true", help="print the differing words of each failed case")
+    args = parser.parse_args()
+
+    resumes = {
+        "sample": dict_to_resume(SAMPLE_RESUME),
+        "edge_cases": dict_to_resume(EDGE_CASE_RESUME),
+        "long": dict_to_resume(LONG_RESUME),
+    }
+    cases = failures = 0
+    for template_name in _single_column_templates(args.template):
+        for index, options in enumerate(OPTION_SETS):
+            for label, resume in resumes.items():
+                cases += 1
+                fast = _render_words(resume, True, template_name=template_name, **options)
+                platypus = _render_words(resume, False, template_name=template_name, **options)
+                if fast == platypus:
+                    continue
+                failures += 1
+                print(f"DIFF {template_name} options#{index} {label}: {len(fast)} vs {len(platypus)} pages")
+                if args.verbose:
+                    for page, (a, b) in enumerate(zip(fast, platypus)):
+                        changes = [d for d in difflib.ndiff(a, b) if d[0] in "+-"]
+                        if changes:
+                            print(f"  page {page + 1}: {changes[:12]}")
+    print(f"{cases} cases, {failures} differ")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,73 @@ class AppConfig:
     DATE_FORMAT = "%Y-%m-%d"
     MAX_RECENT_FILES = 10
 
+    # SQLite connections: reused per thread (SQLITE_POOL=0 opens one per operation) and tuned
+    # with WAL journaling so readers never block the writer.
+    SQLITE_POOL = os.getenv("SQLITE_POOL", "1") == "1"
+    SQLITE_POOL_MAX_IDLE_PER_THREAD = int(os.getenv("SQLITE_POOL_MAX_IDLE_PER_THREAD", "2"))
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(64 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "8192"))
+    SQLITE_STATEMENT_CACHE_SIZE = int(os.getenv("SQLITE_STATEMENT_CACHE_SIZE", "256"))
+
+    # In-memory cache for rendered PDF bytes (LRU, bounded by total size).
+    RENDER_CACHE_MAX_BYTES = int(os.getenv("RENDER_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    # Built section flowables reused across live-preview renders (entries, all users).
+    SECTION_CACHE_MAX_ENTRIES = int(os.getenv("SECTION_CACHE_MAX_ENTRIES", "4096"))
+    # Line breaks of paragraphs up to LINE_BREAK_CACHE_MAX_CHARS characters (0 disables).
+    LINE_BREAK_CACHE_MAX_ENTRIES = int(os.getenv("LINE_BREAK_CACHE_MAX_ENTRIES", "8192"))
+    LINE_BREAK_CACHE_MAX_CHARS = int(os.getenv("LINE_BREAK_CACHE_MAX_CHARS", "160"))
+
+    # Profile photo derivative: drawn at PROFILE_PHOTO_INCHES, stored at print DPI.
+    PROFILE_PHOTO_INCHES = 0.95
+    PROFILE_PHOTO_DPI = int(os.getenv("PROFILE_PHOTO_DPI", "300"))
+    PROFILE_PHOTO_JPEG_QUALITY = int(os.getenv("PROFILE_PHOTO_JPEG_QUALITY", "85"))
+    PHOTO_CACHE_MAX_ENTRIES = int(os.getenv("PHOTO_CACHE_MAX_ENTRIES", "256"))
+
+    # "compact" output profile: smaller photo derivative for portals with upload limits.
+    COMPACT_PHOTO_DPI = int(os.getenv("COMPACT_PHOTO_DPI", "150"))
+    COMPACT_PHOTO_JPEG_QUALITY = int(os.getenv("COMPACT_PHOTO_JPEG_QUALITY", "70"))
+    # ASCII85-armoured streams are ~25% larger and only matter for 7-bit transports.
+    PDF_ASCII85 = os.getenv("PDF_ASCII85", "0") == "1"
+    # ATS-safe single-column resumes are drawn straight to the canvas instead of through Platypus.
+    ATS_FAST_RENDER = os.getenv("ATS_FAST_RENDER", "1") == "1"
+
+    # Byte-identical PDFs for identical inputs (fixed dates and document ID); enables strong ETags.
+    DETERMINISTIC_PDF = os.getenv("DETERMINISTIC_PDF", "1") == "1"
+
+    # gunicorn.conf.py preloads the app and runs warmup.warm_up() in the master before forking workers.
+    PREFORK_WARMUP = os.getenv("PREFORK_WARMUP", "1") == "1"
+
+    # Process pool for multi-template exports (0 workers renders in-process).
+    RENDER_POOL_WORKERS = int(os.getenv("RENDER_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+    RENDER_TIMEOUT_SECONDS = float(os.getenv("RENDER_TIMEOUT_SECONDS", "30"))
+
+    # Resume listing (/api/resumes): keyset pages per owner (page size applies when a client
+    # sends ?limit or ?cursor; plain requests get the full list). Resumes saved before owners were
+    # recorded are assigned to LEGACY_RESUME_OWNER_ID (the local/dev user) by the migration.
+    RESUME_LIST_PAGE_SIZE = int(os.getenv("RESUME_LIST_PAGE_SIZE", "100"))
+    RESUME_LIST_MAX_PAGE_SIZE = int(os.getenv("RESUME_LIST_MAX_PAGE_SIZE", "500"))
+    LEGACY_RESUME_OWNER_ID = int(os.getenv("LEGACY_RESUME_OWNER_ID", "1"))
+
+    # Batch rendering of stored resumes (/api/export-batch and "batch_pdf" export jobs).
+    BATCH_RENDER_MAX_RESUMES = int(os.getenv("BATCH_RENDER_MAX_RESUMES", "500"))
+    BATCH_RENDER_LOAD_CHUNK = int(os.getenv("BATCH_RENDER_LOAD_CHUNK", "25"))
+    # A resume book is built as one document, so all of its resumes are held in memory.
+    RESUME_BOOK_MAX_RESUMES = int(os.getenv("RESUME_BOOK_MAX_RESUMES", "50"))
+
+    # Asynchronous export jobs (queue lives in DB_PATH, artifacts in EXPORT_JOB_DIR).
+    EXPORT_JOB_DIR = os.getenv("EXPORT_JOB_DIR", os.path.join("exports", "jobs"))
+    EXPORT_JOB_WORKERS = int(os.getenv("EXPORT_JOB_WORKERS", "2"))
+    EXPORT_JOB_MAX_ATTEMPTS = int(os.getenv("EXPORT_JOB_MAX_ATTEMPTS", "3"))
+    EXPORT_JOB_LEASE_SECONDS = float(os.getenv("EXPORT_JOB_LEASE_SECONDS", "300"))
+    EXPORT_JOB_TTL_SECONDS = float(os.getenv("EXPORT_JOB_TTL_SECONDS", "3600"))
+    EXPORT_JOB_SWEEP_SECONDS = float(os.getenv("EXPORT_JOB_SWEEP_SECONDS", "60"))
+    EXPORT_JOB_USER_CONCURRENCY = int(os.getenv("EXPORT_JOB_USER_CONCURRENCY", "1"))
+    EXPORT_JOB_USER_PENDING_LIMIT = int(os.getenv("EXPORT_JOB_USER_PENDING_LIMIT", "10"))
+    EXPORT_JOB_LONG_POLL_SECONDS = float(os.getenv("EXPORT_JOB_LONG_POLL_SECONDS", "25"))
+
     # PDF templates used by pdf_generator.py
     TEMPLATES: Dict[str, Dict[str, Any]] = {
 
@@ -2,10 +2,12 @@
 Database layer using SQLite with migration support.
 Follows Repository pattern for each entity.
 """
-import sqlite3
+import hashlib
 import json
 from contextlib import contextmanager
-from typing import List, Optional
+from dataclasses import fields
+from functools import lru_cache
+from typing import Dict, List, Optional
 from datetime import datetime
 from models import (
     Resume,
@@ -17,11 +19,139 @@ from models import (
     Achievement,
     Reference,
 )
+from config import AppConfig
+import db_pool
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _blob_hash(data: Optional[bytes]) -> Optional[str]:
+    return hashlib.sha256(data).hexdigest() if data is not None else None
+
+
+# (table, column) pairs that reference blobs.sha256; a blob is deleted once none of them does.
+BLOB_REFERENCES = (("resumes", "profile_pic_hash"), ("user_profiles", "profile_pic_hash"))
+
+
+def image_mimetype(data: bytes) -> Optional[str]:
+    """MIME type of a JPEG/PNG/WebP/GIF image from its magic bytes, else None."""
+    if data.startswith(b"\xff\xd8"):
+        return "image/jpeg"
+    if data.startswith(b"\x89PNG"):
+        return "image/png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    return None
+
+
+def put_blob(conn, data: bytes) -> str:
+    """Store ``data`` once under its SHA-256 and return the hash owners keep as the reference."""
+    sha256 = _blob_hash(data)
+    conn.execute(
+        "INSERT OR IGNORE INTO blobs (sha256, data, mimetype, size, created) VALUES (?, ?, ?, ?, ?)",
+        (sha256, data, image_mimetype(data) or "application/octet-stream", len(data), datetime.now().isoformat()),
+    )
+    return sha256
+
+
+def get_blob(conn, sha256: str):
+    """Row (data, mimetype) of a stored blob, or None."""
+    return conn.execute("SELECT data, mimetype FROM blobs WHERE sha256=?", (sha256,)).fetchone()
+
+
+def release_blob(conn, sha256: Optional[str]) -> None:
+    """Delete a blob that is no longer referenced (call after dropping a reference)."""
+    if not sha256:
+        return
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    for table, column in BLOB_REFERENCES:
+        if table in tables and conn.execute(
+            f'SELECT 1 FROM "{table}" WHERE {column}=? LIMIT 1', (sha256,)
+        ).fetchone():
+            return
+    conn.execute("DELETE FROM blobs WHERE sha256=?", (sha256,))
+
+
+class StoredResume(Resume):
+    """
+    Resume loaded from the database. Its photo stays in the blob table until
+    ``profile_pic`` is first read, so loads that never draw or return it skip
+    the BLOB entirely.
+    """
+
+    def __init__(self, *args, photo_ref: Optional[str] = None, photo_loader=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.photo_ref = photo_ref
+        self._photo_loader = photo_loader if photo_ref else None
+
+    @property
+    def profile_pic(self) -> Optional[bytes]:
+        if self._photo_loader is not None:
+            loader, self._photo_loader = self._photo_loader, None
+            self.__dict__["_profile_pic"] = loader(self.photo_ref)
+        return self.__dict__.get("_profile_pic")
+
+    @profile_pic.setter
+    def profile_pic(self, value: Optional[bytes]) -> None:
+        self.__dict__["_photo_loader"] = None
+        self.__dict__["photo_ref"] = None
+        self.__dict__["_profile_pic"] = value
+
+    def __eq__(self, other):
+        # Equal to a plain Resume with the same fields (the dataclass __eq__ requires the same class).
+        if not isinstance(other, Resume):
+            return NotImplemented
+        names = [f.name for f in fields(Resume)]
+        return [getattr(self, n) for n in names] == [getattr(other, n) for n in names]
+
+    __hash__ = None
+
+    def __getstate__(self):
+        # Pickled copies (render pool workers) carry the photo itself, not the loader.
+        state = dict(self.__dict__)
+        state["_profile_pic"] = self.profile_pic
+        state["_photo_loader"] = None
+        return state
+
+
+def photo_sha256(resume: Resume) -> Optional[str]:
+    """Blob reference of a resume's photo, without loading a lazily stored one."""
+    if isinstance(resume, StoredResume) and resume.photo_ref:
+        return resume.photo_ref
+    return _blob_hash(resume.profile_pic)
+
+
+_RESUME_COLUMNS = (
+    "id", "title", "full_name", "profile_title", "email", "phone", "city", "address", "summary",
+    "profile_pic_hash", "linkedin", "github", "twitter", "website", "qr_link", "custom_sections",
+    "created", "updated",
+)
+
+
+@lru_cache(maxsize=1)
+def _load_resumes_sql() -> str:
+    """
+    SELECT for whole resumes (``{marks}`` = id placeholders): resume columns plus
+    one JSON array per child table. Each array is built by a correlated subquery
+    that walks the (resume_id, sort_order) index, so the cost per resume does not
+    depend on how many resumes are stored; the ordered inner SELECT fixes the
+    element order (SQLite does not flatten an ORDER BY subquery into an aggregate).
+    """
+    children = []
+    for table, columns, _build in Database._CHILD_LOADERS:
+        fields = ", ".join(f"'{column}', c.{column}" for column in columns)
+        children.append(
+            f"(SELECT json_group_array(json_object({fields})) FROM ("
+            f'SELECT {", ".join(columns)} FROM "{table}" WHERE resume_id = r.id ORDER BY sort_order, id'
+            f') AS c) AS "{table}"'
+        )
+    columns = ", ".join([f"r.{column}" for column in _RESUME_COLUMNS] + children)
+    return f"SELECT {columns} FROM resumes r WHERE r.id IN ({{marks}})"
+
+
 class Database:
     def __init__(self, db_path="resume.db"):
         self.db_path = db_path
@@ -29,9 +159,8 @@ class Database:
 
     @contextmanager
     def connect(self):
-        """Provide a transactional scope."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Provide a transactional scope on a pooled connection."""
+        conn = db_pool.connection(self.db_path)
         try:
             yield conn
             conn.commit()
@@ -40,7 +169,7 @@ class Database:
             logger.error(f"Database error: {e}")
             raise
         finally:
-            conn.close()
+            db_pool.release(conn)
 
     def _init_db(self):
         """Create tables if they don't exist (with migration support)."""
@@ -57,13 +186,15 @@ class Database:
                     city TEXT,
                     address TEXT,
                     summary TEXT,
-                    profile_pic BLOB,
+                    profile_pic BLOB,  -- legacy inline photo; images now live in blobs
+                    profile_pic_hash TEXT,
                     linkedin TEXT,
                     github TEXT,
                     twitter TEXT,
                     website TEXT,
                     qr_link TEXT,
                     custom_sections TEXT,
+                    user_id INTEGER,
                     created TIMESTAMP,
                     updated TIMESTAMP
                 )
@@ -196,272 +327,349 @@ class Database:
             self._migrate_add_column(conn, "resumes", "qr_link", "TEXT")
             self._migrate_add_column(conn, "resumes", "custom_sections", "TEXT")
 
+            self._migrate_add_column(conn, "resumes", "profile_pic_hash", "TEXT")
+            if self._migrate_add_column(conn, "resumes", "user_id", "INTEGER"):
+                # Owners were never recorded: hand existing resumes to the legacy owner, and give
+                # rows without a timestamp one so the (updated, id) keyset reaches them.
+                conn.execute("UPDATE resumes SET updated=COALESCE(created, '') WHERE updated IS NULL")
+            # Also catches rows saved without an owner by builds that predate owner defaulting.
+            conn.execute(
+                "UPDATE resumes SET user_id=? WHERE user_id IS NULL", (AppConfig.LEGACY_RESUME_OWNER_ID,)
+            )
+            # Listing: one owner's resumes, newest first (see list_resumes). The key coalesces
+            # NULL timestamps (legacy/imported rows) so they sort and page like any other value.
+            conn.execute("DROP INDEX IF EXISTS idx_resumes_owner_updated")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_resumes_owner_recent ON resumes (user_id, COALESCE(updated, ''), id)"
+            )
+
+            # Images, deduplicated by content; owners keep the SHA-256 (see BLOB_REFERENCES).
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    sha256 TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    mimetype TEXT,
+                    size INTEGER,
+                    created TIMESTAMP
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_resumes_profile_pic_hash ON resumes (profile_pic_hash)")
+            # Move photos stored inline in resumes.profile_pic into the blob table.
+            for row in conn.execute("SELECT id, profile_pic FROM resumes WHERE profile_pic IS NOT NULL").fetchall():
+                conn.execute(
+                    "UPDATE resumes SET profile_pic=NULL, profile_pic_hash=? WHERE id=?",
+                    (put_blob(conn, bytes(row["profile_pic"])), row["id"]),
+                )
+
             # child tables
             self._migrate_add_column(conn, "experiences", "sort_order", "INTEGER")
             self._migrate_add_column(conn, "educations", "sort_order", "INTEGER")
             self._migrate_add_column(conn, "skills", "sort_order", "INTEGER")
             self._migrate_add_column(conn, "achievements", "sort_order", "INTEGER")
             self._migrate_add_column(conn, "references", "sort_order", "INTEGER")
+            self._migrate_add_column(conn, "projects", "sort_order", "INTEGER")
+            self._migrate_add_column(conn, "certifications", "sort_order", "INTEGER")
+            self._migrate_add_column(conn, "languages", "sort_order", "INTEGER")
+
+            # Child rows are always read per resume in sort_order.
+            for table, _columns, _build in self._CHILD_LOADERS:
+                conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS "idx_{table}_resume_sort" ON "{table}" (resume_id, sort_order)'
+                )
 
-    def _migrate_add_column(self, conn, table, column, col_type):
-        """Add column if it doesn't exist."""
+    def _migrate_add_column(self, conn, table, column, col_type) -> bool:
+        """Add column if it doesn't exist; returns True when it was added."""
         quoted_table = f'"{table}"'
         cursor = conn.execute(f"PRAGMA table_info({quoted_table})")
         columns = [row[1] for row in cursor.fetchall()]
         if column not in columns:
             conn.execute(f"ALTER TABLE {quoted_table} ADD COLUMN {column} {col_type}")
             logger.info(f"Added column {column} to {table}")
+            return True
+        return False
 
     # ---------- CRUD for Resume ----------
-    def save_resume(self, resume: Resume) -> int:
-        """Insert or update a resume."""
+    def save_resume(self, resume: Resume, owner_id: Optional[int] = None, keep_photo: bool = False) -> int:
+        """
+        Insert or update a resume. Updates write only what changed against the
+        stored version: the photo reference is kept when its hash matches, and
+        child rows are diffed per section (see _diff_child_rows). New resumes
+        belong to ``owner_id`` (LEGACY_RESUME_OWNER_ID when omitted, e.g. the
+        desktop UI); updates keep the existing owner. ``keep_photo`` leaves the
+        stored photo of an existing resume untouched (the client sent none).
+        """
+        pic_hash = photo_sha256(resume)
+        is_new = resume.id is None
         with self.connect() as conn:
-            if resume.id is None:
+            if is_new:
                 # Insert
+                if pic_hash:
+                    put_blob(conn, resume.profile_pic)
                 cursor = conn.execute("""
                     INSERT INTO resumes (
                         title, full_name, profile_title, email, phone, city, address, summary,
-                        profile_pic, linkedin, github, twitter, website, qr_link, custom_sections,
-                        created, updated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        profile_pic_hash, linkedin, github, twitter, website, qr_link,
+                        custom_sections, user_id, created, updated
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     resume.title or resume.full_name,
                     resume.full_name, resume.profile_title, resume.email, resume.phone,
                     resume.city,
-                    resume.address, resume.summary, resume.profile_pic,
+                    resume.address, resume.summary, pic_hash,
                     resume.linkedin, resume.github, resume.twitter, resume.website,
                     resume.qr_link,
                     json.dumps(resume.custom_sections or []),
+                    AppConfig.LEGACY_RESUME_OWNER_ID if owner_id is None else owner_id,
                     resume.created, resume.updated
                 ))
                 resume.id = cursor.lastrowid
             else:
                 # Update
-                conn.execute("""
+                stored = conn.execute(
+                    "SELECT profile_pic_hash FROM resumes WHERE id=?", (resume.id,)
+                ).fetchone()
+                old_pic_hash = stored["profile_pic_hash"] if stored else None
+                if keep_photo and stored is not None:
+                    pic_hash = old_pic_hash
+                pic_sql, pic_params = "", ()
+                if stored is None or old_pic_hash != pic_hash:
+                    if pic_hash:
+                        put_blob(conn, resume.profile_pic)
+                    pic_sql, pic_params = "profile_pic_hash=?, ", (pic_hash,)
+                conn.execute(f"""
                     UPDATE resumes SET
                         title=?, full_name=?, profile_title=?, email=?, phone=?, city=?, address=?,
-                        summary=?, profile_pic=?, linkedin=?, github=?, twitter=?,
+                        summary=?, {pic_sql}linkedin=?, github=?, twitter=?,
                         website=?, qr_link=?, custom_sections=?, updated=?
                     WHERE id=?
                 """, (
                     resume.title or resume.full_name,
                     resume.full_name, resume.profile_title, resume.email, resume.phone,
                     resume.city,
-                    resume.address, resume.summary, resume.profile_pic,
+                    resume.address, resume.summary, *pic_params,
                     resume.linkedin, resume.github, resume.twitter, resume.website,
                     resume.qr_link,
                     json.dumps(resume.custom_sections or []),
                     resume.updated, resume.id
                 ))
-                # Delete existing child records
-                conn.execute("DELETE FROM experiences WHERE resume_id=?", (resume.id,))
-                conn.execute("DELETE FROM educations WHERE resume_id=?", (resume.id,))
-                conn.execute("DELETE FROM projects WHERE resume_id=?", (resume.id,))
-                conn.execute("DELETE FROM certifications WHERE resume_id=?", (resume.id,))
-                conn.execute("DELETE FROM languages WHERE resume_id=?", (resume.id,))
-                conn.execute("DELETE FROM skills WHERE resume_id=?", (resume.id,))
-                conn.execute("DELETE FROM achievements WHERE resume_id=?", (resume.id,))
-                conn.execute('DELETE FROM "references" WHERE resume_id=?', (resume.id,))
-
-            # Insert child records with sort_order
-            for idx, exp in enumerate(resume.experiences):
-                conn.execute("""
-                    INSERT INTO experiences (
-                        resume_id, job_title, company, start_date, end_date,
-                        description, sort_order
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (resume.id, exp.job_title, exp.company, exp.start_date,
-                      exp.end_date, exp.description, idx))
-
-            for idx, edu in enumerate(resume.educations):
-                conn.execute("""
-                    INSERT INTO educations (
-                        resume_id, degree, institution, start_date, end_date,
-                        description, sort_order
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (resume.id, edu.degree, edu.institution, edu.start_date,
-                      edu.end_date, edu.description, idx))
-
-            for idx, proj in enumerate(resume.projects):
-                conn.execute("""
-                    INSERT INTO projects (
-                        resume_id, name, role, technologies, start_date, end_date,
-                        description, link, sort_order
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (resume.id, proj.name, proj.role, proj.technologies,
-                      proj.start_date, proj.end_date, proj.description,
-                      proj.link, idx))
-
-            for idx, cert in enumerate(resume.certifications):
-                conn.execute("""
-                    INSERT INTO certifications (
-                        resume_id, name, issuer, date, link, sort_order
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                """, (resume.id, cert.name, cert.issuer, cert.date,
-                      cert.link, idx))
-
-            for idx, lang in enumerate(resume.languages):
-                conn.execute("""
-                    INSERT INTO languages (
-                        resume_id, name, proficiency, sort_order
-                    ) VALUES (?, ?, ?, ?)
-                """, (resume.id, lang.name, lang.proficiency, idx))
-
-            for idx, skill in enumerate(resume.skills):
-                conn.execute("""
-                    INSERT INTO skills (
-                        resume_id, skill_name, sort_order
-                    ) VALUES (?, ?, ?)
-                """, (resume.id, skill, idx))
-
-            for idx, ach in enumerate(resume.achievements):
-                conn.execute("""
-                    INSERT INTO achievements (
-                        resume_id, title, subtitle, description, sort_order
-                    ) VALUES (?, ?, ?, ?, ?)
-                """, (resume.id, ach.title, ach.subtitle, ach.description, idx))
-
-            for idx, ref in enumerate(resume.references):
-                conn.execute("""
-                    INSERT INTO "references" (
-                        resume_id, name, title, company, phone, email, website, sort_order
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    resume.id, ref.name, ref.title, ref.company, ref.phone, ref.email, ref.website, idx
-                ))
+                if old_pic_hash != pic_hash:
+                    release_blob(conn, old_pic_hash)
+
+            for table, columns, _build in self._CHILD_LOADERS:
+                values = [
+                    (item,) if table == "skills" else tuple(getattr(item, column) for column in columns)
+                    for item in getattr(resume, table)
+                ]
+                stored_rows = []
+                if not is_new:
+                    stored_rows = conn.execute(f"""
+                        SELECT id, sort_order, {", ".join(columns)} FROM "{table}"
+                        WHERE resume_id=? ORDER BY sort_order, id
+                    """, (resume.id,)).fetchall()
+                reorders, updates, inserts, deletes = self._diff_child_rows(stored_rows, values)
+                if reorders:
+                    conn.executemany(f'UPDATE "{table}" SET sort_order=? WHERE id=?', reorders)
+                if updates:
+                    assignments = "".join(f"{column}=?, " for column in columns)
+                    conn.executemany(f'UPDATE "{table}" SET {assignments}sort_order=? WHERE id=?', updates)
+                if inserts:
+                    marks = ", ".join("?" * (len(columns) + 2))
+                    conn.executemany(
+                        f'INSERT INTO "{table}" (resume_id, {", ".join(columns)}, sort_order) VALUES ({marks})',
+                        [(resume.id, *row, idx) for idx, row in inserts],
+                    )
+                if deletes:
+                    conn.executemany(f'DELETE FROM "{table}" WHERE id=?', deletes)
 
             return resume.id
 
+    @staticmethod
+    def _diff_child_rows(stored_rows, values):
+        """
+        Match a section's new values against its stored rows (id, sort_order, *columns).
+        Rows whose content reappears are kept and at most get a new sort_order; the
+        remaining rows are rewritten in place with the remaining values, and only the
+        surplus is inserted or deleted. Returns executemany parameter lists:
+        (reorders, updates, inserts as (sort_order, values), deletes).
+        """
+        by_content: Dict[tuple, List] = {}
+        for row in stored_rows:
+            by_content.setdefault(tuple(row)[2:], []).append(row)
+        kept = set()
+        reorders, pending = [], []
+        for idx, row_values in enumerate(values):
+            candidates = by_content.get(row_values)
+            if candidates:
+                row = candidates.pop(0)
+                kept.add(row[0])
+                if row[1] != idx:
+                    reorders.append((idx, row[0]))
+            else:
+                pending.append((idx, row_values))
+        spare = [row[0] for row in stored_rows if row[0] not in kept]
+        updates = [(*row_values, idx, row_id) for (idx, row_values), row_id in zip(pending, spare)]
+        inserts = pending[len(spare):]
+        deletes = [(row_id,) for row_id in spare[len(pending):]]
+        return reorders, updates, inserts, deletes
+
     def get_resume(self, resume_id: int) -> Optional[Resume]:
         """Load a complete resume by ID."""
+        return self.get_resumes([resume_id]).get(resume_id)
+
+    def get_resumes(self, resume_ids: List[int], owner_id: Optional[int] = None) -> Dict[int, Resume]:
+        """
+        Load complete resumes by ID in one query: each child table arrives as a
+        JSON array aggregated per resume (see _load_resumes_sql). Photos are
+        fetched from the blob table on first access (StoredResume).
+        IDs that do not exist, or (with ``owner_id``) belong to someone else,
+        are simply absent from the returned mapping.
+        """
+        ids = list(dict.fromkeys(int(i) for i in resume_ids))
+        resumes: Dict[int, Resume] = {}
         with self.connect() as conn:
-            row = conn.execute("SELECT * FROM resumes WHERE id=?", (resume_id,)).fetchone()
-            if not row:
-                return None
-
-            resume = Resume(
-                id=row['id'],
-                title=row['title'],
-                created=datetime.fromisoformat(row['created']) if row['created'] else datetime.now(),
-                updated=datetime.fromisoformat(row['updated']) if row['updated'] else datetime.now(),
-                full_name=row['full_name'] or "",
-                profile_title=row['profile_title'] or "",
-                email=row['email'] or "",
-                phone=row['phone'] or "",
-                city=row['city'] or "",
-                address=row['address'] or "",
-                summary=row['summary'] or "",
-                profile_pic=row['profile_pic'],
-                linkedin=row['linkedin'] or "",
-                github=row['github'] or "",
-                twitter=row['twitter'] or "",
-                website=row['website'] or "",
-                qr_link=row['qr_link'] or "",
-                custom_sections=json.loads(row['custom_sections']) if row['custom_sections'] else []
-            )
-
-            # Load experiences
-            rows = conn.execute("""
-                SELECT * FROM experiences WHERE resume_id=? ORDER BY sort_order
-            """, (resume_id,)).fetchall()
-            resume.experiences = [
-                Experience(
-                    job_title=r['job_title'] or "",
-                    company=r['company'] or "",
-                    start_date=r['start_date'] or "",
-                    end_date=r['end_date'] or "",
-                    description=r['description'] or ""
-                ) for r in rows
-            ]
-
-            # Load educations
-            rows = conn.execute("""
-                SELECT * FROM educations WHERE resume_id=? ORDER BY sort_order
-            """, (resume_id,)).fetchall()
-            resume.educations = [
-                Education(
-                    degree=r['degree'] or "",
-                    institution=r['institution'] or "",
-                    start_date=r['start_date'] or "",
-                    end_date=r['end_date'] or "",
-                    description=r['description'] or ""
-                ) for r in rows
-            ]
-
-            # Load projects
-            rows = conn.execute("""
-                SELECT * FROM projects WHERE resume_id=? ORDER BY sort_order
-            """, (resume_id,)).fetchall()
-            resume.projects = [
-                Project(
-                    name=r['name'] or "",
-                    role=r['role'] or "",
-                    technologies=r['technologies'] or "",
-                    start_date=r['start_date'] or "",
-                    end_date=r['end_date'] or "",
-                    description=r['description'] or "",
-                    link=r['link'] or ""
-                ) for r in rows
-            ]
-
-            # Load certifications
-            rows = conn.execute("""
-                SELECT * FROM certifications WHERE resume_id=? ORDER BY sort_order
-            """, (resume_id,)).fetchall()
-            resume.certifications = [
-                Certification(
-                    name=r['name'] or "",
-                    issuer=r['issuer'] or "",
-                    date=r['date'] or "",
-                    link=r['link'] or ""
-                ) for r in rows
-            ]
-
-            # Load languages
-            rows = conn.execute("""
-                SELECT * FROM languages WHERE resume_id=? ORDER BY sort_order
-            """, (resume_id,)).fetchall()
-            resume.languages = [
-                Language(
-                    name=r['name'] or "",
-                    proficiency=r['proficiency'] or "Fluent"
-                ) for r in rows
-            ]
-
-            # Load skills
-            rows = conn.execute("""
-                SELECT skill_name FROM skills WHERE resume_id=? ORDER BY sort_order
-            """, (resume_id,)).fetchall()
-            resume.skills = [r['skill_name'] for r in rows if r['skill_name']]
-
-            # Load achievements
-            rows = conn.execute("""
-                SELECT * FROM achievements WHERE resume_id=? ORDER BY sort_order
-            """, (resume_id,)).fetchall()
-            resume.achievements = [
-                Achievement(
-                    title=r['title'] or "",
-                    subtitle=r['subtitle'] or "",
-                    description=r['description'] or ""
-                ) for r in rows
-            ]
-
-            # Load references
-            rows = conn.execute("""
-                SELECT * FROM "references" WHERE resume_id=? ORDER BY sort_order
-            """, (resume_id,)).fetchall()
-            resume.references = [
-                Reference(
-                    name=r['name'] or "",
-                    title=r['title'] or "",
-                    company=r['company'] or "",
-                    phone=r['phone'] or "",
-                    email=r['email'] or "",
-                    website=r['website'] or ""
-                ) for r in rows
-            ]
-
-            return resume
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                sql, params = _load_resumes_sql().format(marks=marks), list(chunk)
+                if owner_id is not None:
+                    sql += " AND r.user_id = ?"
+                    params.append(owner_id)
+                for row in conn.execute(sql, params):
+                    resume = StoredResume(
+                        id=row['id'],
+                        title=row['title'],
+                        created=datetime.fromisoformat(row['created']) if row['created'] else datetime.now(),
+                        updated=datetime.fromisoformat(row['updated']) if row['updated'] else datetime.now(),
+                        full_name=row['full_name'] or "",
+                        profile_title=row['profile_title'] or "",
+                        email=row['email'] or "",
+                        phone=row['phone'] or "",
+                        city=row['city'] or "",
+                        address=row['address'] or "",
+                        summary=row['summary'] or "",
+                        linkedin=row['linkedin'] or "",
+                        github=row['github'] or "",
+                        twitter=row['twitter'] or "",
+                        website=row['website'] or "",
+                        qr_link=row['qr_link'] or "",
+                        custom_sections=json.loads(row['custom_sections']) if row['custom_sections'] else [],
+                        photo_ref=row['profile_pic_hash'],
+                        photo_loader=self.get_photo_bytes,
+                    )
+                    for table, _columns, build in self._CHILD_LOADERS:
+                        items = getattr(resume, table)
+                        for r in json.loads(row[table]):
+                            item = build(r)
+                            if item:
+                                items.append(item)
+                    resumes[resume.id] = resume
+        return resumes
+
+    # (table, columns, builder) triples; each table's rows land in the Resume list of the same name,
+    # and save_resume writes the model attributes of the same names (skills are plain strings).
+    _CHILD_LOADERS = (
+        ("experiences", ("job_title", "company", "start_date", "end_date", "description"), lambda r: Experience(
+            job_title=r['job_title'] or "",
+            company=r['company'] or "",
+            start_date=r['start_date'] or "",
+            end_date=r['end_date'] or "",
+            description=r['description'] or ""
+        )),
+        ("educations", ("degree", "institution", "start_date", "end_date", "description"), lambda r: Education(
+            degree=r['degree'] or "",
+            institution=r['institution'] or "",
+            start_date=r['start_date'] or "",
+            end_date=r['end_date'] or "",
+            description=r['description'] or ""
+        )),
+        ("projects", ("name", "role", "technologies", "start_date", "end_date", "description", "link"), lambda r: Project(
+            name=r['name'] or "",
+            role=r['role'] or "",
+            technologies=r['technologies'] or "",
+            start_date=r['start_date'] or "",
+            end_date=r['end_date'] or "",
+            description=r['description'] or "",
+            link=r['link'] or ""
+        )),
+        ("certifications", ("name", "issuer", "date", "link"), lambda r: Certification(
+            name=r['name'] or "",
+            issuer=r['issuer'] or "",
+            date=r['date'] or "",
+            link=r['link'] or ""
+        )),
+        ("languages", ("name", "proficiency"), lambda r: Language(
+            name=r['name'] or "",
+            proficiency=r['proficiency'] or "Fluent"
+        )),
+        ("skills", ("skill_name",), lambda r: r['skill_name']),
+        ("achievements", ("title", "subtitle", "description"), lambda r: Achievement(
+            title=r['title'] or "",
+            subtitle=r['subtitle'] or "",
+            description=r['description'] or ""
+        )),
+        ("references", ("name", "title", "company", "phone", "email", "website"), lambda r: Reference(
+            name=r['name'] or "",
+            title=r['title'] or "",
+            company=r['company'] or "",
+            phone=r['phone'] or "",
+            email=r['email'] or "",
+            website=r['website'] or ""
+        )),
+    )
+
+    def get_photo(self, sha256: str) -> Optional[tuple]:
+        """(data, mimetype) of a stored image, or None."""
+        with self.connect() as conn:
+            row = get_blob(conn, sha256)
+        return (row["data"], row["mimetype"]) if row else None
+
+    def get_photo_bytes(self, sha256: str) -> Optional[bytes]:
+        photo = self.get_photo(sha256)
+        return photo[0] if photo else None
+
+    def list_resumes(
+        self,
+        owner_id: int,
+        limit: Optional[int],
+        after: Optional[tuple] = None,
+        title_prefix: str = "",
+    ) -> tuple:
+        """
+        One page of an owner's resume summaries, newest first. ``after`` is the
+        (updated, id) key of the previous page's last item; returns (items, key
+        for the next page or None); ``limit=None`` returns every match on one
+        page. Rows without a timestamp sort as "" (oldest). Each page is a range
+        scan of the (user_id, COALESCE(updated, ''), id) index, so its cost does
+        not grow with the table.
+        """
+        sql = "SELECT id, title, full_name, updated FROM resumes WHERE user_id = ?"
+        params: list = [owner_id]
+        if after is not None:
+            # (key, id) < (?, ?), spelled out so SQLite range-scans the expression index.
+            sql += " AND COALESCE(updated, '') <= ? AND (COALESCE(updated, '') < ? OR id < ?)"
+            params.extend((after[0], after[0], after[1]))
+        if title_prefix:
+            escaped = title_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql += " AND title LIKE ? ESCAPE '\\'"
+            params.append(escaped + "%")
+        sql += " ORDER BY COALESCE(updated, '') DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit + 1)
+        with self.connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        next_key = None
+        if limit is not None and len(rows) > limit:
+            next_key = (rows[limit - 1]["updated"] or "", rows[limit - 1]["id"])
+            rows = rows[:limit]
+        items = []
+        for row in rows:
+            item = dict(row)
+            item["title"] = item.get("title") or item.get("full_name") or "Untitled"
+            item["updated"] = item.get("updated") or ""
+            items.append(item)
+        return items, next_key
 
     def get_all_resumes(self) -> List[dict]:
         """Return list of resume summaries for the list view."""
@@ -481,7 +689,10 @@ class Database:
     def delete_resume(self, resume_id: int):
         """Delete a resume (cascade)."""
         with self.connect() as conn:
+            row = conn.execute("SELECT profile_pic_hash FROM resumes WHERE id=?", (resume_id,)).fetchone()
             conn.execute("DELETE FROM resumes WHERE id=?", (resume_id,))
+            if row:
+                release_blob(conn, row["profile_pic_hash"])
 
     # ---------- Compatibility helpers for dict-based UI ----------
     def _resume_to_dict(self, resume: Resume) -> dict:
@@ -528,15 +739,15 @@ class Database:
         resume.custom_sections = list(data.get("custom_sections", []))
         return resume
 
-    def create_resume(self, data: dict) -> int:
+    def create_resume(self, data: dict, owner_id: Optional[int] = None) -> int:
         """Compatibility API for dict-based UI: create and return resume id."""
         resume = self._dict_to_resume(data)
-        return self.save_resume(resume)
+        return self.save_resume(resume, owner_id=owner_id)
 
-    def update_resume(self, resume_id: int, data: dict):
+    def update_resume(self, resume_id: int, data: dict, owner_id: Optional[int] = None):
         """Compatibility API for dict-based UI: update an existing resume."""
         resume = self._dict_to_resume(data, resume_id=resume_id)
-        self.save_resume(resume)
+        self.save_resume(resume, owner_id=owner_id)
 
     def get_resume_data(self, resume_id: int) -> Optional[dict]:
         """Compatibility API for dict-based UI: fetch a resume as dict."""
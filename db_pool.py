@@ -0,0 +1,193 @@
+"""
+Per-thread pool of tuned SQLite connections shared by the Database layer and
+the auth/audit helpers in app.py.
+
+Connections are leased with ``connection(db_path)`` and used as
+``with conn: ...`` (commit or rollback on exit, as with plain sqlite3); leaving
+the block hands the connection back to the calling thread's idle list instead
+of closing it, so a request thread reuses one warm connection (page cache,
+prepared statements) across the render, audit and score-history writes.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from typing import Dict, List, Optional
+
+from config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that returns to its pool when its ``with`` block ends."""
+
+    _pool: Optional["ConnectionPool"] = None
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            return super().__exit__(exc_type, exc, tb)
+        finally:
+            if self._pool is not None:
+                self._pool.release(self)
+
+
+class ConnectionPool:
+    """
+    Idle connections are kept per thread (sqlite3 connections are not shared
+    between threads); a nested lease on the same thread gets its own
+    connection, so inner commits never end an outer transaction early.
+    """
+
+    def __init__(self, db_path: str, max_idle_per_thread: int):
+        self.db_path = db_path
+        self.max_idle_per_thread = max(0, int(max_idle_per_thread))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all: "weakref.WeakSet[PooledConnection]" = weakref.WeakSet()
+        self._pid = os.getpid()
+        self.opened = 0
+        self.reused = 0
+        self.closed = 0
+
+    def _idle(self) -> List[PooledConnection]:
+        if self._pid != os.getpid():
+            # Forked child: connections opened by the parent must not be used (or closed) here.
+            with self._lock:
+                self._local = threading.local()
+                self._all = weakref.WeakSet()
+                self._pid = os.getpid()
+        idle = getattr(self._local, "idle", None)
+        if idle is None:
+            idle = self._local.idle = []
+        return idle
+
+    def _open(self) -> PooledConnection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=AppConfig.SQLITE_BUSY_TIMEOUT_MS / 1000.0,
+            factory=PooledConnection,
+            cached_statements=AppConfig.SQLITE_STATEMENT_CACHE_SIZE,
+            check_same_thread=False,  # only the pre-fork hook touches another thread's connection
+        )
+        conn.row_factory = sqlite3.Row
+        journal_mode = AppConfig.SQLITE_JOURNAL_MODE
+        if journal_mode:
+            mode = conn.execute(f"PRAGMA journal_mode={journal_mode}").fetchone()[0]
+            if str(mode).lower() != journal_mode.lower():
+                logger.warning("SQLite journal_mode %s not applied to %s (got %s)", journal_mode, self.db_path, mode)
+        conn.execute(f"PRAGMA synchronous={AppConfig.SQLITE_SYNCHRONOUS}")
+        conn.execute(f"PRAGMA busy_timeout={int(AppConfig.SQLITE_BUSY_TIMEOUT_MS)}")
+        conn.execute(f"PRAGMA mmap_size={int(AppConfig.SQLITE_MMAP_SIZE)}")
+        # Negative cache_size is in KiB rather than pages.
+        conn.execute(f"PRAGMA cache_size=-{int(AppConfig.SQLITE_CACHE_SIZE_KB)}")
+        conn._pool = self
+        with self._lock:
+            self._all.add(conn)
+            self.opened += 1
+        return conn
+
+    def lease(self) -> PooledConnection:
+        idle = self._idle()
+        if idle:
+            conn = idle.pop()
+            conn._pool = self
+            with self._lock:
+                self.reused += 1
+            return conn
+        return self._open()
+
+    def release(self, conn: PooledConnection) -> None:
+        if conn._pool is not self:
+            return  # already released (e.g. a second ``with`` on the same lease)
+        conn._pool = None
+        if conn.in_transaction:
+            conn.rollback()
+        idle = self._idle()
+        if len(idle) < self.max_idle_per_thread:
+            idle.append(conn)
+        else:
+            self._close(conn)
+
+    def _close(self, conn: PooledConnection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            logger.debug("Closing pooled SQLite connection failed", exc_info=True)
+        with self._lock:
+            self._all.discard(conn)
+            self.closed += 1
+
+    def close_idle(self) -> None:
+        """Close every idle connection of every thread (leased ones are left alone)."""
+        if self._pid != os.getpid():
+            return
+        with self._lock:
+            idle = [conn for conn in self._all if conn._pool is None]
+            self._local = threading.local()
+        for conn in idle:
+            self._close(conn)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            open_connections = len(self._all)
+            opened, reused, closed = self.opened, self.reused, self.closed
+        leases = opened + reused
+        return {
+            "db_path": self.db_path,
+            "open_connections": open_connections,
+            "opened": opened,
+            "reused": reused,
+            "closed": closed,
+            "reuse_rate": round(reused / leases, 4) if leases else 0.0,
+        }
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = ConnectionPool(db_path, AppConfig.SQLITE_POOL_MAX_IDLE_PER_THREAD)
+        return pool
+
+
+def connection(db_path: str) -> sqlite3.Connection:
+    """Lease a connection to ``db_path``; with SQLITE_POOL=0 every call opens a plain one."""
+    if not AppConfig.SQLITE_POOL:
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+    return get_pool(db_path).lease()
+
+
+def release(conn: sqlite3.Connection) -> None:
+    """Hand back a connection from ``connection()`` outside a ``with`` block (closes unpooled ones)."""
+    pool = getattr(conn, "_pool", None)
+    if pool is not None:
+        pool.release(conn)
+    elif not isinstance(conn, PooledConnection):
+        conn.close()
+
+
+def close_idle_connections() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_idle()
+
+
+def pool_stats() -> List[Dict[str, object]]:
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.stats() for pool in pools]
+
+
+# SQLite connections must not cross fork(): close idle ones first (gunicorn preload forks
+# workers from a master that opened connections while importing the app).
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=close_idle_connections)
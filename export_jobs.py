@@ -0,0 +1,379 @@
+"""
+SQLite-backed export job queue. Requests enqueue export work, a small pool of
+worker threads renders it to files on disk, and clients poll (or long-poll) the
+job status and download the finished artifact.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import db_pool
+from config import AppConfig
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = {"done", "failed", "expired"}
+
+# kind -> handler(payload) returning (chunks, download_name, mimetype).
+_handlers: Dict[str, Callable[[dict], Tuple[Iterable[bytes], str, str]]] = {}
+_workers: List[threading.Thread] = []
+_workers_lock = threading.Lock()
+# Wakes idle workers on enqueue and long-polling clients on completion (same process).
+_changed = threading.Condition()
+_last_sweep = 0.0
+# The job a worker thread is currently running, for report_progress().
+_current = threading.local()
+
+
+class JobLimitError(Exception):
+    """Raised when a user already has EXPORT_JOB_USER_PENDING_LIMIT unfinished jobs."""
+
+
+class LeaseLostError(Exception):
+    """The running job's lease expired and another worker claimed it; this attempt must stop."""
+
+
+def register_handler(kind: str, handler: Callable[[dict], Tuple[Iterable[bytes], str, str]]) -> None:
+    """
+    Register the renderer for a job kind. Handlers raise ValueError for bad input
+    (the job fails without retrying); any other exception is retried.
+    """
+    _handlers[kind] = handler
+
+
+def _conn():
+    return db_pool.connection(AppConfig.DB_PATH)
+
+
+def init_db() -> None:
+    with _conn() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS export_jobs (
+                id TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                error TEXT,
+                artifact_path TEXT,
+                artifact_name TEXT,
+                mimetype TEXT,
+                size INTEGER,
+                created REAL NOT NULL,
+                available_at REAL NOT NULL,
+                started REAL,
+                lease_until REAL,
+                finished REAL,
+                expires_at REAL,
+                progress_done INTEGER,
+                progress_total INTEGER
+            )
+        """)
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(export_jobs)")}
+        for column in ("progress_done", "progress_total"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE export_jobs ADD COLUMN {column} INTEGER")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_export_jobs_status ON export_jobs (status, available_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_export_jobs_user ON export_jobs (user_id, status)")
+
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat() if ts else None
+
+
+def _job_dict(row: sqlite3.Row) -> dict:
+    return {
+        "id": row["id"],
+        "kind": row["kind"],
+        "status": row["status"],
+        "attempts": row["attempts"],
+        "max_attempts": row["max_attempts"],
+        "error": row["error"],
+        "download_name": row["artifact_name"],
+        "size": row["size"],
+        "progress": (
+            {"done": row["progress_done"], "total": row["progress_total"]}
+            if row["progress_total"] is not None else None
+        ),
+        "created": _iso(row["created"]),
+        "started": _iso(row["started"]),
+        "finished": _iso(row["finished"]),
+        "expires_at": _iso(row["expires_at"]),
+    }
+
+
+def _notify() -> None:
+    with _changed:
+        _changed.notify_all()
+
+
+def enqueue(user_id: int, kind: str, payload: dict) -> dict:
+    if kind not in _handlers:
+        raise ValueError(f"Unknown export kind: {kind}")
+    now = time.time()
+    job_id = uuid.uuid4().hex
+    with _conn() as conn:
+        pending = conn.execute(
+            "SELECT COUNT(*) FROM export_jobs WHERE user_id = ? AND status IN ('queued', 'running')",
+            (user_id,),
+        ).fetchone()[0]
+        if pending >= AppConfig.EXPORT_JOB_USER_PENDING_LIMIT:
+            raise JobLimitError(f"Too many export jobs in progress ({pending}); try again when one finishes")
+        conn.execute(
+            """
+            INSERT INTO export_jobs (id, user_id, kind, payload, max_attempts, created, available_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (job_id, user_id, kind, json.dumps(payload), AppConfig.EXPORT_JOB_MAX_ATTEMPTS, now, now),
+        )
+        row = conn.execute("SELECT * FROM export_jobs WHERE id = ?", (job_id,)).fetchone()
+    ensure_workers()
+    _notify()
+    return _job_dict(row)
+
+
+def _get_row(job_id: str, user_id: int) -> Optional[sqlite3.Row]:
+    with _conn() as conn:
+        return conn.execute(
+            "SELECT * FROM export_jobs WHERE id = ? AND user_id = ?", (job_id, user_id)
+        ).fetchone()
+
+
+def get_job(job_id: str, user_id: int) -> Optional[dict]:
+    row = _get_row(job_id, user_id)
+    return _job_dict(row) if row else None
+
+
+def wait_for_job(job_id: str, user_id: int, timeout: float) -> Optional[dict]:
+    """Long-poll: return once the job reaches a terminal status or ``timeout`` seconds pass."""
+    ensure_workers()
+    deadline = time.monotonic() + max(0.0, min(timeout, AppConfig.EXPORT_JOB_LONG_POLL_SECONDS))
+    while True:
+        job = get_job(job_id, user_id)
+        remaining = deadline - time.monotonic()
+        if job is None or job["status"] in TERMINAL_STATUSES or remaining <= 0:
+            return job
+        # Short waits so jobs finished by other server processes are still picked up.
+        with _changed:
+            _changed.wait(min(0.5, remaining))
+
+
+def get_artifact(job_id: str, user_id: int) -> Tuple[Optional[dict], Optional[str], Optional[str]]:
+    """Return (job, path, mimetype); path is None unless the job is done and its file still exists."""
+    row = _get_row(job_id, user_id)
+    if row is None:
+        return None, None, None
+    path = row["artifact_path"]
+    if row["status"] != "done" or not path or not os.path.exists(path):
+        return _job_dict(row), None, None
+    return _job_dict(row), path, row["mimetype"]
+
+
+def ensure_workers() -> None:
+    """Start the worker threads in this process (lazily, so forked servers each get their own)."""
+    with _workers_lock:
+        _workers[:] = [t for t in _workers if t.is_alive()]
+        while len(_workers) < AppConfig.EXPORT_JOB_WORKERS:
+            worker = threading.Thread(target=_worker_loop, name=f"export-job-{len(_workers)}", daemon=True)
+            worker.start()
+            _workers.append(worker)
+
+
+def _claim() -> Optional[sqlite3.Row]:
+    """
+    Atomically take the oldest runnable job: queued and due, or running with an
+    expired lease (its worker died). Users already at EXPORT_JOB_USER_CONCURRENCY
+    running jobs are skipped so one user cannot occupy every worker.
+    """
+    now = time.time()
+    with _conn() as conn:
+        return conn.execute(
+            """
+            UPDATE export_jobs
+            SET status = 'running', attempts = attempts + 1, started = ?, lease_until = ?
+            WHERE id = (
+                SELECT j.id FROM export_jobs j
+                WHERE ((j.status = 'queued' AND j.available_at <= ?)
+                       OR (j.status = 'running' AND j.lease_until < ?))
+                  AND (
+                      SELECT COUNT(*) FROM export_jobs r
+                      WHERE r.user_id = j.user_id AND r.status = 'running' AND r.lease_until >= ?
+                  ) < ?
+                ORDER BY j.created
+                LIMIT 1
+            )
+            RETURNING *
+            """,
+            (now, now + AppConfig.EXPORT_JOB_LEASE_SECONDS, now, now, now, AppConfig.EXPORT_JOB_USER_CONCURRENCY),
+        ).fetchone()
+
+
+def _renew_lease(force: bool = False) -> None:
+    """
+    Extend the lease of the job running on this thread once a third of it has
+    passed, so long exports are not reclaimed by another worker. Raises
+    LeaseLostError when the job no longer belongs to this attempt.
+    """
+    job_id = getattr(_current, "job_id", None)
+    if job_id is None:
+        return
+    now = time.monotonic()
+    if not force and now - _current.renewed_at < AppConfig.EXPORT_JOB_LEASE_SECONDS / 3:
+        return
+    with _conn() as conn:
+        renewed = conn.execute(
+            "UPDATE export_jobs SET lease_until = ? WHERE id = ? AND attempts = ? AND status = 'running'",
+            (time.time() + AppConfig.EXPORT_JOB_LEASE_SECONDS, job_id, _current.attempt),
+        ).rowcount
+    if not renewed:
+        raise LeaseLostError(f"Export job {job_id} attempt {_current.attempt} lost its lease")
+    _current.renewed_at = now
+
+
+def _write_artifact(job_id: str, attempt: int, download_name: str, chunks: Iterable[bytes]) -> Tuple[str, int]:
+    job_dir = os.path.abspath(AppConfig.EXPORT_JOB_DIR)
+    os.makedirs(job_dir, exist_ok=True)
+    ext = os.path.splitext(download_name)[1] or ".bin"
+    # Per-attempt names: a reclaimed job's old worker never writes over the new attempt's file.
+    path = os.path.join(job_dir, f"{job_id}.{attempt}{ext}")
+    tmp_path = f"{path}.part"
+    size = 0
+    try:
+        with open(tmp_path, "wb") as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+                size += len(chunk)
+                _renew_lease()
+        _renew_lease(force=True)
+    except BaseException:
+        _remove_file(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+    return path, size
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def current_user_id() -> Optional[int]:
+    """Owner of the job running on this thread (None outside a job); handlers scope data access by it."""
+    return getattr(_current, "user_id", None) if getattr(_current, "job_id", None) else None
+
+
+def report_progress(done: int, total: int) -> None:
+    """
+    Record progress of the job running on this thread (no-op outside a job) and
+    keep its lease alive. Writes are throttled; the final item (done == total)
+    is always recorded.
+    """
+    job_id = getattr(_current, "job_id", None)
+    if job_id is None:
+        return
+    _renew_lease()
+    now = time.monotonic()
+    if done < total and now - getattr(_current, "progress_at", 0.0) < 0.5:
+        return
+    _current.progress_at = now
+    with _conn() as conn:
+        conn.execute(
+            "UPDATE export_jobs SET progress_done = ?, progress_total = ? WHERE id = ? AND attempts = ?",
+            (done, total, job_id, _current.attempt),
+        )
+    _notify()
+
+
+def _run(job: sqlite3.Row) -> None:
+    job_id, attempt = job["id"], job["attempts"]
+    _current.job_id, _current.attempt, _current.user_id = job_id, attempt, job["user_id"]
+    _current.progress_at, _current.renewed_at = 0.0, time.monotonic()
+    # Status updates only apply while the job still belongs to this attempt.
+    owned = "WHERE id = ? AND attempts = ? AND status = 'running'"
+    try:
+        chunks, download_name, mimetype = _handlers[job["kind"]](json.loads(job["payload"]))
+        path, size = _write_artifact(job_id, attempt, download_name, chunks)
+    except LeaseLostError as e:
+        logger.warning("%s; abandoning it", e)
+        return
+    except Exception as e:
+        permanent = isinstance(e, (ValueError, KeyError)) or attempt >= job["max_attempts"]
+        logger.warning("Export job %s attempt %s failed: %s", job_id, attempt, e, exc_info=not permanent)
+        with _conn() as conn:
+            if permanent:
+                conn.execute(
+                    f"UPDATE export_jobs SET status = 'failed', error = ?, finished = ?, lease_until = NULL {owned}",
+                    (str(e), time.time(), job_id, attempt),
+                )
+            else:
+                # Exponential backoff between attempts: 2s, 4s, 8s, ...
+                retry_at = time.time() + 2 ** attempt
+                conn.execute(
+                    f"UPDATE export_jobs SET status = 'queued', error = ?, available_at = ?, lease_until = NULL {owned}",
+                    (str(e), retry_at, job_id, attempt),
+                )
+        _notify()
+        return
+    finally:
+        _current.job_id = None
+
+    now = time.time()
+    with _conn() as conn:
+        finished = conn.execute(
+            f"""
+            UPDATE export_jobs
+            SET status = 'done', error = NULL, artifact_path = ?, artifact_name = ?, mimetype = ?, size = ?,
+                finished = ?, expires_at = ?, lease_until = NULL
+            {owned}
+            """,
+            (path, download_name, mimetype, size, now, now + AppConfig.EXPORT_JOB_TTL_SECONDS, job_id, attempt),
+        ).rowcount
+    if not finished:
+        logger.warning("Export job %s attempt %s finished after losing its lease; discarding it", job_id, attempt)
+        _remove_file(path)
+    _notify()
+
+
+def _sweep_expired() -> None:
+    """Delete artifacts past their expiry and mark their jobs expired."""
+    now = time.time()
+    with _conn() as conn:
+        rows = conn.execute(
+            "SELECT id, artifact_path FROM export_jobs WHERE status = 'done' AND expires_at < ?", (now,)
+        ).fetchall()
+        for row in rows:
+            if row["artifact_path"]:
+                _remove_file(row["artifact_path"])
+            conn.execute(
+                "UPDATE export_jobs SET status = 'expired', artifact_path = NULL WHERE id = ?", (row["id"],)
+            )
+
+
+def _worker_loop() -> None:
+    global _last_sweep
+    while True:
+        try:
+            if time.monotonic() - _last_sweep >= AppConfig.EXPORT_JOB_SWEEP_SECONDS:
+                _last_sweep = time.monotonic()
+                _sweep_expired()
+            job = _claim()
+        except Exception:
+            logger.error("Export job queue unavailable", exc_info=True)
+            job = None
+            time.sleep(1.0)
+        if job is None:
+            with _changed:
+                # Poll periodically as well: jobs may be enqueued by other server processes.
+                _changed.wait(1.0)
+            continue
+        _run(job)
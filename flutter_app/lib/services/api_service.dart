@@ -9,6 +9,10 @@ import "../models/resume.dart";
 class ApiService {
   final http.Client _client = http.Client();
 
+  // Last exported PDF, reused when the server answers 304 Not Modified.
+  String? _lastPdfEtag;
+  Uint8List? _lastPdfBytes;
+
   Uri _uri(String path) => Uri.parse("${ApiConfig.baseUrl}$path");
 
   Future<bool> login({
@@ -90,12 +94,18 @@ class ApiService {
       headers: {
         "Content-Type": "application/json",
         "Accept": "application/pdf",
+        if (_lastPdfEtag != null) "If-None-Match": _lastPdfEtag!,
       },
       body: jsonEncode(payload),
     );
+    if (res.statusCode == 304 && _lastPdfBytes != null) {
+      return _lastPdfBytes!;
+    }
     if (res.statusCode != 200) {
       throw Exception("PDF export failed: ${res.body}");
     }
+    _lastPdfEtag = res.headers["etag"];
+    _lastPdfBytes = res.bodyBytes;
     return res.bodyBytes;
   }
 
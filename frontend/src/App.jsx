@@ -393,6 +393,8 @@ export default function App() {
   const fileRef = useRef(null)
   const templateSectionRef = useRef(null)
   const templateSearchRef = useRef(null)
+  // ETag of the PDF currently shown in the preview; lets the server answer 304 when nothing changed.
+  const previewEtagRef = useRef('')
   const [health, setHealth] = useState({ status: 'checking', version: '-' })
   const [message, setMessage] = useState('')
   const [assist, setAssist] = useState('')
@@ -510,7 +512,8 @@ export default function App() {
     for (const u of urls) {
       try {
         const r = await fetch(u, options)
-        if (r.ok) {
+        // 304 Not Modified is a successful answer to a conditional request.
+        if (r.ok || r.status === 304) {
           if (typeof shouldAccept === 'function' && !shouldAccept(r, u)) {
             lastResponse = r
             continue
@@ -824,14 +827,22 @@ export default function App() {
   async function previewPdf() {
     try {
       setLoading(true)
+      const headers = { 'Content-Type': 'application/json', Accept: 'application/pdf' }
+      if (pdfPreviewUrl && previewEtagRef.current) headers['If-None-Match'] = previewEtagRef.current
       const r = await apiFetch('/preview-pdf', {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json', Accept: 'application/pdf' },
+        headers,
         body: JSON.stringify(payload()),
       })
+      if (r.status === 304) {
+        setStep(4)
+        setMessage('Live PDF preview is up to date.')
+        return
+      }
       if (!r.ok) throw new Error(await r.text())
       const blob = await r.blob()
       if (pdfPreviewUrl) URL.revokeObjectURL(pdfPreviewUrl)
+      previewEtagRef.current = r.headers.get('ETag') || ''
       const url = URL.createObjectURL(blob)
       setPdfPreviewUrl(url)
       setStep(4)
@@ -0,0 +1,24 @@
+"""
+Gunicorn settings: load the app once in the master and warm it up before
+forking, so workers inherit registered fonts, compiled templates and heavy
+imports instead of paying for them on their first request.
+"""
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+preload_app = True
+
+
+def on_starting(server):
+    # With preload_app the application is already imported when this hook runs in the master.
+    from config import AppConfig
+
+    if not AppConfig.PREFORK_WARMUP:
+        server.log.info("Pre-fork warmup disabled (PREFORK_WARMUP=0)")
+        return
+    import warmup
+
+    # Per-step lines go to the "warmup" logger; the full report is served by /api/render-stats.
+    report = warmup.warm_up()
+    failed = [step["step"] for step in report["steps"] if step["status"] == "failed"]
+    server.log.info("Pre-fork warmup finished in %.1f ms%s", report["total_ms"], f" (failed: {', '.join(failed)})" if failed else "")
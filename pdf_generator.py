@@ -4,7 +4,16 @@ Professional PDF Generator – with icons, tables, two-column references, achiev
 import os
 import io
 import html
+import json
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
 from typing import Union, Optional, List
+from reportlab import Version as _REPORTLAB_VERSION, rl_config
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
@@ -12,18 +21,26 @@ from reportlab.lib import colors
 from reportlab.lib.units import inch
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    Image, HRFlowable
+    SimpleDocTemplate, Paragraph as _PlatypusParagraph, Spacer, Table, TableStyle,
+    Image, HRFlowable, Flowable, PageBreak
 )
+from reportlab.platypus.doctemplate import ActionFlowable, BaseDocTemplate, PageTemplate
+from reportlab.platypus.frames import Frame
 from PIL import Image as PILImage
 
 from config import AppConfig
 from models import Resume
+from utils import prepare_profile_photo
+from render_metrics import RenderTimer
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Process-wide ReportLab switch (read while streams are built), so it is set once here.
+rl_config.useA85 = 1 if AppConfig.PDF_ASCII85 else 0
+
 _CUSTOM_FONTS_REGISTERED = False
 _CUSTOM_FONT_FILES = {
     "Poppins": ("Poppins-Regular.ttf", "Poppins-Bold.ttf"),
@@ -71,237 +88,881 @@ def _resolve_custom_font_pair(font_name: str) -> Optional[tuple[str, str]]:
     return None
 
 
+# Incoming template ids/names (gallery ids, Canva-style names) mapped to known template keys.
+_TEMPLATE_ALIASES = {
+    "mod_clean": "modern",
+    "mod_zen": "harsh_minimal",
+    "corp_royal": "corporate",
+    "corp_slate": "executive",
+    "classic_ink": "classic",
+    "classic_paper": "classic",
+    "creative_amber": "snack_gray",
+    "creative_blue": "vision_blue",
+    "ats_fast": "compact",
+    "ats_plain": "modern",
+    "two_column_tech": "javid_split",
+    "canva_mint_pro": "javid_split",
+    "canva_editorial_rose": "modern",
+    "canva_neo_charcoal": "executive",
+    "canva_skyline_aqua": "vision_blue",
+    "canva_portfolio_craft": "creative_split",
+    "canva_aurora_green": "teal_modern",
+    "canva_midnight_navy": "executive_slate",
+    "canva_sunset_coral": "snack_gray",
+    "canva_lilac_lite": "creative_split",
+    "canva_forest_charcoal": "metro_sidebar",
+    "canva_ice_blue": "astra_clean",
+    "canva_gold_ink": "classic_clarity",
+    "canva_ruby_panel": "impact_panel",
+    "canva_slate_frost": "mono_compact",
+    "canva_ocean_pro": "metro_sidebar",
+}
+
+# Per-template visual personality merged over the base AppConfig entry.
+_TEMPLATE_PERSONALITIES = {
+    "modern": {
+        "font_size_title": 26,
+        "font_size_heading": 13,
+        "font_size_body": 10,
+        "heading_align": "left",
+        "body_align": "justify",
+        "section_border": False,
+        "border_radius": 4,
+        "bullet": "-",
+        "header_layout_default": "default",
+        "bg_art": "top_band",
+    },
+    "corporate": {
+        "font_size_title": 28,
+        "font_size_heading": 14,
+        "font_size_body": 11,
+        "heading_align": "left",
+        "body_align": "left",
+        "section_border": True,
+        "border_radius": 2,
+        "bullet": "-",
+        "header_layout_default": "split",
+        "bg_art": "left_rail",
+    },
+    "classic": {
+        "font_size_title": 27,
+        "font_size_heading": 13,
+        "font_size_body": 10,
+        "heading_align": "center",
+        "body_align": "left",
+        "section_border": False,
+        "border_radius": 0,
+        "bullet": "*",
+        "header_layout_default": "center",
+        "bg_art": "double_rule",
+    },
+    "compact": {
+        "font_size_title": 22,
+        "font_size_heading": 12,
+        "font_size_body": 9,
+        "heading_align": "left",
+        "body_align": "left",
+        "section_border": False,
+        "border_radius": 0,
+        "bullet": "-",
+        "header_layout_default": "default",
+        "bg_art": "corner_mark",
+    },
+    "executive": {
+        "font_size_title": 30,
+        "font_size_heading": 14,
+        "font_size_body": 11,
+        "heading_align": "left",
+        "body_align": "justify",
+        "section_border": True,
+        "border_radius": 2,
+        "bullet": "*",
+        "header_layout_default": "split",
+        "bg_art": "executive_panel",
+    },
+    "snack_gray": {
+        "heading_align": "left",
+        "body_align": "left",
+        "section_border": False,
+        "header_layout_default": "left",
+        "bg_art": "soft_orb",
+    },
+    "vision_blue": {
+        "heading_align": "left",
+        "body_align": "justify",
+        "section_border": False,
+        "header_layout_default": "default",
+        "bg_art": "top_band",
+    },
+    "harsh_minimal": {
+        "font_size_title": 26,
+        "font_size_heading": 11,
+        "font_size_body": 9,
+        "heading_align": "center",
+        "body_align": "left",
+        "section_border": False,
+        "bullet": "-",
+        "header_layout_default": "center",
+        "bg_art": "minimal_line",
+    },
+    "javid_split": {
+        "layout": "two_column",
+        "left_column_ratio": 0.32,
+        "heading_align": "left",
+        "body_align": "left",
+        "section_border": False,
+        "header_layout_default": "split",
+        "bg_art": "split_rail",
+    },
+    "teal_modern": {
+        "font_size_title": 28,
+        "font_size_heading": 13,
+        "font_size_body": 10,
+        "heading_align": "left",
+        "body_align": "left",
+        "section_border": False,
+        "border_radius": 5,
+        "bullet": "-",
+        "header_layout_default": "default",
+        "bg_art": "top_band",
+        "page_border": False,
+        "contact_icons": False,
+    },
+    "astra_clean": {
+        "heading_align": "left",
+        "body_align": "justify",
+        "section_border": False,
+        "header_layout_default": "default",
+        "bg_art": "minimal_line",
+    },
+    "metro_sidebar": {
+        "layout": "two_column",
+        "left_column_ratio": 0.33,
+        "heading_align": "left",
+        "body_align": "left",
+        "section_border": False,
+        "header_layout_default": "split",
+        "bg_art": "split_rail",
+    },
+    "executive_slate": {
+        "heading_align": "left",
+        "body_align": "justify",
+        "section_border": True,
+        "border_radius": 2,
+        "header_layout_default": "split",
+        "bg_art": "executive_panel",
+    },
+    "creative_split": {
+        "layout": "two_column",
+        "left_column_ratio": 0.34,
+        "heading_align": "left",
+        "body_align": "left",
+        "section_border": False,
+        "bullet": "•",
+        "header_layout_default": "split",
+        "bg_art": "creative_block",
+    },
+    "mono_compact": {
+        "heading_align": "left",
+        "body_align": "left",
+        "section_border": False,
+        "header_layout_default": "left",
+        "bg_art": "corner_mark",
+    },
+    "classic_clarity": {
+        "heading_align": "left",
+        "body_align": "justify",
+        "section_border": False,
+        "header_layout_default": "default",
+        "bg_art": "double_rule",
+    },
+    "impact_panel": {
+        "layout": "two_column",
+        "left_column_ratio": 0.31,
+        "heading_align": "left",
+        "body_align": "left",
+        "section_border": True,
+        "bullet": "•",
+        "header_layout_default": "split",
+        "bg_art": "impact_band",
+    },
+    "contemporary_photo": {
+        "heading_align": "left",
+        "body_align": "justify",
+        "section_border": False,
+        "header_layout_default": "left",
+        "bg_art": "photo_corner",
+    },
+}
+
+
+# Compiled template registry: base config merged with its personality once at import.
+_COMPILED_TEMPLATES = {
+    name: {**cfg, **_TEMPLATE_PERSONALITIES.get(name, {})}
+    for name, cfg in {**AppConfig.TEMPLATES, **AppConfig.SIGNATURE_TEMPLATES}.items()
+}
+
+_LAYOUT_ALIASES = {
+    "single": "single",
+    "single_column": "single",
+    "one_column": "single",
+    "two": "two_column",
+    "two_column": "two_column",
+    "two-column": "two_column",
+}
+
+# Built-in PDF fonts used when a requested font family has no registered TTF files.
+_BUILTIN_FONT_FALLBACKS = {
+    "Helvetica": ("Helvetica", "Helvetica-Bold"),
+    "Times": ("Times-Roman", "Times-Bold"),
+    "Courier": ("Courier", "Courier-Bold"),
+    # Fallback to Times because Georgia is not guaranteed to be registered.
+    "Georgia": ("Times-Roman", "Times-Bold"),
+    # Web/modern names mapped to built-in safe PDF fonts when custom files are missing.
+    "Poppins": ("Helvetica", "Helvetica-Bold"),
+    "Montserrat": ("Helvetica", "Helvetica-Bold"),
+    "Nunito": ("Helvetica", "Helvetica-Bold"),
+    "FiraSans": ("Helvetica", "Helvetica-Bold"),
+    "Lora": ("Times-Roman", "Times-Bold"),
+    "Merriweather": ("Times-Roman", "Times-Bold"),
+    "RobotoSlab": ("Times-Roman", "Times-Bold"),
+    "PlayfairDisplay": ("Times-Roman", "Times-Bold"),
+    "LibreBaskerville": ("Times-Roman", "Times-Bold"),
+}
+
+_ALIGNMENTS = {
+    "left": TA_LEFT,
+    "center": TA_CENTER,
+    "right": TA_RIGHT,
+    "justify": TA_JUSTIFY,
+}
+
+
+_MARGIN_PRESETS = {
+    "narrow": 54,
+    "compact": 54,
+    "normal": 54,
+    "wide": 90,
+    "relaxed": 90,
+}
+
+# Fit-to-pages search space, most readable first.
+_FIT_FONT_SCALES = tuple(round(1.3 - 0.05 * i, 2) for i in range(11))  # 1.3 ... 0.8
+_FIT_SPACING_SCALES = (1.0, 0.85, 0.7)
+_FIT_MARGIN_PRESETS = ("wide", "normal")
+
+
+def _first_fitting(candidates: list, fits) -> Optional[int]:
+    """Binary search for the first candidate that fits; assumes candidates go from least to most likely to fit."""
+    lo, hi, found = 0, len(candidates) - 1, None
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if fits(candidates[mid]):
+            found, hi = mid, mid - 1
+        else:
+            lo = mid + 1
+    return found
+
+
+def _renderer_fingerprint() -> str:
+    """Hash of the rendering code and template config, so cache keys and ETags change on deploy."""
+    digest = hashlib.sha256(_REPORTLAB_VERSION.encode("utf-8"))
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ("pdf_generator.py", "ats_renderer.py", "config.py"):
+        try:
+            with open(os.path.join(here, name), "rb") as fh:
+                digest.update(fh.read())
+        except OSError:
+            digest.update(name.encode("utf-8"))
+    return digest.hexdigest()
+
+
+_RENDERER_FINGERPRINT = _renderer_fingerprint()
+
+
+def _settings_key(value) -> Optional[str]:
+    """Normalize a raw override value into a hashable registry key part."""
+    if value in (None, ""):
+        return None
+    return str(value)
+
+
+def _format_location(resume_obj, sep: str = ", ") -> str:
+    """Build a clean location string from city/address without duplicates."""
+    city = (getattr(resume_obj, "city", "") or "").strip()
+    address = (getattr(resume_obj, "address", "") or "").strip()
+    if city and address:
+        if city.lower() in address.lower():
+            return address
+        if address.lower() in city.lower():
+            return city
+        return f"{city}{sep}{address}"
+    return city or address
+
+
+def _normalize_url(url: str) -> str:
+    raw = (url or "").strip()
+    if not raw:
+        return ""
+    if raw.startswith(("http://", "https://", "mailto:", "tel:")):
+        return raw
+    return f"https://{raw}"
+
+
+def _format_date_range(date_format: str, start: str, end: str, default_present_if_start_only: bool = True) -> str:
+    """Build clean date text without leading/trailing separators."""
+    s = (start or "").strip()
+    e = (end or "").strip()
+    if s and (not e) and default_present_if_start_only:
+        e = "Present"
+    if s and e:
+        return date_format.format(start=s, end=e).strip()
+    if s:
+        return s
+    if e:
+        return e
+    return ""
+
+
+def _soften(col: colors.Color, white_mix: float = 0.94) -> colors.Color:
+    mix = min(0.96, max(0.0, white_mix))
+    return colors.Color(
+        col.red * (1 - mix) + 1.0 * mix,
+        col.green * (1 - mix) + 1.0 * mix,
+        col.blue * (1 - mix) + 1.0 * mix,
+    )
+
+
+def _color_key(col: colors.Color) -> tuple:
+    return (col.red, col.green, col.blue, col.alpha)
+
+
+@lru_cache(maxsize=256)
+def _page_decoration(art: str, pagesize: tuple, bg_key: tuple, accent_key: tuple, page_border: bool):
+    """
+    Build the page decoration (background, template art, border) once per
+    art/page size/colors as a display list of (canvas method, args) calls.
+    """
+    width, height = pagesize
+    bg_color = colors.Color(*bg_key)
+    accent_color = colors.Color(*accent_key)
+    ops = []
+
+    def op(method, *args):
+        ops.append((method, args))
+
+    # Paint a deterministic page background first to avoid viewer-specific gray shading.
+    op("saveState")
+    op("setFillColor", bg_color)
+    op("rect", 0, 0, width, height, 0, 1)
+    op("restoreState")
+
+    if art:
+        # Keep decorative art very subtle to avoid a shadow-like cast in exports.
+        a_light = _soften(accent_color, 0.96)
+        a_mid = _soften(accent_color, 0.90)
+        op("saveState")
+        op("setStrokeColor", a_mid)
+        op("setFillColor", a_light)
+        if art == "top_band":
+            op("rect", 0, height - 28, width, 20, 0, 1)
+            op("setLineWidth", 0.7)
+            op("line", 36, height - 30, width - 36, height - 30)
+        elif art == "left_rail":
+            op("rect", 0, 0, 18, height, 0, 1)
+        elif art == "double_rule":
+            op("setLineWidth", 0.8)
+            op("line", 36, height - 36, width - 36, height - 36)
+            op("line", 36, height - 42, width - 36, height - 42)
+        elif art == "corner_mark":
+            op("rect", width - 58, height - 58, 28, 28, 0, 1)
+            op("rect", width - 28, height - 28, 10, 10, 0, 1)
+        elif art == "executive_panel":
+            op("rect", 0, height - 38, width, 16, 0, 1)
+            op("rect", 0, 0, 10, height, 0, 1)
+        elif art == "soft_orb":
+            op("circle", width - 34, height - 30, 14, 0, 1)
+            op("circle", width - 16, height - 16, 7, 0, 1)
+        elif art == "minimal_line":
+            op("setLineWidth", 1.0)
+            op("line", 36, height - 26, width - 36, height - 26)
+        elif art == "split_rail":
+            rail_w = max(36, int(width * 0.08))
+            op("rect", 0, 0, rail_w, height, 0, 1)
+        elif art == "creative_block":
+            op("rect", 0, height - 44, 84, 22, 0, 1)
+            op("rect", width - 84, height - 22, 84, 22, 0, 1)
+        elif art == "impact_band":
+            op("rect", 0, height - 48, width, 18, 0, 1)
+            op("rect", width - 20, 0, 20, height, 0, 1)
+        elif art == "photo_corner":
+            op("rect", width - 78, height - 78, 50, 50, 0, 1)
+            op("circle", width - 28, height - 28, 8, 0, 1)
+        op("restoreState")
+
+    if page_border:
+        border_inset = 18
+        op("saveState")
+        op("setStrokeColor", accent_color)
+        op("setLineWidth", 1)
+        op("rect", border_inset, border_inset, width - (2 * border_inset), height - (2 * border_inset), 1, 0)
+        op("restoreState")
+
+    return tuple(ops)
+
+
+class RenderCache:
+    """Thread-safe LRU cache of rendered PDF bytes, bounded by total byte size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max(0, int(max_bytes))
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        size = len(data)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            self._entries[key] = data
+            self._size += size
+            while self._size > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+render_cache = RenderCache(AppConfig.RENDER_CACHE_MAX_BYTES)
+
+
+_STYLE_FIELDS = tuple(sorted(ParagraphStyle.defaults))
+
+
+def _style_fingerprint(style) -> Optional[tuple]:
+    """
+    Value key of a paragraph style (every ParagraphStyle attribute, including
+    colors carried into the break result), so equal styles share line breaks
+    even when they are distinct objects, e.g. unpickled from the section cache.
+    None if a value is unhashable.
+    """
+    fingerprint = (type(style),) + tuple(style.__dict__.get(name) for name in _STYLE_FIELDS)
+    try:
+        hash(fingerprint)
+    except TypeError:
+        return None
+    return fingerprint
+
+
+class LineBreakCache:
+    """
+    LRU store of Paragraph line breaks keyed by (text, style values, widths), shared by
+    all renders. Only simple single-style paragraphs are stored; their break
+    results are read-only once built, so instances can share them.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(0, int(max_entries))
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: tuple, entry: tuple) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+line_break_cache = LineBreakCache(AppConfig.LINE_BREAK_CACHE_MAX_ENTRIES)
+
+
+class Paragraph(_PlatypusParagraph):
+    """
+    Platypus Paragraph that reuses line breaks from ``line_break_cache``. Short
+    paragraphs (skills, headings, dates, meta lines) recur with the same text,
+    style and width in nearly every render of a resume.
+    """
+
+    def __init__(self, text, style=None, *args, **kwargs):
+        _PlatypusParagraph.__init__(self, text, style, *args, **kwargs)
+        # Split halves are built from frags rather than text and are never cached.
+        self._break_key = None
+        if isinstance(text, str) and not args and not kwargs and len(text) <= AppConfig.LINE_BREAK_CACHE_MAX_CHARS:
+            fingerprint = _style_fingerprint(self.style)
+            if fingerprint is not None:
+                self._break_key = (text, fingerprint)
+
+    def breakLines(self, width):
+        if self._break_key is None or line_break_cache.max_entries <= 0:
+            return _PlatypusParagraph.breakLines(self, width)
+        key = self._break_key + (tuple(width) if isinstance(width, (list, tuple)) else (width,),)
+        cached = line_break_cache.get(key)
+        if cached is not None:
+            bl_para, self._width_max, self._splitLongWordCount, self._hyphenations = cached
+            self.height = 0
+            return bl_para
+        bl_para = _PlatypusParagraph.breakLines(self, width)
+        # Multi-style results (kind 1) rewrite self.frags as a side effect; only plain ones are shared.
+        if bl_para.kind == 0:
+            line_break_cache.put(key, (bl_para, self._width_max, self._splitLongWordCount, self._hyphenations))
+        return bl_para
+
+
+class SectionCache:
+    """
+    LRU store of built section flowables (pickled, so no two renders share
+    objects) for incremental live preview, partitioned by scope (one scope per
+    user) and bounded by entry count.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(0, int(max_entries))
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def scope(self, scope_id) -> "SectionCacheScope":
+        return SectionCacheScope(self, str(scope_id))
+
+    def get(self, scope_id: str, key: str) -> Optional[bytes]:
+        with self._lock:
+            flowables = self._entries.get((scope_id, key))
+            if flowables is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((scope_id, key))
+            self.hits += 1
+            return flowables
+
+    def put(self, scope_id: str, key: str, snapshot: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[(scope_id, key)] = snapshot
+            self._entries.move_to_end((scope_id, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+class SectionCacheScope:
+    """One user's view of the shared SectionCache, passed to PDFGenerator.generate."""
+
+    def __init__(self, cache: SectionCache, scope_id: str):
+        self._cache = cache
+        self._scope_id = scope_id
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(self._scope_id, key)
+
+    def put(self, key: str, snapshot: bytes) -> None:
+        self._cache.put(self._scope_id, key, snapshot)
+
+
+section_cache = SectionCache(AppConfig.SECTION_CACHE_MAX_ENTRIES)
+
+
+class _LayoutCanvas(Canvas):
+    """Canvas for layout-only builds: nothing is serialized."""
+
+    def save(self):
+        pass
+
+
+def _skip_draw(*args, **kwargs):
+    pass
+
+
+class _LayoutFrame(Frame):
+    """Frame that runs wrap/split placement as usual but never draws the flowables."""
+
+    def add(self, flowable, canv, trySplit=0):
+        # Shadow the bound method on the instance; __dict__ sidesteps Drawing's attribute validation.
+        flowable.__dict__["drawOn"] = _skip_draw
+        try:
+            return Frame.add(self, flowable, canv, trySplit=trySplit)
+        finally:
+            flowable.__dict__.pop("drawOn", None)
+
+
+class _SectionMarker(ActionFlowable):
+    """Story marker for a section start; takes no space and never reaches the page."""
+
+    def __init__(self, probe: "LayoutProbe", section: str):
+        ActionFlowable.__init__(self)
+        self.probe = probe
+        self.section = section
+
+    def apply(self, doc):
+        self.probe.current_section = self.section
+
+
+class _CandidateBookmark(Flowable):
+    """Zero-size flowable adding a top-level outline entry for the page it lands on."""
+
+    def __init__(self, key: str, title: str):
+        Flowable.__init__(self)
+        self.key = key
+        self.title = title
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def draw(self):
+        self.canv.bookmarkPage(self.key)
+        self.canv.addOutlineEntry(self.title, self.key, level=0)
+
+
+# Fit tolerance, as in Platypus frames.
+_FUZZ = 1e-6
+
+
+class _FlowingColumns(Flowable):
+    """
+    Side-by-side columns (sidebar and main) that flow on to following pages
+    independently: a page break splits each column at its own last fitting
+    flowable. Attached space is stacked rather than overlapped, matching the
+    single-row Table this replaces, so a page of content looks the same. Wrapped
+    sizes are shared with the split parts, so each paragraph is wrapped once.
+    """
+
+    def __init__(self, columns: List[tuple], width: float, sizes: Optional[dict] = None):
+        Flowable.__init__(self)
+        # (x offset, content width, flowables) per column.
+        self.columns = [(x, w, list(flowables)) for x, w, flowables in columns]
+        self.width = width
+        self.height = 0.0
+        # Centred like a Table, so a full-width block lines up with the page margins.
+        self.hAlign = "CENTER"
+        self._sizes = {} if sizes is None else sizes
+
+    def _size(self, flowable, width: float, avail_height: float) -> tuple:
+        entry = self._sizes.get(id(flowable))
+        if entry is None or entry[0] is not flowable:
+            entry = (flowable,) + tuple(flowable.wrap(width, avail_height))
+            self._sizes[id(flowable)] = entry
+        return entry[1], entry[2]
+
+    def _fill(self, flowables: list, width: float, avail_height: float) -> tuple:
+        """Take flowables from the top until ``avail_height`` is used up: (placed, rest, height)."""
+        placed, rest = [], list(flowables)
+        used = last_space_after = 0.0
+        while rest:
+            flowable = rest[0]
+            space = flowable.getSpaceBefore() if placed else 0.0
+            room = avail_height - used - space
+            if room <= 0:
+                break
+            _, h = self._size(flowable, width, room)
+            if h > room + _FUZZ:
+                parts = flowable.split(width, room)
+                if not parts:
+                    # A refused split may drop the wrap state (Paragraph deletes blPara).
+                    self._sizes.pop(id(flowable), None)
+                    break
+                _, h = self._size(parts[0], width, room)
+                if h > room + _FUZZ:
+                    break
+                placed.append(parts[0])
+                rest[0:1] = parts[1:]
+                used += space + h
+                last_space_after = 0.0
+                break
+            placed.append(rest.pop(0))
+            last_space_after = flowable.getSpaceAfter()
+            used += space + h + last_space_after
+        return placed, rest, max(0.0, used - last_space_after)
+
+    def wrap(self, availWidth, availHeight):
+        self.height = max(
+            (self._fill(flowables, w, float("inf"))[2] for _, w, flowables in self.columns),
+            default=0.0,
+        )
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        heads, tails = [], []
+        for x, w, flowables in self.columns:
+            placed, rest, _ = self._fill(flowables, w, availHeight)
+            heads.append((x, w, placed))
+            tails.append((x, w, rest))
+        if not any(placed for _, _, placed in heads):
+            return []
+        if not any(rest for _, _, rest in tails):
+            return [self]
+        return [_FlowingColumns(heads, self.width, self._sizes), _FlowingColumns(tails, self.width, self._sizes)]
+
+    def draw(self):
+        # Same placement as a zero-padding Frame without overlapAttachedSpace, minus its re-wrap.
+        for x, w, flowables in self.columns:
+            y = self.height
+            for index, flowable in enumerate(flowables):
+                fw, fh = self._size(flowable, w, y)
+                y -= fh + (flowable.getSpaceBefore() if index else 0.0)
+                flowable.drawOn(self.canv, x, y, _sW=w - fw)
+                y -= flowable.getSpaceAfter()
+
+
+class LayoutProbe:
+    """
+    Records where sections land during a layout-only build (wrap/split and frame
+    placement run as usual, but no PDF is written): page count, free space left on
+    the last page and which section crosses each page break.
+    """
+
+    def __init__(self):
+        self.current_section: Optional[str] = None
+        self.page_sections: List[List[str]] = []
+        self.pages = 0
+        self.remaining_space = 0.0
+        self.frame_height = 0.0
+        self.fitted: Optional[dict] = None
+        self._doc = None
+
+    def marker(self, section: str) -> _SectionMarker:
+        return _SectionMarker(self, section)
+
+    def attach(self, doc: SimpleDocTemplate) -> None:
+        self._doc = doc
+        doc.afterFlowable = self._after_flowable
+
+    def _after_flowable(self, flowable) -> None:
+        if isinstance(flowable, ActionFlowable):
+            return
+        doc = self._doc
+        frame = doc.frame
+        while len(self.page_sections) < doc.page:
+            self.page_sections.append([])
+        self.pages = doc.page
+        self.remaining_space = max(0.0, frame._y - frame._y1p)
+        self.frame_height = frame._y2 - frame._topPadding - frame._y1p
+        # Spacers carry no content; a trailing one must not make a section look split.
+        if isinstance(flowable, Spacer):
+            return
+        sections = self.page_sections[doc.page - 1]
+        if self.current_section and (not sections or sections[-1] != self.current_section):
+            sections.append(self.current_section)
+
+    def report(self) -> dict:
+        boundaries = []
+        for page in range(1, self.pages):
+            before, after = self.page_sections[page - 1], self.page_sections[page]
+            crossing = before[-1] if before and after and before[-1] == after[0] else None
+            boundaries.append({"after_page": page, "section": crossing})
+        report = {
+            "pages": self.pages,
+            "remaining_space_pt": round(self.remaining_space, 2),
+            "remaining_space_ratio": round(self.remaining_space / self.frame_height, 4) if self.frame_height else 0.0,
+            "page_sections": self.page_sections,
+            "boundaries": boundaries,
+        }
+        if self.fitted is not None:
+            report["fitted_settings"] = self.fitted
+        return report
+
+
 class PDFGenerator:
     @staticmethod
     def _resolve_template_name(template_name: str) -> str:
         """Normalize incoming template key/id/name to a known template key."""
         raw = str(template_name or "").strip().lower()
         normalized = raw.replace("-", "_").replace(" ", "_")
-        aliases = {
-            "mod_clean": "modern",
-            "mod_zen": "harsh_minimal",
-            "corp_royal": "corporate",
-            "corp_slate": "executive",
-            "classic_ink": "classic",
-            "classic_paper": "classic",
-            "creative_amber": "snack_gray",
-            "creative_blue": "vision_blue",
-            "ats_fast": "compact",
-            "ats_plain": "modern",
-            "two_column_tech": "javid_split",
-            "canva_mint_pro": "javid_split",
-            "canva_editorial_rose": "modern",
-            "canva_neo_charcoal": "executive",
-            "canva_skyline_aqua": "vision_blue",
-            "canva_portfolio_craft": "creative_split",
-            "canva_aurora_green": "teal_modern",
-            "canva_midnight_navy": "executive_slate",
-            "canva_sunset_coral": "snack_gray",
-            "canva_lilac_lite": "creative_split",
-            "canva_forest_charcoal": "metro_sidebar",
-            "canva_ice_blue": "astra_clean",
-            "canva_gold_ink": "classic_clarity",
-            "canva_ruby_panel": "impact_panel",
-            "canva_slate_frost": "mono_compact",
-            "canva_ocean_pro": "metro_sidebar",
-        }
-        resolved = aliases.get(normalized, normalized)
+        resolved = _TEMPLATE_ALIASES.get(normalized, normalized)
         if resolved in AppConfig.TEMPLATES:
             return resolved
         return AppConfig.DEFAULT_TEMPLATE
 
     @staticmethod
-    def _apply_template_personality(template_name: str, template_cfg: dict) -> dict:
-        """
-        Apply per-template visual personality so each template renders
-        with a distinct style/alignment baseline.
-        """
-        key = str(template_name or "").strip().lower()
-        personalities = {
-            "modern": {
-                "font_size_title": 26,
-                "font_size_heading": 13,
-                "font_size_body": 10,
-                "heading_align": "left",
-                "body_align": "justify",
-                "section_border": False,
-                "border_radius": 4,
-                "bullet": "-",
-                "header_layout_default": "default",
-                "bg_art": "top_band",
-            },
-            "corporate": {
-                "font_size_title": 28,
-                "font_size_heading": 14,
-                "font_size_body": 11,
-                "heading_align": "left",
-                "body_align": "left",
-                "section_border": True,
-                "border_radius": 2,
-                "bullet": "-",
-                "header_layout_default": "split",
-                "bg_art": "left_rail",
-            },
-            "classic": {
-                "font_size_title": 27,
-                "font_size_heading": 13,
-                "font_size_body": 10,
-                "heading_align": "center",
-                "body_align": "left",
-                "section_border": False,
-                "border_radius": 0,
-                "bullet": "*",
-                "header_layout_default": "center",
-                "bg_art": "double_rule",
-            },
-            "compact": {
-                "font_size_title": 22,
-                "font_size_heading": 12,
-                "font_size_body": 9,
-                "heading_align": "left",
-                "body_align": "left",
-                "section_border": False,
-                "border_radius": 0,
-                "bullet": "-",
-                "header_layout_default": "default",
-                "bg_art": "corner_mark",
-            },
-            "executive": {
-                "font_size_title": 30,
-                "font_size_heading": 14,
-                "font_size_body": 11,
-                "heading_align": "left",
-                "body_align": "justify",
-                "section_border": True,
-                "border_radius": 2,
-                "bullet": "*",
-                "header_layout_default": "split",
-                "bg_art": "executive_panel",
-            },
-            "snack_gray": {
-                "heading_align": "left",
-                "body_align": "left",
-                "section_border": False,
-                "header_layout_default": "left",
-                "bg_art": "soft_orb",
-            },
-            "vision_blue": {
-                "heading_align": "left",
-                "body_align": "justify",
-                "section_border": False,
-                "header_layout_default": "default",
-                "bg_art": "top_band",
-            },
-            "harsh_minimal": {
-                "font_size_title": 26,
-                "font_size_heading": 11,
-                "font_size_body": 9,
-                "heading_align": "center",
-                "body_align": "left",
-                "section_border": False,
-                "bullet": "-",
-                "header_layout_default": "center",
-                "bg_art": "minimal_line",
-            },
-            "javid_split": {
-                "layout": "two_column",
-                "left_column_ratio": 0.32,
-                "heading_align": "left",
-                "body_align": "left",
-                "section_border": False,
-                "header_layout_default": "split",
-                "bg_art": "split_rail",
-            },
-            "teal_modern": {
-                "font_size_title": 28,
-                "font_size_heading": 13,
-                "font_size_body": 10,
-                "heading_align": "left",
-                "body_align": "left",
-                "section_border": False,
-                "border_radius": 5,
-                "bullet": "-",
-                "header_layout_default": "default",
-                "bg_art": "top_band",
-                "page_border": False,
-                "contact_icons": False,
-            },
-            "astra_clean": {
-                "heading_align": "left",
-                "body_align": "justify",
-                "section_border": False,
-                "header_layout_default": "default",
-                "bg_art": "minimal_line",
-            },
-            "metro_sidebar": {
-                "layout": "two_column",
-                "left_column_ratio": 0.33,
-                "heading_align": "left",
-                "body_align": "left",
-                "section_border": False,
-                "header_layout_default": "split",
-                "bg_art": "split_rail",
-            },
-            "executive_slate": {
-                "heading_align": "left",
-                "body_align": "justify",
-                "section_border": True,
-                "border_radius": 2,
-                "header_layout_default": "split",
-                "bg_art": "executive_panel",
-            },
-            "creative_split": {
-                "layout": "two_column",
-                "left_column_ratio": 0.34,
-                "heading_align": "left",
-                "body_align": "left",
-                "section_border": False,
-                "bullet": "•",
-                "header_layout_default": "split",
-                "bg_art": "creative_block",
-            },
-            "mono_compact": {
-                "heading_align": "left",
-                "body_align": "left",
-                "section_border": False,
-                "header_layout_default": "left",
-                "bg_art": "corner_mark",
-            },
-            "classic_clarity": {
-                "heading_align": "left",
-                "body_align": "justify",
-                "section_border": False,
-                "header_layout_default": "default",
-                "bg_art": "double_rule",
-            },
-            "impact_panel": {
-                "layout": "two_column",
-                "left_column_ratio": 0.31,
-                "heading_align": "left",
-                "body_align": "left",
-                "section_border": True,
-                "bullet": "•",
-                "header_layout_default": "split",
-                "bg_art": "impact_band",
-            },
-            "contemporary_photo": {
-                "heading_align": "left",
-                "body_align": "justify",
-                "section_border": False,
-                "header_layout_default": "left",
-                "bg_art": "photo_corner",
-            },
-        }
-        template_cfg.update(personalities.get(key, {}))
-        return template_cfg
-
-    @staticmethod
-    def _build_profile_image_flowable(raw_bytes: bytes, align: str = "LEFT"):
+    def _build_profile_image_flowable(raw_bytes: bytes, align: str = "LEFT", compact: bool = False):
         """Create a robust profile image flowable with PNG conversion fallback."""
         if not raw_bytes:
             return None
+        # Photos loaded straight from the database may still be full-size uploads.
+        if compact:
+            raw_bytes = prepare_profile_photo(
+                raw_bytes,
+                dpi=AppConfig.COMPACT_PHOTO_DPI,
+                quality=AppConfig.COMPACT_PHOTO_JPEG_QUALITY,
+                force_jpeg=True,
+            )
+        else:
+            raw_bytes = prepare_profile_photo(raw_bytes)
+        size = AppConfig.PROFILE_PHOTO_INCHES * inch
         try:
-            flow = Image(io.BytesIO(raw_bytes), width=0.95 * inch, height=0.95 * inch)
+            flow = Image(io.BytesIO(raw_bytes), width=size, height=size)
             flow.hAlign = align
             return flow
         except Exception:
@@ -313,57 +974,40 @@ class PDFGenerator:
                     out = io.BytesIO()
                     img.save(out, format="PNG")
                     out.seek(0)
-                    flow = Image(out, width=0.95 * inch, height=0.95 * inch)
+                    flow = Image(out, width=size, height=size)
                     flow.hAlign = align
                     return flow
             except Exception:
                 return None
 
     @staticmethod
-    def generate(
-        resume: Resume,
-        output: Union[str, io.BytesIO],
-        template_name: str = "corporate",  # Default to new corporate template
-        page_size: str = "letter",
-        layout_override: Optional[str] = None,
-        heading_align_override: Optional[str] = None,
-        body_align_override: Optional[str] = None,
-        accent_color_override: Optional[str] = None,
-        font_override: Optional[str] = None,
-        page_border_override: Optional[bool] = None,
-        compact_mode: bool = False,
-        ats_safe_mode: bool = False,
-        section_order: Optional[List[str]] = None,
-        font_scale: float = 1.0,
-        margin_preset: str = "normal",
-        section_visibility: Optional[dict] = None,
-        header_layout: Optional[str] = None,
-    ) -> Union[str, io.BytesIO]:
+    @lru_cache(maxsize=256)
+    def _compile_render_settings(
+        template_name: str,
+        layout_override: Optional[str],
+        heading_align_override: Optional[str],
+        body_align_override: Optional[str],
+        accent_color_override: Optional[str],
+        font_override: Optional[str],
+        page_border_override: Optional[bool],
+        compact_mode: bool,
+        ats_safe_mode: bool,
+        font_scale: float,
+        spacing_scale: float = 1.0,
+        draft: bool = False,
+    ) -> dict:
         """
-        Generate a beautifully formatted PDF resume with support for
-        icons, education tables, two-column references, and achievements.
+        Resolve template config, colors and paragraph styles for one option
+        combination. Cached, so repeat renders only assemble flowables.
+        The returned objects are shared and must be treated as read-only.
         """
-        # Select page size
-        pagesize = A4 if page_size.lower() == "a4" else letter
-
-        # Load template config
-        template_name = PDFGenerator._resolve_template_name(template_name)
-        default_key = AppConfig.DEFAULT_TEMPLATE if AppConfig.DEFAULT_TEMPLATE in AppConfig.TEMPLATES else "modern"
-        template_cfg = AppConfig.TEMPLATES.get(template_name, AppConfig.TEMPLATES[default_key]).copy()
-        template_cfg = PDFGenerator._apply_template_personality(template_name, template_cfg)
+        default_key = AppConfig.DEFAULT_TEMPLATE if AppConfig.DEFAULT_TEMPLATE in _COMPILED_TEMPLATES else "modern"
+        template_cfg = dict(_COMPILED_TEMPLATES.get(template_name, _COMPILED_TEMPLATES[default_key]))
 
         # Apply overrides
         if layout_override:
-            normalized_layout = str(layout_override).strip().lower()
-            layout_alias = {
-                "single": "single",
-                "single_column": "single",
-                "one_column": "single",
-                "two": "two_column",
-                "two_column": "two_column",
-                "two-column": "two_column",
-            }
-            template_cfg["layout"] = layout_alias.get(normalized_layout, normalized_layout)
+            normalized_layout = layout_override.strip().lower()
+            template_cfg["layout"] = _LAYOUT_ALIASES.get(normalized_layout, normalized_layout)
         if heading_align_override:
             template_cfg["heading_align"] = heading_align_override
         if body_align_override:
@@ -371,29 +1015,15 @@ class PDFGenerator:
         if accent_color_override:
             template_cfg["accent"] = accent_color_override
         if font_override:
-            _register_custom_fonts()
-            custom_pair = _resolve_custom_font_pair(font_override)
+            # Draft renders never embed TTF files; they use the built-in fallbacks.
+            custom_pair = None
+            if not draft:
+                _register_custom_fonts()
+                custom_pair = _resolve_custom_font_pair(font_override)
             if custom_pair:
                 body_font, heading_font = custom_pair
             else:
-                font_map = {
-                    "Helvetica": ("Helvetica", "Helvetica-Bold"),
-                    "Times": ("Times-Roman", "Times-Bold"),
-                    "Courier": ("Courier", "Courier-Bold"),
-                    # Fallback to Times because Georgia is not guaranteed to be registered.
-                    "Georgia": ("Times-Roman", "Times-Bold"),
-                    # Web/modern names mapped to built-in safe PDF fonts when custom files are missing.
-                    "Poppins": ("Helvetica", "Helvetica-Bold"),
-                    "Montserrat": ("Helvetica", "Helvetica-Bold"),
-                    "Nunito": ("Helvetica", "Helvetica-Bold"),
-                    "FiraSans": ("Helvetica", "Helvetica-Bold"),
-                    "Lora": ("Times-Roman", "Times-Bold"),
-                    "Merriweather": ("Times-Roman", "Times-Bold"),
-                    "RobotoSlab": ("Times-Roman", "Times-Bold"),
-                    "PlayfairDisplay": ("Times-Roman", "Times-Bold"),
-                    "LibreBaskerville": ("Times-Roman", "Times-Bold"),
-                }
-                body_font, heading_font = font_map.get(font_override, ("Helvetica", "Helvetica-Bold"))
+                body_font, heading_font = _BUILTIN_FONT_FALLBACKS.get(font_override, ("Helvetica", "Helvetica-Bold"))
             template_cfg["font_body"] = body_font
             template_cfg["font_heading"] = heading_font
         if page_border_override is not None:
@@ -402,7 +1032,7 @@ class PDFGenerator:
         # Normalize alignment keys so all templates render consistently.
         def _normalize_align(value: Optional[str], default: str = "left") -> str:
             val = str(value or default).strip().lower()
-            return val if val in {"left", "center", "right", "justify"} else default
+            return val if val in _ALIGNMENTS else default
 
         template_cfg["heading_align"] = _normalize_align(template_cfg.get("heading_align"), "left")
         template_cfg["body_align"] = _normalize_align(template_cfg.get("body_align"), "left")
@@ -412,6 +1042,8 @@ class PDFGenerator:
             template_cfg["font_size_heading"] = max(10, int(template_cfg.get("font_size_heading", 12) * 0.9))
             template_cfg["font_size_body"] = max(8, int(template_cfg.get("font_size_body", 10) * 0.92))
             template_cfg["spacing"] = max(8, int(template_cfg.get("spacing", 12) * 0.75))
+        if spacing_scale != 1.0:
+            template_cfg["spacing"] = max(4, int(template_cfg.get("spacing", 12) * spacing_scale))
         if ats_safe_mode:
             template_cfg["contact_icons"] = False
             template_cfg["page_border"] = False
@@ -422,24 +1054,11 @@ class PDFGenerator:
             template_cfg["bullet"] = "-"
             template_cfg["background"] = "#ffffff"
         # User-facing font scaling control from UI slider.
-        try:
-            fs = float(font_scale)
-        except Exception:
-            fs = 1.0
-        fs = min(1.3, max(0.8, fs))
+        fs = font_scale
         template_cfg["font_size_title"] = max(14, int(template_cfg.get("font_size_title", 24) * fs))
         template_cfg["font_size_heading"] = max(9, int(template_cfg.get("font_size_heading", 12) * fs))
         template_cfg["font_size_body"] = max(7, int(template_cfg.get("font_size_body", 10) * fs))
 
-        margin_map = {
-            "narrow": 54,
-            "compact": 54,
-            "normal": 54,
-            "wide": 90,
-            "relaxed": 90,
-        }
-        margin_value = margin_map.get(str(margin_preset or "normal").lower(), 72)
-
         # Convert hex colors
         accent_color = colors.HexColor(template_cfg["accent"])
         bg_color = colors.HexColor(template_cfg.get("background", "#ffffff"))
@@ -447,106 +1066,8 @@ class PDFGenerator:
         item_spacing = max(1, int(section_spacing * 0.5))
         section_tail_spacing = max(1, item_spacing)
 
-        # Alignment helper
         def _get_alignment(align_str: str) -> int:
-            key = str(align_str or "left").strip().lower()
-            return {
-                "left": TA_LEFT,
-                "center": TA_CENTER,
-                "right": TA_RIGHT,
-                "justify": TA_JUSTIFY,
-            }.get(key, TA_LEFT)
-
-        # Document setup
-        doc = SimpleDocTemplate(
-            output,
-            pagesize=pagesize,
-            rightMargin=margin_value,
-            leftMargin=margin_value,
-            topMargin=margin_value,
-            bottomMargin=margin_value,
-            title=f"Resume - {resume.full_name}",
-            author=resume.full_name,
-        )
-
-        # Draw page border on every page without affecting flowable layout.
-        def _soften(col: colors.Color, white_mix: float = 0.94) -> colors.Color:
-            mix = min(0.96, max(0.0, white_mix))
-            return colors.Color(
-                col.red * (1 - mix) + 1.0 * mix,
-                col.green * (1 - mix) + 1.0 * mix,
-                col.blue * (1 - mix) + 1.0 * mix,
-            )
-
-        def _draw_template_art(canv, width, height):
-            art = str(template_cfg.get("bg_art", "")).strip().lower()
-            if not art:
-                return
-            # Keep decorative art very subtle to avoid a shadow-like cast in exports.
-            a_light = _soften(accent_color, 0.96)
-            a_mid = _soften(accent_color, 0.90)
-            canv.saveState()
-            canv.setStrokeColor(a_mid)
-            canv.setFillColor(a_light)
-            if art == "top_band":
-                canv.rect(0, height - 28, width, 20, stroke=0, fill=1)
-                canv.setLineWidth(0.7)
-                canv.line(36, height - 30, width - 36, height - 30)
-            elif art == "left_rail":
-                canv.rect(0, 0, 18, height, stroke=0, fill=1)
-            elif art == "double_rule":
-                canv.setLineWidth(0.8)
-                canv.line(36, height - 36, width - 36, height - 36)
-                canv.line(36, height - 42, width - 36, height - 42)
-            elif art == "corner_mark":
-                canv.rect(width - 58, height - 58, 28, 28, stroke=0, fill=1)
-                canv.rect(width - 28, height - 28, 10, 10, stroke=0, fill=1)
-            elif art == "executive_panel":
-                canv.rect(0, height - 38, width, 16, stroke=0, fill=1)
-                canv.rect(0, 0, 10, height, stroke=0, fill=1)
-            elif art == "soft_orb":
-                canv.circle(width - 34, height - 30, 14, stroke=0, fill=1)
-                canv.circle(width - 16, height - 16, 7, stroke=0, fill=1)
-            elif art == "minimal_line":
-                canv.setLineWidth(1.0)
-                canv.line(36, height - 26, width - 36, height - 26)
-            elif art == "split_rail":
-                rail_w = max(36, int(width * 0.08))
-                canv.rect(0, 0, rail_w, height, stroke=0, fill=1)
-            elif art == "creative_block":
-                canv.rect(0, height - 44, 84, 22, stroke=0, fill=1)
-                canv.rect(width - 84, height - 22, 84, 22, stroke=0, fill=1)
-            elif art == "impact_band":
-                canv.rect(0, height - 48, width, 18, stroke=0, fill=1)
-                canv.rect(width - 20, 0, 20, height, stroke=0, fill=1)
-            elif art == "photo_corner":
-                canv.rect(width - 78, height - 78, 50, 50, stroke=0, fill=1)
-                canv.circle(width - 28, height - 28, 8, stroke=0, fill=1)
-            canv.restoreState()
-
-        def _draw_page_border(canv, _doc):
-            width, height = pagesize
-            # Paint a deterministic page background first to avoid viewer-specific gray shading.
-            canv.saveState()
-            canv.setFillColor(bg_color)
-            canv.rect(0, 0, width, height, stroke=0, fill=1)
-            canv.restoreState()
-            _draw_template_art(canv, width, height)
-            if not template_cfg.get("page_border", True):
-                return
-            border_inset = 18
-            canv.saveState()
-            canv.setStrokeColor(accent_color)
-            canv.setLineWidth(1)
-            canv.rect(
-                border_inset,
-                border_inset,
-                width - (2 * border_inset),
-                height - (2 * border_inset),
-                stroke=1,
-                fill=0,
-            )
-            canv.restoreState()
+            return _ALIGNMENTS.get(str(align_str or "left").strip().lower(), TA_LEFT)
 
         # ---------- Styles ----------
         styles = {}
@@ -575,7 +1096,7 @@ class PDFGenerator:
         )
 
         # Section heading
-        heading_style = ParagraphStyle(
+        styles["Heading"] = ParagraphStyle(
             name="Heading",
             fontName=template_cfg["font_heading"],
             fontSize=template_cfg["font_size_heading"],
@@ -589,7 +1110,6 @@ class PDFGenerator:
             borderRadius=template_cfg.get("border_radius", 3),
             borderPadding=(3, 3, 3, 3),
         )
-        styles["Heading"] = heading_style
 
         # Body text
         body_align = _get_alignment(template_cfg.get("body_align", "left"))
@@ -625,6 +1145,277 @@ class PDFGenerator:
             spaceAfter=0,
         )
 
+        # Centered header variants
+        styles["HeaderTitleCenter"] = ParagraphStyle("HeaderTitleCenter", parent=styles["Title"], alignment=TA_CENTER)
+        styles["HeaderProfileCenter"] = ParagraphStyle("HeaderProfileCenter", parent=styles["ProfileTitle"], alignment=TA_CENTER)
+        styles["HeaderContactCenter"] = ParagraphStyle("HeaderContactCenter", parent=styles["Contact"], alignment=TA_CENTER)
+
+        # Two-column layout styles
+        styles["TwoColTitle"] = ParagraphStyle(
+            name="TwoColTitle",
+            fontName=template_cfg["font_heading"],
+            fontSize=template_cfg["font_size_title"],
+            textColor=colors.HexColor("#4b5563"),
+            alignment=TA_CENTER,
+            leading=template_cfg["font_size_title"] + 2,
+            spaceAfter=2,
+        )
+        styles["TwoColSubtitle"] = ParagraphStyle(
+            name="TwoColSubtitle",
+            fontName=template_cfg["font_body"],
+            fontSize=template_cfg["font_size_body"] + 1,
+            textColor=colors.HexColor("#6b7280"),
+            alignment=TA_CENTER,
+            leading=template_cfg["font_size_body"] + 2,
+            spaceAfter=1,
+        )
+        styles["TwoColHeading"] = ParagraphStyle(
+            name="TwoColHeading",
+            fontName=template_cfg["font_heading"],
+            fontSize=template_cfg["font_size_heading"] + 2,
+            textColor=accent_color,
+            alignment=TA_LEFT,
+            leading=template_cfg["font_size_heading"] + 2,
+            spaceBefore=4,
+            spaceAfter=1,
+        )
+        styles["TwoColBody"] = ParagraphStyle(
+            name="TwoColBody",
+            fontName=template_cfg["font_body"],
+            fontSize=template_cfg["font_size_body"],
+            textColor=colors.HexColor("#4b5563"),
+            alignment=TA_LEFT,
+            leading=template_cfg["font_size_body"] + 1,
+            spaceAfter=0,
+        )
+        styles["TwoColMeta"] = ParagraphStyle(
+            name="TwoColMeta",
+            fontName=template_cfg["font_body"],
+            fontSize=max(7, template_cfg["font_size_body"] - 1),
+            textColor=colors.HexColor("#6b7280"),
+            alignment=TA_LEFT,
+            leading=template_cfg["font_size_body"] + 1,
+            spaceAfter=0,
+        )
+        styles["TwoColEmphasis"] = ParagraphStyle(
+            name="TwoColEmphasis",
+            fontName=template_cfg["font_heading"],
+            fontSize=template_cfg["font_size_body"] + 1,
+            textColor=colors.HexColor("#1f2937"),
+            alignment=TA_LEFT,
+            leading=template_cfg["font_size_body"] + 2,
+            spaceAfter=0,
+        )
+        styles["TwoColTitleLeft"] = ParagraphStyle("TwoColTitleLeft", parent=styles["TwoColTitle"], alignment=TA_LEFT)
+        styles["TwoColSubtitleLeft"] = ParagraphStyle("TwoColSubtitleLeft", parent=styles["TwoColSubtitle"], alignment=TA_LEFT)
+        styles["TwoColSubtitleRight"] = ParagraphStyle("TwoColSubtitleRight", parent=styles["TwoColSubtitle"], alignment=TA_RIGHT)
+
+        return {
+            "template_cfg": template_cfg,
+            "accent_color": accent_color,
+            "bg_color": bg_color,
+            "section_spacing": section_spacing,
+            "item_spacing": item_spacing,
+            "section_tail_spacing": section_tail_spacing,
+            "styles": styles,
+        }
+
+    @staticmethod
+    def generate(
+        resume: Resume,
+        output: Union[str, io.BytesIO],
+        template_name: str = "corporate",  # Default to new corporate template
+        page_size: str = "letter",
+        layout_override: Optional[str] = None,
+        heading_align_override: Optional[str] = None,
+        body_align_override: Optional[str] = None,
+        accent_color_override: Optional[str] = None,
+        font_override: Optional[str] = None,
+        page_border_override: Optional[bool] = None,
+        compact_mode: bool = False,
+        ats_safe_mode: bool = False,
+        section_order: Optional[List[str]] = None,
+        font_scale: float = 1.0,
+        margin_preset: str = "normal",
+        section_visibility: Optional[dict] = None,
+        header_layout: Optional[str] = None,
+        draft: bool = False,
+        spacing_scale: float = 1.0,
+        fit_to_pages: Optional[int] = None,
+        deterministic: Optional[bool] = None,
+        output_profile: str = "standard",
+        section_cache: Optional["SectionCacheScope"] = None,
+        timer: Optional[RenderTimer] = None,
+        layout_probe: Optional[LayoutProbe] = None,
+        story_sink: Optional[list] = None,
+    ) -> Union[str, io.BytesIO]:
+        """
+        Generate a beautifully formatted PDF resume with support for
+        icons, education tables, two-column references, and achievements.
+
+        ``draft`` favours latency over fidelity for live preview: built-in fonts,
+        no template art, profile photo or QR drawing, and uncompressed page streams.
+
+        When ``section_cache`` is given (incremental preview), single-column
+        sections whose inputs are unchanged reuse their previously built flowables.
+
+        Stage durations (styles, story, per-section, build) are recorded on ``timer``.
+
+        With ``layout_probe`` the story is laid out but no PDF is written; see
+        ``PDFGenerator.measure_layout``.
+
+        With ``story_sink`` nothing is built either: (story, doc, page_callback)
+        is appended to it instead; see ``PDFGenerator.generate_book``.
+
+        ``fit_to_pages`` shrinks font scale, spacing and margins (never beyond the
+        requested values) until the resume fits; see ``PDFGenerator.fit_settings``.
+
+        ``deterministic`` (default ``AppConfig.DETERMINISTIC_PDF``) pins creation
+        dates and the document ID so identical inputs give byte-identical PDFs.
+
+        ``output_profile="compact"`` targets upload-size limits: compressed page
+        streams, a lower-DPI JPEG photo and no unused base font. TTF fonts are
+        always embedded as subsets.
+
+        ATS-safe single-column resumes are drawn directly on the canvas by
+        ``ats_renderer`` (``AppConfig.ATS_FAST_RENDER``); measuring, book and
+        two-column renders always go through Platypus.
+        """
+        if timer is None:
+            timer = RenderTimer()
+        if fit_to_pages:
+            with timer.stage("fit"):
+                fitted = PDFGenerator.fit_settings(
+                    resume,
+                    int(fit_to_pages),
+                    template_name=template_name,
+                    page_size=page_size,
+                    layout_override=layout_override,
+                    heading_align_override=heading_align_override,
+                    body_align_override=body_align_override,
+                    accent_color_override=accent_color_override,
+                    font_override=font_override,
+                    page_border_override=page_border_override,
+                    compact_mode=compact_mode,
+                    ats_safe_mode=ats_safe_mode,
+                    section_order=section_order,
+                    font_scale=font_scale,
+                    margin_preset=margin_preset,
+                    section_visibility=section_visibility,
+                    header_layout=header_layout,
+                    draft=draft,
+                    spacing_scale=spacing_scale,
+                    deterministic=deterministic,
+                    output_profile=output_profile,
+                )
+            font_scale = fitted["font_scale"]
+            spacing_scale = fitted["spacing_scale"]
+            margin_preset = fitted["margin_preset"]
+            if layout_probe is not None:
+                layout_probe.fitted = fitted
+        # Select page size
+        pagesize = A4 if page_size.lower() == "a4" else letter
+
+        # Resolved config, colors and styles come from the compiled template registry.
+        template_name = PDFGenerator._resolve_template_name(template_name)
+        try:
+            fs = float(font_scale)
+        except Exception:
+            fs = 1.0
+        fs = min(1.3, max(0.8, fs))
+        try:
+            ss = min(1.5, max(0.5, float(spacing_scale)))
+        except Exception:
+            ss = 1.0
+        settings_args = (
+            template_name,
+            _settings_key(layout_override),
+            _settings_key(heading_align_override),
+            _settings_key(body_align_override),
+            _settings_key(accent_color_override),
+            _settings_key(font_override),
+            page_border_override if page_border_override is None else bool(page_border_override),
+            bool(compact_mode),
+            bool(ats_safe_mode),
+            fs,
+            ss,
+            bool(draft),
+        )
+        with timer.stage("styles"):
+            compiled = PDFGenerator._compile_render_settings(*settings_args)
+        story_started = time.perf_counter()
+        template_cfg = compiled["template_cfg"]
+        accent_color = compiled["accent_color"]
+        bg_color = compiled["bg_color"]
+        section_spacing = compiled["section_spacing"]
+        item_spacing = compiled["item_spacing"]
+        section_tail_spacing = compiled["section_tail_spacing"]
+        styles = compiled["styles"]
+
+        margin_value = _MARGIN_PRESETS.get(str(margin_preset or "normal").lower(), 72)
+        if deterministic is None:
+            deterministic = AppConfig.DETERMINISTIC_PDF
+        # ReportLab's invariant mode fixes timestamps and derives the document ID from content.
+        doc_kwargs = {"invariant": 1} if deterministic else {}
+        compact_output = str(output_profile or "").strip().lower() == "compact"
+        if compact_output:
+            # The canvas preamble selects this font; using the body font avoids embedding
+            # a Helvetica resource the page never uses.
+            doc_kwargs["initialFontName"] = template_cfg["font_body"]
+
+        # Document setup
+        doc = SimpleDocTemplate(
+            output,
+            pagesize=pagesize,
+            rightMargin=margin_value,
+            leftMargin=margin_value,
+            topMargin=margin_value,
+            bottomMargin=margin_value,
+            title=f"Resume - {resume.full_name}",
+            author=resume.full_name,
+            pageCompression=1 if compact_output else (0 if draft else None),
+            **doc_kwargs,
+        )
+
+        # Draw page border on every page without affecting flowable layout.
+        def _draw_page_border(canv, _doc):
+            # Background, art and border are the same on every page and across documents
+            # sharing template/page size/colors: replay the cached display list.
+            for method, args in _page_decoration(
+                "" if draft else str(template_cfg.get("bg_art", "")).strip().lower(),
+                pagesize,
+                _color_key(bg_color),
+                _color_key(accent_color),
+                bool(template_cfg.get("page_border", True)),
+            ):
+                getattr(canv, method)(*args)
+
+        if (
+            ats_safe_mode
+            and AppConfig.ATS_FAST_RENDER
+            and template_cfg.get("layout") != "two_column"
+            and layout_probe is None
+            and story_sink is None
+        ):
+            # Fast path: same content and pagination as the story below, without Platypus.
+            from ats_renderer import render_ats_resume
+
+            timer.add("story", (time.perf_counter() - story_started) * 1000.0)
+            with timer.stage("build"):
+                render_ats_resume(
+                    resume,
+                    doc,
+                    compiled,
+                    template_name,
+                    _draw_page_border,
+                    header_layout=header_layout,
+                    section_order=section_order,
+                    section_visibility=section_visibility,
+                    draft=draft,
+                    compact_output=compact_output,
+                )
+            return output
+
         def _append_meta_row(left_html: str, right_html: str, left_ratio: float = 0.72):
             """Consistent left/right alignment row for date/meta fields."""
             left_text = str(left_html or "").strip()
@@ -649,45 +1440,14 @@ class PDFGenerator:
             elif right_text:
                 story.append(Paragraph(right_text, styles["BodySmall"]))
 
-        def _format_location(resume_obj, sep=", "):
-            """Build a clean location string from city/address without duplicates."""
-            city = (getattr(resume_obj, "city", "") or "").strip()
-            address = (getattr(resume_obj, "address", "") or "").strip()
-            if city and address:
-                if city.lower() in address.lower():
-                    return address
-                if address.lower() in city.lower():
-                    return city
-                return f"{city}{sep}{address}"
-            return city or address
-
-        def _normalize_url(url: str) -> str:
-            raw = (url or "").strip()
-            if not raw:
-                return ""
-            if raw.startswith(("http://", "https://", "mailto:", "tel:")):
-                return raw
-            return f"https://{raw}"
-
         def _link(label: str, url: str) -> str:
             target = _normalize_url(url)
             if not target:
                 return html.escape(label or "")
             return f'<link href="{html.escape(target, quote=True)}">{html.escape(label or target)}</link>'
 
-        def _format_date_range(start: str, end: str, default_present_if_start_only: bool = True) -> str:
-            """Build clean date text without leading/trailing separators."""
-            s = (start or "").strip()
-            e = (end or "").strip()
-            if s and (not e) and default_present_if_start_only:
-                e = "Present"
-            if s and e:
-                return template_cfg["date_format"].format(start=s, end=e).strip()
-            if s:
-                return s
-            if e:
-                return e
-            return ""
+        def _date_range(start: str, end: str, default_present_if_start_only: bool = True) -> str:
+            return _format_date_range(template_cfg["date_format"], start, end, default_present_if_start_only)
 
         # ---------- Helper: Contact with icons ----------
         def _format_contact(resume):
@@ -714,65 +1474,36 @@ class PDFGenerator:
         if normalized_header_layout not in {"default", "left", "center", "split"}:
             normalized_header_layout = "default"
 
+        def _mark_section(name: str):
+            if layout_probe is not None:
+                story.append(layout_probe.marker(name))
+
+        def _build(story):
+            if story_sink is not None:
+                story_sink.append((story, doc, _draw_page_border))
+                return
+            with timer.stage("build"):
+                if layout_probe is not None:
+                    layout_probe.attach(doc)
+                    frame = _LayoutFrame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id="normal")
+                    doc.addPageTemplates([
+                        PageTemplate(id="First", frames=frame, pagesize=doc.pagesize),
+                        PageTemplate(id="Later", frames=frame, pagesize=doc.pagesize),
+                    ])
+                    BaseDocTemplate.build(doc, story, canvasmaker=_LayoutCanvas)
+                else:
+                    doc.build(story, onFirstPage=_draw_page_border, onLaterPages=_draw_page_border)
+
         # ---------- Dedicated two-column layout ----------
         if template_cfg.get("layout") == "two_column":
             story = []
+            _mark_section("header")
 
-            title_center_style = ParagraphStyle(
-                name="TwoColTitle",
-                fontName=template_cfg["font_heading"],
-                fontSize=template_cfg["font_size_title"],
-                textColor=colors.HexColor("#4b5563"),
-                alignment=TA_CENTER,
-                leading=template_cfg["font_size_title"] + 2,
-                spaceAfter=2,
-            )
-            subtitle_center_style = ParagraphStyle(
-                name="TwoColSubtitle",
-                fontName=template_cfg["font_body"],
-                fontSize=template_cfg["font_size_body"] + 1,
-                textColor=colors.HexColor("#6b7280"),
-                alignment=TA_CENTER,
-                leading=template_cfg["font_size_body"] + 2,
-                spaceAfter=1,
-            )
-            two_col_heading_style = ParagraphStyle(
-                name="TwoColHeading",
-                fontName=template_cfg["font_heading"],
-                fontSize=template_cfg["font_size_heading"] + 2,
-                textColor=accent_color,
-                alignment=TA_LEFT,
-                leading=template_cfg["font_size_heading"] + 2,
-                spaceBefore=4,
-                spaceAfter=1,
-            )
-            two_col_body_style = ParagraphStyle(
-                name="TwoColBody",
-                fontName=template_cfg["font_body"],
-                fontSize=template_cfg["font_size_body"],
-                textColor=colors.HexColor("#4b5563"),
-                alignment=TA_LEFT,
-                leading=template_cfg["font_size_body"] + 1,
-                spaceAfter=0,
-            )
-            two_col_meta_style = ParagraphStyle(
-                name="TwoColMeta",
-                fontName=template_cfg["font_body"],
-                fontSize=max(7, template_cfg["font_size_body"] - 1),
-                textColor=colors.HexColor("#6b7280"),
-                alignment=TA_LEFT,
-                leading=template_cfg["font_size_body"] + 1,
-                spaceAfter=0,
-            )
-            two_col_emphasis_style = ParagraphStyle(
-                name="TwoColEmphasis",
-                fontName=template_cfg["font_heading"],
-                fontSize=template_cfg["font_size_body"] + 1,
-                textColor=colors.HexColor("#1f2937"),
-                alignment=TA_LEFT,
-                leading=template_cfg["font_size_body"] + 2,
-                spaceAfter=0,
-            )
+            title_center_style = styles["TwoColTitle"]
+            subtitle_center_style = styles["TwoColSubtitle"]
+            two_col_heading_style = styles["TwoColHeading"]
+            two_col_body_style = styles["TwoColBody"]
+            two_col_meta_style = styles["TwoColMeta"]
 
             def _add_section(target, title):
                 target.append(Paragraph(title.upper(), two_col_heading_style))
@@ -782,13 +1513,15 @@ class PDFGenerator:
                     target.append(Paragraph(str(text).strip(), style))
 
             # Header block
-            title_left_style = ParagraphStyle("TwoColTitleLeft", parent=title_center_style, alignment=TA_LEFT)
-            subtitle_left_style = ParagraphStyle("TwoColSubtitleLeft", parent=subtitle_center_style, alignment=TA_LEFT)
-            subtitle_right_style = ParagraphStyle("TwoColSubtitleRight", parent=subtitle_center_style, alignment=TA_RIGHT)
-            if resume.profile_pic:
+            title_left_style = styles["TwoColTitleLeft"]
+            subtitle_left_style = styles["TwoColSubtitleLeft"]
+            subtitle_right_style = styles["TwoColSubtitleRight"]
+            if resume.profile_pic and not draft:
                 try:
                     image_align = "CENTER" if normalized_header_layout == "center" else "LEFT"
-                    profile_img = PDFGenerator._build_profile_image_flowable(resume.profile_pic, align=image_align)
+                    profile_img = PDFGenerator._build_profile_image_flowable(
+                        resume.profile_pic, align=image_align, compact=compact_output
+                    )
                     if profile_img:
                         story.append(profile_img)
                         story.append(Spacer(1, 0.08 * inch))
@@ -899,7 +1632,7 @@ class PDFGenerator:
 
                     date_place_bits = []
                     if exp.start_date or exp.end_date:
-                        date_place_bits.append(_format_date_range(exp.start_date, exp.end_date, True))
+                        date_place_bits.append(_date_range(exp.start_date, exp.end_date, True))
                     location_text = _format_location(resume)
                     if location_text:
                         date_place_bits.append(location_text)
@@ -918,7 +1651,7 @@ class PDFGenerator:
                     _add_para(right_col, f"{proj.name.upper()}", two_col_body_style)
                     meta_bits = []
                     if proj.start_date or proj.end_date:
-                        proj_date = _format_date_range(proj.start_date, proj.end_date, False)
+                        proj_date = _date_range(proj.start_date, proj.end_date, False)
                         if proj_date:
                             meta_bits.append(proj_date)
                     if proj.role:
@@ -950,36 +1683,35 @@ class PDFGenerator:
 
             left_ratio = float(template_cfg.get("left_column_ratio", 0.32))
             left_ratio = min(0.45, max(0.22, left_ratio))
-            two_col_table = Table(
-                [[left_col, right_col]],
-                colWidths=[doc.width * left_ratio, doc.width * (1 - left_ratio)],
+            left_width = doc.width * left_ratio
+            # Sidebar keeps a 12pt gutter on its right, the main column 8pt on its left.
+            columns = _FlowingColumns(
+                [(0, left_width - 12, left_col), (left_width + 8, doc.width - left_width - 8, right_col)],
+                doc.width,
             )
-            two_col_table.setStyle(TableStyle([
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (0, -1), 0),
-                ("RIGHTPADDING", (0, 0), (0, -1), 12),
-                ("LEFTPADDING", (1, 0), (1, -1), 8),
-                ("RIGHTPADDING", (1, 0), (1, -1), 0),
-                ("TOPPADDING", (0, 0), (-1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-            ]))
-            story.append(two_col_table)
+            # Both columns flow together, so the probe sees them as a single section.
+            _mark_section("columns")
+            story.append(columns)
 
-            doc.build(story, onFirstPage=_draw_page_border, onLaterPages=_draw_page_border)
+            timer.add("story", (time.perf_counter() - story_started) * 1000.0)
+            _build(story)
             return output
 
         # ---------- Story ----------
         story = []
+        _mark_section("header")
 
         # ----- Profile Photo (if uploaded) -----
-        if resume.profile_pic:
+        if resume.profile_pic and not draft:
             try:
                 image_align = {
                     "left": "LEFT",
                     "center": "CENTER",
                     "right": "RIGHT",
                 }.get(template_cfg.get("heading_align", "left"), "LEFT")
-                profile_img = PDFGenerator._build_profile_image_flowable(resume.profile_pic, align=image_align)
+                profile_img = PDFGenerator._build_profile_image_flowable(
+                    resume.profile_pic, align=image_align, compact=compact_output
+                )
                 if profile_img:
                     story.append(profile_img)
                     story.append(Spacer(1, 0.1 * inch))
@@ -1055,9 +1787,9 @@ class PDFGenerator:
             profile_style = styles["ProfileTitle"]
             contact_style = styles["Contact"]
             if normalized_header_layout == "center":
-                title_style = ParagraphStyle("HeaderTitleCenter", parent=styles["Title"], alignment=TA_CENTER)
-                profile_style = ParagraphStyle("HeaderProfileCenter", parent=styles["ProfileTitle"], alignment=TA_CENTER)
-                contact_style = ParagraphStyle("HeaderContactCenter", parent=styles["Contact"], alignment=TA_CENTER)
+                title_style = styles["HeaderTitleCenter"]
+                profile_style = styles["HeaderProfileCenter"]
+                contact_style = styles["HeaderContactCenter"]
             if resume.full_name:
                 story.append(Paragraph(resume.full_name, title_style))
             if resume.profile_title:
@@ -1070,7 +1802,10 @@ class PDFGenerator:
         # ----- QR Link (optional) -----
         if getattr(resume, "qr_link", None):
             qr_text = str(resume.qr_link).strip()
-            if qr_text:
+            if qr_text and draft:
+                story.append(Paragraph(f"<i>QR:</i> {qr_text}", styles["Body"]))
+                story.append(Spacer(1, section_tail_spacing))
+            elif qr_text:
                 try:
                     from reportlab.graphics.barcode import qr as rl_qr
                     from reportlab.graphics.shapes import Drawing
@@ -1122,15 +1857,17 @@ class PDFGenerator:
                 return
             story.append(Paragraph("WORK EXPERIENCE", styles["Heading"]))
             for exp in resume.experiences:
+                # Title & company (left) / Date (right)
                 title_company = f"{exp.job_title}"
                 if exp.company:
                     title_company += f" at {exp.company}"
                 has_date = bool((exp.start_date and exp.start_date.strip()) or (exp.end_date and exp.end_date.strip()))
                 if has_date:
-                    date_str = _format_date_range(exp.start_date, exp.end_date, True)
+                    date_str = _date_range(exp.start_date, exp.end_date, True)
                     _append_meta_row(title_company, date_str)
                 else:
                     story.append(Paragraph(title_company, styles["Body"]))
+                # Description with bullet points
                 if exp.description:
                     bullet = template_cfg.get("bullet", "-")
                     for line in exp.description.strip().split("\n"):
@@ -1138,11 +1875,12 @@ class PDFGenerator:
                             story.append(Paragraph(f"{bullet} {line}", styles["Body"]))
                 story.append(Spacer(1, section_tail_spacing))
 
-        def _render_education():
+        def _render_education(skip_date_already_in_text: bool = False):
             if (not _is_visible("education")) or (not resume.educations):
                 return
             story.append(Paragraph("EDUCATION", styles["Heading"]))
             if template_cfg.get("education_table", False):
+                # Create compact education rows
                 table_data = []
                 for edu in resume.educations:
                     course = f"{edu.degree}"
@@ -1163,12 +1901,15 @@ class PDFGenerator:
                 ]))
                 story.append(t)
             else:
+                # Traditional education layout (with date on right)
                 for edu in resume.educations:
                     degree_inst = f"{edu.degree}"
                     if edu.institution:
                         degree_inst += f" at {edu.institution}"
-                    date_str = _format_date_range(edu.start_date, edu.end_date, False)
-                    if date_str:
+                    date_str = _date_range(edu.start_date, edu.end_date, False)
+                    date_text_l = str(date_str or "").strip().lower()
+                    date_already_in_text = bool(date_text_l and date_text_l in degree_inst.strip().lower())
+                    if date_str and not (skip_date_already_in_text and date_already_in_text):
                         _append_meta_row(degree_inst, date_str)
                     else:
                         story.append(Paragraph(degree_inst, styles["Body"]))
@@ -1176,15 +1917,15 @@ class PDFGenerator:
                         story.append(Paragraph(edu.description, styles["Body"]))
                     story.append(Spacer(1, section_tail_spacing))
 
-        def _render_projects():
+        def _render_projects(role_separator: str = " - "):
             if (not _is_visible("projects")) or (not resume.projects):
                 return
             story.append(Paragraph("PROJECTS", styles["Heading"]))
             for proj in resume.projects:
                 proj_name = f"{proj.name}"
                 if proj.role:
-                    proj_name += f" - {proj.role}"
-                date_str = _format_date_range(proj.start_date, proj.end_date, False)
+                    proj_name += f"{role_separator}{proj.role}"
+                date_str = _date_range(proj.start_date, proj.end_date, False)
                 if proj.start_date or proj.end_date:
                     _append_meta_row(proj_name, date_str)
                 else:
@@ -1200,179 +1941,9 @@ class PDFGenerator:
                     story.append(Paragraph(f"<i>Link:</i> {proj.link}", styles["Body"]))
                 story.append(Spacer(1, section_tail_spacing))
 
-        def _render_skills():
-            if (not _is_visible("skills")) or (not resume.skills):
-                return
-            story.append(Paragraph("SKILLS", styles["Heading"]))
-            bullet = template_cfg.get("bullet", "-")
-            for skill in sorted(resume.skills):
-                story.append(Paragraph(f"{bullet} {skill}", styles["Body"]))
-            story.append(Spacer(1, section_tail_spacing))
-
-        def _render_achievements():
-            if (not _is_visible("achievements")) or (not resume.achievements):
+        def _render_certifications():
+            if (not _is_visible("certifications")) or (not resume.certifications):
                 return
-            story.append(Paragraph("ACHIEVEMENTS", styles["Heading"]))
-            for ach in resume.achievements:
-                story.append(Paragraph(f"{ach.title}", styles["Body"]))
-                if ach.subtitle:
-                    story.append(Paragraph(ach.subtitle, styles["BodySmall"]))
-                if ach.description:
-                    story.append(Paragraph(ach.description, styles["Body"]))
-                story.append(Spacer(1, section_tail_spacing))
-
-        def _render_custom_sections():
-            if (not _is_visible("custom")) or (not getattr(resume, "custom_sections", None)):
-                return
-            for section in resume.custom_sections:
-                title = str(section.get("title", "")).strip()
-                items = section.get("items") or []
-                if not title or not items:
-                    continue
-                story.append(Paragraph(title.upper(), styles["Heading"]))
-                bullet = template_cfg.get("bullet", "-")
-                for item in items:
-                    line = str(item).strip()
-                    if line:
-                        story.append(Paragraph(f"{bullet} {line}", styles["Body"]))
-                story.append(Spacer(1, section_tail_spacing))
-
-        if use_ordered_sections:
-            renderers = {
-                "summary": _render_summary,
-                "experience": _render_experience,
-                "education": _render_education,
-                "projects": _render_projects,
-                "skills": _render_skills,
-                "achievements": _render_achievements,
-                "custom": _render_custom_sections,
-            }
-            for key in normalized_section_order:
-                renderer = renderers.get(key)
-                if renderer:
-                    renderer()
-
-        # ----- SUMMARY / ABOUT ME -----
-        if (not use_ordered_sections) and _is_visible("summary") and resume.summary and resume.summary.strip():
-            story.append(Paragraph("ABOUT ME" if template_name in ["corporate", "elegant_light"] else "SUMMARY", styles["Heading"]))
-            story.append(Paragraph(resume.summary.replace("\n", "<br/>"), styles["Body"]))
-            story.append(Spacer(1, section_tail_spacing))
-
-        # ----- WORK EXPERIENCE -----
-        if (not use_ordered_sections) and _is_visible("experience") and resume.experiences:
-            story.append(Paragraph("WORK EXPERIENCE", styles["Heading"]))
-            for exp in resume.experiences:
-                # Title & company (left) / Date (right)
-                title_company = f"{exp.job_title}"
-                if exp.company:
-                    title_company += f" at {exp.company}"
-
-                has_date = bool((exp.start_date and exp.start_date.strip()) or (exp.end_date and exp.end_date.strip()))
-                if has_date:
-                    date_str = _format_date_range(exp.start_date, exp.end_date, True)
-                    _append_meta_row(title_company, date_str)
-                else:
-                    story.append(Paragraph(title_company, styles["Body"]))
-
-                # Description with bullet points
-                if exp.description:
-                    desc_lines = exp.description.strip().split("\n")
-                    bullet = template_cfg.get("bullet", "-")
-                    for line in desc_lines:
-                        if line.strip():
-                            story.append(Paragraph(f"{bullet} {line}", styles["Body"]))
-                story.append(Spacer(1, section_tail_spacing))
-
-        # ----- EDUCATION (as Table, if enabled) -----
-        if (not use_ordered_sections) and _is_visible("education") and resume.educations:
-            story.append(Paragraph("EDUCATION", styles["Heading"]))
-
-            if template_cfg.get("education_table", False):
-                # Create compact education rows
-                table_data = []
-                for edu in resume.educations:
-                    course = f"{edu.degree}"
-                    if edu.institution:
-                        course += f"<br/>{edu.institution}"
-                    table_data.append([course])
-
-                # Calculate column widths
-                col_widths = [doc.width]
-                t = Table(table_data, colWidths=col_widths)
-                t.setStyle(TableStyle([
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('BACKGROUND', (0, 0), (-1, -1), colors.white),
-                    ('INNERGRID', (0, 0), (-1, -1), 0, colors.white),
-                    ('BOX', (0, 0), (-1, -1), 0, colors.white),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 2),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 2),
-                    ('TOPPADDING', (0, 0), (-1, -1), 2),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
-                ]))
-                story.append(t)
-            else:
-                # Traditional education layout (with date on right)
-                for edu in resume.educations:
-                    degree_inst = f"{edu.degree}"
-                    if edu.institution:
-                        degree_inst += f" at {edu.institution}"
-                    date_str = _format_date_range(edu.start_date, edu.end_date, False)
-                    degree_text_l = degree_inst.strip().lower()
-                    date_text_l = str(date_str or "").strip().lower()
-                    date_already_in_text = bool(date_text_l and date_text_l in degree_text_l)
-                    if date_str:
-                        if date_already_in_text:
-                            story.append(Paragraph(degree_inst, styles["Body"]))
-                        else:
-                            data = [
-                                [Paragraph(degree_inst, styles["Body"]),
-                                 Paragraph(date_str, styles["BodySmall"])]
-                            ]
-                            t = Table(data, colWidths=[doc.width * 0.72, doc.width * 0.28])
-                            t.setStyle(TableStyle([
-                                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                                ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-                                ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
-                                ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                                ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                                ('TOPPADDING', (0, 0), (-1, -1), 0),
-                                ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                            ]))
-                            story.append(t)
-                    else:
-                        story.append(Paragraph(degree_inst, styles["Body"]))
-                    if edu.description:
-                        story.append(Paragraph(edu.description, styles["Body"]))
-                    story.append(Spacer(1, section_tail_spacing))
-
-        # ----- PROJECTS -----
-        if (not use_ordered_sections) and _is_visible("projects") and resume.projects:
-            story.append(Paragraph("PROJECTS", styles["Heading"]))
-            for proj in resume.projects:
-                proj_name = f"{proj.name}"
-                if proj.role:
-                    proj_name += f" — {proj.role}"
-                date_str = _format_date_range(proj.start_date, proj.end_date, False)
-                if proj.start_date or proj.end_date:
-                    _append_meta_row(proj_name, date_str)
-                else:
-                    story.append(Paragraph(proj_name, styles["Body"]))
-
-                if proj.technologies:
-                    story.append(Paragraph(f"<i>Technologies:</i> {proj.technologies}", styles["Body"]))
-                if proj.description:
-                    desc_lines = proj.description.strip().split("\n")
-                    bullet = template_cfg.get("bullet", "-")
-                    for line in desc_lines:
-                        if line.strip():
-                            story.append(Paragraph(f"{bullet} {line}", styles["Body"]))
-                if proj.link:
-                    story.append(Paragraph(f"<i>Link:</i> {proj.link}", styles["Body"]))
-                story.append(Spacer(1, section_tail_spacing))
-
-        # ----- CERTIFICATIONS -----
-        if _is_visible("certifications") and resume.certifications:
             story.append(Paragraph("CERTIFICATIONS", styles["Heading"]))
             for cert in resume.certifications:
                 cert_name = f"{cert.name}"
@@ -1386,15 +1957,17 @@ class PDFGenerator:
                     story.append(Paragraph(f"<i>Credential:</i> {cert.link}", styles["Body"]))
                 story.append(Spacer(1, section_tail_spacing))
 
-        # ----- LANGUAGES -----
-        if _is_visible("languages") and resume.languages:
+        def _render_languages():
+            if (not _is_visible("languages")) or (not resume.languages):
+                return
             story.append(Paragraph("LANGUAGES", styles["Heading"]))
             for lang in resume.languages:
                 _append_meta_row(f"{lang.name}", lang.proficiency)
             story.append(Spacer(1, section_tail_spacing))
 
-        # ----- SKILLS -----
-        if (not use_ordered_sections) and _is_visible("skills") and resume.skills:
+        def _render_skills():
+            if (not _is_visible("skills")) or (not resume.skills):
+                return
             story.append(Paragraph("SKILLS", styles["Heading"]))
             # Bullet list style
             bullet = template_cfg.get("bullet", "-")
@@ -1402,8 +1975,9 @@ class PDFGenerator:
                 story.append(Paragraph(f"{bullet} {skill}", styles["Body"]))
             story.append(Spacer(1, section_tail_spacing))
 
-        # ----- ACHIEVEMENTS -----
-        if (not use_ordered_sections) and _is_visible("achievements") and resume.achievements:
+        def _render_achievements():
+            if (not _is_visible("achievements")) or (not resume.achievements):
+                return
             story.append(Paragraph("ACHIEVEMENTS", styles["Heading"]))
             for ach in resume.achievements:
                 story.append(Paragraph(f"{ach.title}", styles["Body"]))
@@ -1413,51 +1987,35 @@ class PDFGenerator:
                     story.append(Paragraph(ach.description, styles["Body"]))
                 story.append(Spacer(1, section_tail_spacing))
 
-        # ----- REFERENCES (Two-Column if enabled) -----
-        if _is_visible("references") and resume.references:
+        def _reference_block(ref) -> str:
+            text = f"{ref.name}"
+            if ref.title:
+                text += f"<br/>{ref.title}"
+            if ref.company:
+                text += f"<br/>{ref.company}"
+            if ref.phone:
+                text += f"<br/>📞 {ref.phone}"
+            if ref.email:
+                text += f"<br/>📧 {ref.email}"
+            if ref.website:
+                text += f"<br/>🌐 {ref.website}"
+            return text
+
+        def _render_references():
+            if (not _is_visible("references")) or (not resume.references):
+                return
             story.append(Paragraph("REFERENCES", styles["Heading"]))
-
             if template_cfg.get("references_two_column", False):
-                # Create two-column table for references
+                # Two-column table: pair references up row by row
                 refs = resume.references
-                # Pair them up
                 rows = []
                 for i in range(0, len(refs), 2):
-                    row = []
-                    # Left reference
-                    left = refs[i]
-                    left_text = f"{left.name}"
-                    if left.title:
-                        left_text += f"<br/>{left.title}"
-                    if left.company:
-                        left_text += f"<br/>{left.company}"
-                    if left.phone:
-                        left_text += f"<br/>📞 {left.phone}"
-                    if left.email:
-                        left_text += f"<br/>📧 {left.email}"
-                    if left.website:
-                        left_text += f"<br/>🌐 {left.website}"
-                    row.append(Paragraph(left_text, styles["Body"]))
-
-                    # Right reference (if exists)
+                    row = [Paragraph(_reference_block(refs[i]), styles["Body"])]
                     if i + 1 < len(refs):
-                        right = refs[i + 1]
-                        right_text = f"{right.name}"
-                        if right.title:
-                            right_text += f"<br/>{right.title}"
-                        if right.company:
-                            right_text += f"<br/>{right.company}"
-                        if right.phone:
-                            right_text += f"<br/>📞 {right.phone}"
-                        if right.email:
-                            right_text += f"<br/>📧 {right.email}"
-                        if right.website:
-                            right_text += f"<br/>🌐 {right.website}"
-                        row.append(Paragraph(right_text, styles["Body"]))
+                        row.append(Paragraph(_reference_block(refs[i + 1]), styles["Body"]))
                     else:
                         row.append("")
                     rows.append(row)
-
                 t = Table(rows, colWidths=[doc.width / 2.0 - 12, doc.width / 2.0 - 12])
                 t.setStyle(TableStyle([
                     ('VALIGN', (0, 0), (-1, -1), 'TOP'),
@@ -1485,8 +2043,9 @@ class PDFGenerator:
                         story.append(Paragraph(f"🌐 {ref.website}", styles["Body"]))
                     story.append(Spacer(1, section_tail_spacing))
 
-        # ----- CUSTOM SECTIONS -----
-        if (not use_ordered_sections) and _is_visible("custom") and getattr(resume, "custom_sections", None):
+        def _render_custom_sections():
+            if (not _is_visible("custom")) or (not getattr(resume, "custom_sections", None)):
+                return
             for section in resume.custom_sections:
                 title = str(section.get("title", "")).strip()
                 items = section.get("items") or []
@@ -1500,11 +2059,259 @@ class PDFGenerator:
                         story.append(Paragraph(f"{bullet} {line}", styles["Body"]))
                 story.append(Spacer(1, section_tail_spacing))
 
+        section_inputs = {
+            "summary": resume.summary,
+            "experience": resume.experiences,
+            "education": resume.educations,
+            "projects": resume.projects,
+            "certifications": resume.certifications,
+            "languages": resume.languages,
+            "skills": resume.skills,
+            "achievements": resume.achievements,
+            "references": resume.references,
+            "custom": getattr(resume, "custom_sections", None),
+        }
+        renderers = {
+            "summary": _render_summary,
+            "experience": _render_experience,
+            "education": _render_education,
+            "projects": _render_projects,
+            "certifications": _render_certifications,
+            "languages": _render_languages,
+            "skills": _render_skills,
+            "achievements": _render_achievements,
+            "references": _render_references,
+            "custom": _render_custom_sections,
+        }
+
+        def _emit_section(name: str, **kwargs):
+            """Render one section, reusing its flowables from the section cache when inputs are unchanged."""
+            _mark_section(name)
+            with timer.stage(f"section.{name}"):
+                _emit_section_flowables(name, **kwargs)
+
+        def _emit_section_flowables(name: str, **kwargs):
+            if section_cache is None:
+                renderers[name](**kwargs)
+                return
+            inputs = section_inputs[name]
+            if isinstance(inputs, list):
+                inputs = [asdict(item) if is_dataclass(item) else item for item in inputs]
+            key_source = json.dumps(
+                [name, kwargs, _is_visible(name), settings_args, doc.width, inputs],
+                sort_keys=True,
+                ensure_ascii=False,
+            )
+            key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+            cached = section_cache.get(key)
+            if cached is not None:
+                story.extend(pickle.loads(cached))
+                return
+            start = len(story)
+            renderers[name](**kwargs)
+            # doc.build mutates the flowables it lays out, nested table cells included, so the cache
+            # keeps a pickled snapshot taken before layout and every hit unpickles its own objects
+            # (a deep copy, but several times cheaper than copy.deepcopy).
+            try:
+                snapshot = pickle.dumps(story[start:], pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                logger.debug("Section %s is not picklable; not caching it", name, exc_info=True)
+                return
+            section_cache.put(key, snapshot)
+
+        if use_ordered_sections:
+            for key in normalized_section_order:
+                _emit_section(key)
+        else:
+            # Default order keeps the original formatting of the fixed layout.
+            _emit_section("summary")
+            _emit_section("experience")
+            _emit_section("education", skip_date_already_in_text=True)
+            _emit_section("projects", role_separator=" — ")
+        _emit_section("certifications")
+        _emit_section("languages")
+        if not use_ordered_sections:
+            _emit_section("skills")
+            _emit_section("achievements")
+        _emit_section("references")
+        if not use_ordered_sections:
+            _emit_section("custom")
+
+        timer.add("story", (time.perf_counter() - story_started) * 1000.0)
+
         # Build the PDF
-        doc.build(story, onFirstPage=_draw_page_border, onLaterPages=_draw_page_border)
+        _build(story)
+        return output
+
+    @staticmethod
+    def measure_layout(resume: Resume, timer: Optional[RenderTimer] = None, **options) -> dict:
+        """
+        Dry-run layout: page count, remaining space on the last page (points and
+        fraction of the frame) and the section crossing each page boundary, without
+        serializing a PDF.
+        """
+        probe = LayoutProbe()
+        PDFGenerator.generate(resume, io.BytesIO(), timer=timer, layout_probe=probe, **options)
+        return probe.report()
+
+    @staticmethod
+    def generate_book(
+        resumes: List[Resume],
+        output: Union[str, io.BytesIO],
+        title: str = "Resumes",
+        timer: Optional[RenderTimer] = None,
+        **options,
+    ) -> Union[str, io.BytesIO]:
+        """
+        Render several resumes into one PDF. Each candidate starts on a new page
+        and gets a top-level outline bookmark. All resumes go through a single
+        canvas, so every font subset and page decoration is embedded once for the
+        whole book rather than once per resume.
+
+        ``options`` are those of ``generate`` and apply to every resume.
+        ``fit_to_pages`` is ignored, because all candidates share one page frame.
+        """
+        if timer is None:
+            timer = RenderTimer()
+        for name in ("fit_to_pages", "section_cache", "layout_probe"):
+            options.pop(name, None)
+        parts = []
+        for resume in resumes:
+            PDFGenerator.generate(resume, output, timer=timer, story_sink=parts, **options)
+        if not parts:
+            raise ValueError("A resume book needs at least one resume")
+
+        _, first_doc, draw_page = parts[0]
+        doc = SimpleDocTemplate(
+            output,
+            pagesize=first_doc.pagesize,
+            rightMargin=first_doc.rightMargin,
+            leftMargin=first_doc.leftMargin,
+            topMargin=first_doc.topMargin,
+            bottomMargin=first_doc.bottomMargin,
+            title=title,
+            pageCompression=first_doc.pageCompression,
+            invariant=first_doc.invariant,
+            initialFontName=first_doc.initialFontName,
+        )
+        story = []
+        for index, (resume, (part, _, _)) in enumerate(zip(resumes, parts)):
+            if index:
+                story.append(PageBreak())
+            label = resume.full_name or resume.title or f"Resume {index + 1}"
+            story.append(_CandidateBookmark(f"candidate-{index}", label))
+            story.extend(part)
+
+        def _first_page(canv, page_doc):
+            # Open with the bookmark panel visible so readers can jump between candidates.
+            canv.showOutline()
+            draw_page(canv, page_doc)
+
+        with timer.stage("build"):
+            doc.build(story, onFirstPage=_first_page, onLaterPages=draw_page)
         return output
 
+    @staticmethod
+    def fit_settings(
+        resume: Resume,
+        pages: int,
+        font_scale: float = 1.0,
+        spacing_scale: float = 1.0,
+        margin_preset: str = "normal",
+        **options,
+    ) -> dict:
+        """
+        Find the most readable font scale, spacing scale and margin preset, none
+        larger than requested, whose layout fits in ``pages`` pages. Margins are
+        given up first, then spacing, then font size. Candidates are measured with
+        layout-only builds and binary-searched, so a solve costs a handful of
+        measurements. If nothing fits, the tightest settings are returned with
+        ``fits`` False.
+        """
+        options.pop("fit_to_pages", None)
+        pages = max(1, int(pages))
+        try:
+            requested_fs = min(1.3, max(0.8, float(font_scale)))
+        except Exception:
+            requested_fs = 1.0
+        requested_margin = _MARGIN_PRESETS.get(str(margin_preset or "normal").lower(), 72)
+        font_scales = [requested_fs] + [x for x in _FIT_FONT_SCALES if x < requested_fs]
+        spacing_scales = [spacing_scale] + [x for x in _FIT_SPACING_SCALES if x < spacing_scale]
+        margin_presets = [margin_preset] + [m for m in _FIT_MARGIN_PRESETS if _MARGIN_PRESETS[m] < requested_margin]
+
+        measured = {}
+
+        def page_count(fs, ss, mp) -> int:
+            if (fs, ss, mp) not in measured:
+                layout = PDFGenerator.measure_layout(
+                    resume, font_scale=fs, spacing_scale=ss, margin_preset=mp, **options
+                )
+                measured[(fs, ss, mp)] = layout["pages"]
+            return measured[(fs, ss, mp)]
 
+        def result(fs, ss, mp) -> dict:
+            count = page_count(fs, ss, mp)
+            return {
+                "font_scale": fs,
+                "spacing_scale": ss,
+                "margin_preset": mp,
+                "pages": count,
+                "fits": count <= pages,
+                "measurements": len(measured),
+            }
 
+        if page_count(requested_fs, spacing_scale, margin_preset) <= pages:
+            return result(requested_fs, spacing_scale, margin_preset)
+        # Largest font that fits at all (with the tightest spacing and margins) ...
+        tightest_ss, tightest_mp = spacing_scales[-1], margin_presets[-1]
+        fi = _first_fitting(font_scales, lambda fs: page_count(fs, tightest_ss, tightest_mp) <= pages)
+        if fi is None:
+            logger.info("Resume does not fit in %s page(s) even at the tightest settings", pages)
+            return result(font_scales[-1], tightest_ss, tightest_mp)
+        fs = font_scales[fi]
+        # ... then give back as much spacing, and then margin, as still fits.
+        si = _first_fitting(spacing_scales, lambda ss: page_count(fs, ss, tightest_mp) <= pages)
+        ss = spacing_scales[si]
+        mi = _first_fitting(margin_presets, lambda mp: page_count(fs, ss, mp) <= pages)
+        return result(fs, ss, margin_presets[mi])
 
+    @staticmethod
+    def render_key(resume: Resume, **options) -> str:
+        """Stable content hash of the render inputs (resume content + resolved options + renderer version)."""
+        data = asdict(resume)
+        # Bookkeeping fields never reach the page.
+        for field_name in ("id", "title", "created", "updated"):
+            data.pop(field_name, None)
+        pic = data.pop("profile_pic", None)
+        data["profile_pic_sha256"] = hashlib.sha256(pic).hexdigest() if pic else ""
+        opts = dict(options)
+        opts["template_name"] = PDFGenerator._resolve_template_name(opts.get("template_name", "corporate"))
+        opts["page_size"] = str(opts.get("page_size") or "letter").strip().lower()
+        payload = json.dumps(
+            {"resume": data, "options": opts, "renderer": _RENDERER_FINGERPRINT},
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def render_cached(
+        resume: Resume,
+        section_cache: Optional["SectionCacheScope"] = None,
+        timer: Optional[RenderTimer] = None,
+        **options,
+    ) -> bytes:
+        """Return PDF bytes for the given inputs, serving repeats from the render cache."""
+        if timer is None:
+            timer = RenderTimer()
+        with timer.stage("cache"):
+            key = PDFGenerator.render_key(resume, **options)
+            cached = render_cache.get(key)
+        if cached is not None:
+            return cached
+        buffer = io.BytesIO()
+        PDFGenerator.generate(resume, buffer, section_cache=section_cache, timer=timer, **options)
+        data = buffer.getvalue()
+        render_cache.put(key, data)
+        return data
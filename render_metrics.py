@@ -0,0 +1,92 @@
+"""
+Per-stage render timing: request-scoped stage timers (exposed as Server-Timing
+headers) and process-wide per-template latency histograms.
+"""
+import threading
+import time
+from itertools import accumulate
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping, Optional
+
+# Upper bounds (ms) of the histogram buckets; anything slower lands in "inf".
+_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class RenderTimer:
+    """Collects wall-clock durations (ms) of named stages for one request or render."""
+
+    def __init__(self):
+        self.stages: "OrderedDict[str, float]" = OrderedDict()
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000.0)
+
+    def add(self, name: str, ms: float) -> None:
+        # Repeated stages (e.g. a section emitted twice) accumulate.
+        self.stages[name] = self.stages.get(name, 0.0) + ms
+
+    def merge(self, stages: Mapping[str, float]) -> None:
+        for name, ms in stages.items():
+            self.add(name, ms)
+
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self._started) * 1000.0
+
+    def server_timing(self, include_total: bool = True) -> str:
+        """Format the stages as a Server-Timing header value."""
+        parts = [f"{name};dur={ms:.1f}" for name, ms in self.stages.items()]
+        if include_total:
+            parts.append(f"total;dur={self.total_ms():.1f}")
+        return ", ".join(parts)
+
+
+class StageHistograms:
+    """Thread-safe latency histograms keyed by (template, stage)."""
+
+    def __init__(self):
+        self._series: Dict[tuple, dict] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, template_name: str, stages: Mapping[str, float], total_ms: Optional[float] = None) -> None:
+        samples = dict(stages)
+        if total_ms is not None:
+            samples["total"] = total_ms
+        with self._lock:
+            for stage, ms in samples.items():
+                series = self._series.get((template_name, stage))
+                if series is None:
+                    series = {"count": 0, "sum_ms": 0.0, "max_ms": 0.0, "buckets": [0] * (len(_BUCKETS_MS) + 1)}
+                    self._series[(template_name, stage)] = series
+                series["count"] += 1
+                series["sum_ms"] += ms
+                series["max_ms"] = max(series["max_ms"], ms)
+                index = next((i for i, bound in enumerate(_BUCKETS_MS) if ms <= bound), len(_BUCKETS_MS))
+                series["buckets"][index] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def stats(self) -> dict:
+        bounds = list(_BUCKETS_MS) + ["inf"]
+        out: Dict[str, dict] = {}
+        with self._lock:
+            for (template_name, stage), series in sorted(self._series.items()):
+                out.setdefault(template_name, {})[stage] = {
+                    "count": series["count"],
+                    "mean_ms": round(series["sum_ms"] / series["count"], 2),
+                    "max_ms": round(series["max_ms"], 2),
+                    # Cumulative, Prometheus-style [le_ms, count] pairs: count of samples <= le_ms.
+                    "buckets": [[bound, count] for bound, count in zip(bounds, accumulate(series["buckets"]))],
+                }
+        return out
+
+
+render_timings = StageHistograms()
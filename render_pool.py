@@ -0,0 +1,185 @@
+"""
+Process pool of warm PDF renderer processes used for multi-template exports.
+"""
+import io
+import logging
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import AppConfig
+from models import Resume
+from pdf_generator import PDFGenerator, render_cache, _register_custom_fonts
+from render_metrics import RenderTimer, render_timings
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _warm_worker() -> None:
+    """Pool initializer: load fonts once so every render in the worker starts warm."""
+    _register_custom_fonts()
+
+
+def _render_in_worker(resume: Resume, options: dict) -> Tuple[bytes, Dict[str, float]]:
+    """Render one PDF; stage timings travel back with the bytes so the parent can aggregate them."""
+    timer = RenderTimer()
+    buffer = io.BytesIO()
+    PDFGenerator.generate(resume, buffer, timer=timer, **options)
+    timer.add("render", timer.total_ms())
+    return buffer.getvalue(), dict(timer.stages)
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    global _pool
+    workers = AppConfig.RENDER_POOL_WORKERS
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # Spawned (not forked) workers avoid inheriting locks held by other request threads.
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+        return _pool
+
+
+def _discard_pool(pool: Optional[ProcessPoolExecutor], terminate: bool = False) -> None:
+    """
+    Stop using ``pool`` (the next _get_pool() starts a fresh one). ``terminate``
+    kills its workers too: a running task cannot be cancelled, so this is the
+    only way to reclaim a worker stuck on a render. Other renders in flight on
+    that pool then fail with BrokenProcessPool and are resubmitted by their callers.
+    """
+    global _pool
+    if pool is None:
+        return
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    if terminate:
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_render_jobs(
+    jobs: Iterable[Tuple[Resume, dict]], window: Optional[int] = None
+) -> Iterator[Tuple[Optional[bytes], Optional[BaseException]]]:
+    """
+    Render (resume, options) jobs, yielding (pdf_bytes, error) in input order as
+    each one becomes available. Cached results are reused; remaining renders run
+    in parallel across the pool. ``jobs`` is consumed lazily and at most
+    ``window`` renders are in flight (default: all of them), so a long batch only
+    holds a bounded number of resumes and PDFs in memory. A failed render yields
+    (None, exception) so callers can report it and carry on with the rest; a
+    render still unfinished RENDER_TIMEOUT_SECONDS after it was submitted fails
+    with a TimeoutError, and the pool is replaced so the stuck worker is killed.
+    Renders lost when a pool breaks are resubmitted once to a fresh pool, then
+    rendered in-process.
+
+    Stage timings of every fresh render are added to the per-template histograms.
+    """
+    jobs = iter(jobs)
+    inflight: Deque[list] = deque()
+
+    def take(count: Optional[int]) -> List[list]:
+        taken = []
+        for resume, opts in islice(jobs, count):
+            key = PDFGenerator.render_key(resume, **opts)
+            # [resume, options, cache key, cached bytes, future, deadline, pool, resubmitted]
+            taken.append([resume, opts, key, render_cache.get(key), None, None, None, False])
+        return taken
+
+    def submit(entry: list) -> bool:
+        nonlocal pool
+        try:
+            entry[4] = pool.submit(_render_in_worker, entry[0], entry[1])
+        except BrokenProcessPool:
+            logger.warning("Render pool broke; falling back to in-process rendering", exc_info=True)
+            _discard_pool(pool)
+            pool = None
+            return False
+        # Deadlines run from submission, not from when the consumer gets round to waiting.
+        entry[5], entry[6] = time.monotonic() + AppConfig.RENDER_TIMEOUT_SECONDS, pool
+        return True
+
+    def start(entry: list) -> None:
+        if entry[3] is None and pool is not None:
+            submit(entry)
+        inflight.append(entry)
+
+    first = take(window)
+    # A single uncached render is cheaper in-process than shipped to a worker.
+    pool = _get_pool() if sum(1 for entry in first if entry[3] is None) > 1 else None
+    for entry in first:
+        start(entry)
+
+    try:
+        while inflight:
+            entry = inflight.popleft()
+            resume, opts, key, data, future, deadline, owner, _ = entry
+            if window:
+                for queued in take(1):
+                    start(queued)
+            result = None
+            if data is None and future is not None:
+                try:
+                    result = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeoutError as e:
+                    logger.error(
+                        "Rendering template '%s' exceeded %ss; restarting the render pool",
+                        opts.get("template_name"), AppConfig.RENDER_TIMEOUT_SECONDS,
+                    )
+                    _discard_pool(owner, terminate=True)
+                    pool = _get_pool()
+                    yield None, e
+                    continue
+                except BrokenProcessPool:
+                    _discard_pool(owner)
+                    if pool is owner:
+                        pool = _get_pool()
+                    if pool is not None and not entry[7]:
+                        entry[7] = True
+                        if submit(entry):
+                            inflight.appendleft(entry)
+                            continue
+                    logger.warning("Render pool broke; rendering template '%s' in-process", opts.get("template_name"))
+                except Exception as e:
+                    yield None, e
+                    continue
+            if data is None and result is None:
+                try:
+                    result = _render_in_worker(resume, opts)
+                except Exception as e:
+                    yield None, e
+                    continue
+            if result is not None:
+                data, stages = result
+                render_timings.observe(PDFGenerator._resolve_template_name(opts.get("template_name", "corporate")), stages)
+                render_cache.put(key, data)
+            yield data, None
+    finally:
+        for entry in inflight:
+            if entry[4] is not None:
+                entry[4].cancel()
+
+
+def iter_render(
+    resume: Resume, option_sets: List[dict]
+) -> Iterator[Tuple[Optional[bytes], Optional[BaseException]]]:
+    """
+    Render one resume with several option sets, yielding (pdf_bytes, error) in
+    input order; failures (including timeouts) are yielded, never raised, so a
+    streaming caller can note them and carry on.
+    """
+    return iter_render_jobs((resume, opts) for opts in option_sets)
@@ -6,9 +6,14 @@ import logging
 import os
 import base64
 import io
+import hashlib
+import threading
+import zipfile
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any
-from PIL import Image as PILImage
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+from PIL import Image as PILImage, ImageOps
+from config import AppConfig
 from models import (
     Resume,
     Experience,
@@ -31,9 +36,77 @@ def setup_logger(name):
         logger.addHandler(ch)
     return logger
 
-def resume_to_dict(resume: Resume) -> Dict[str, Any]:
-    """Convert Resume object to JSON-serializable dict."""
-    return {
+_photo_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_photo_cache_lock = threading.Lock()
+
+
+def _derive_profile_photo(raw_bytes: bytes, dpi: int, quality: int, force_jpeg: bool = False) -> bytes:
+    """Downscale and recompress an uploaded photo to the size it is printed at."""
+    target_px = int(round(AppConfig.PROFILE_PHOTO_INCHES * dpi))
+    try:
+        with PILImage.open(io.BytesIO(raw_bytes)) as img:
+            # Already print-sized JPEG/PNG (e.g. a derivative sent back by the client): keep as-is.
+            if max(img.size) <= target_px and (img.format == "JPEG" or (img.format == "PNG" and not force_jpeg)):
+                return raw_bytes
+            has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+            # Phone photos carry their rotation in EXIF; bake it in before resizing.
+            img = ImageOps.exif_transpose(img)
+            img = img.convert("RGBA" if has_alpha else "RGB")
+            if has_alpha and force_jpeg:
+                # JPEG has no alpha channel: flatten onto the white page background.
+                flat = PILImage.new("RGB", img.size, (255, 255, 255))
+                flat.paste(img, mask=img.split()[-1])
+                img, has_alpha = flat, False
+            img.thumbnail((target_px, target_px), PILImage.LANCZOS)
+            out = io.BytesIO()
+            if has_alpha:
+                img.save(out, format="PNG", optimize=True, dpi=(dpi, dpi))
+            else:
+                img.save(out, format="JPEG", quality=quality, optimize=True, dpi=(dpi, dpi))
+            return out.getvalue()
+    except Exception:
+        return raw_bytes
+
+
+def prepare_profile_photo(
+    raw_bytes: bytes,
+    dpi: Optional[int] = None,
+    quality: Optional[int] = None,
+    force_jpeg: bool = False,
+) -> bytes:
+    """
+    Return the print-ready derivative of a profile photo. Derivatives are cached
+    by content hash, so each distinct upload is decoded and re-encoded only once.
+    ``dpi``, ``quality`` and ``force_jpeg`` request a smaller variant (compact
+    output profile); they default to the standard derivative settings.
+    """
+    if not raw_bytes:
+        return raw_bytes
+    dpi = dpi or AppConfig.PROFILE_PHOTO_DPI
+    quality = quality or AppConfig.PROFILE_PHOTO_JPEG_QUALITY
+    variant = f"{dpi}:{quality}:{int(force_jpeg)}"
+    key = f"{hashlib.sha256(raw_bytes).hexdigest()}:{variant}"
+    with _photo_cache_lock:
+        cached = _photo_cache.get(key)
+        if cached is not None:
+            _photo_cache.move_to_end(key)
+            return cached
+    derived = _derive_profile_photo(raw_bytes, dpi, quality, force_jpeg)
+    with _photo_cache_lock:
+        _photo_cache[key] = derived
+        # A derivative maps to itself, so re-submitted derivatives are cache hits too.
+        _photo_cache[f"{hashlib.sha256(derived).hexdigest()}:{variant}"] = derived
+        while len(_photo_cache) > AppConfig.PHOTO_CACHE_MAX_ENTRIES:
+            _photo_cache.popitem(last=False)
+    return derived
+
+
+def resume_to_dict(resume: Resume, include_photo: bool = True) -> Dict[str, Any]:
+    """
+    Convert Resume object to JSON-serializable dict. With ``include_photo=False``
+    the ``profile_pic`` key is left out and a lazily stored photo is never loaded.
+    """
+    data = {
         "id": resume.id,
         "title": resume.title,
         "full_name": resume.full_name,
@@ -43,7 +116,6 @@ def resume_to_dict(resume: Resume) -> Dict[str, Any]:
         "city": resume.city,
         "address": resume.address,
         "summary": resume.summary,
-        "profile_pic": base64.b64encode(resume.profile_pic).decode("ascii") if resume.profile_pic else None,
         "linkedin": resume.linkedin,
         "github": resume.github,
         "twitter": resume.twitter,
@@ -61,6 +133,9 @@ def resume_to_dict(resume: Resume) -> Dict[str, Any]:
         "created": resume.created.isoformat() if resume.created else None,
         "updated": resume.updated.isoformat() if resume.updated else None
     }
+    if include_photo:
+        data["profile_pic"] = base64.b64encode(resume.profile_pic).decode("ascii") if resume.profile_pic else None
+    return data
 
 def dict_to_resume(data: Dict[str, Any]) -> Resume:
     """Rebuild Resume object from dict."""
@@ -78,18 +153,6 @@ def dict_to_resume(data: Dict[str, Any]) -> Resume:
             # Try urlsafe fallback
             return base64.urlsafe_b64decode(s)
 
-    def _normalize_profile_pic(raw_bytes: bytes) -> bytes:
-        try:
-            with PILImage.open(io.BytesIO(raw_bytes)) as img:
-                mode = img.mode or "RGB"
-                if mode not in ("RGB", "RGBA"):
-                    img = img.convert("RGB")
-                out = io.BytesIO()
-                img.save(out, format="PNG")
-                return out.getvalue()
-        except Exception:
-            return raw_bytes
-
     # Handle binary data
     profile_pic = None
     if data.get("profile_pic"):
@@ -100,7 +163,7 @@ def dict_to_resume(data: Dict[str, Any]) -> Resume:
                 pic_str = pic_str.split(",", 1)[1]
             try:
                 decoded = _safe_b64_decode(pic_str)
-                profile_pic = _normalize_profile_pic(decoded) if decoded else None
+                profile_pic = prepare_profile_photo(decoded) if decoded else None
             except Exception:
                 profile_pic = None
     # ... convert each section
@@ -133,3 +196,40 @@ def dict_to_resume(data: Dict[str, Any]) -> Resume:
         updated=datetime.fromisoformat(data["updated"]) if data.get("updated") else None
     )
     return resume
+
+
+class _ZipStreamSink:
+    """Write-only file object that hands zipfile output to a streaming generator."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip_stream(entries: Iterable[Tuple[str, Union[bytes, str], int]]) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive chunk by chunk from (name, data, compress_type) entries.
+    Each entry is sent as soon as it is written, so only one entry is held in memory.
+    """
+    sink = _ZipStreamSink()
+    # The sink is not seekable, so zipfile writes data descriptors after each entry.
+    with zipfile.ZipFile(sink, "w") as zf:
+        for name, data, compress_type in entries:
+            zf.writestr(name, data, compress_type=compress_type)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    tail = sink.drain()
+    if tail:
+        yield tail